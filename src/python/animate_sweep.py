@@ -0,0 +1,427 @@
+"""
+Parameter-Sweep Animations of Figure 12's Mass-Diameter Relationship
+
+Animates the lower panel of figure12.py (required rope diameter against
+moai mass, grip zones and the documented specimens) while one rope-model
+parameter sweeps, for talks:
+
+    python3 animate_sweep.py tensile_strength 400 1000
+    python3 animate_sweep.py safety_factor 10 3 --format gif --size 1280x720
+
+The figure and its artists are created once per worker process. A frame
+only moves the parameter-dependent artists (the curves at the safety factor
+and at half of it, the specimen markers, the 50 mm handling-limit marker
+and the parameter readout), which are animated: the static rest of the
+figure is drawn once and each frame is the cached background with those
+artists drawn over it. No pyplot figure is built per frame.
+
+Frames are rendered and encoded in parallel. The sweep is split into
+segments of SEGMENT_FRAMES frames, each rendered by a worker of a spawned
+process pool, which also encodes it: an H.264 segment (ffmpeg, from
+rcParams['animation.ffmpeg_path']) for MP4, single-frame GIFs or PNGs for
+GIF and APNG. The main process only joins the encoded segments in order
+(ffmpeg's concat demuxer without re-encoding, or the GIF blocks and PNG
+image data restitched into one GIF or APNG), so its cost does not grow with
+the frame size. Output goes to a temporary file renamed over the target.
+
+Usage:
+    python3 animate_sweep.py PARAMETER START STOP [-o OUTPUT] [--format mp4|gif|apng]
+                             [--frames 300] [--fps 30] [--size 1920x1080] [--jobs N]
+    python3 animate_sweep.py --benchmark   # per-frame cost: rebuilt vs reused artists
+"""
+
+import argparse
+import concurrent.futures
+import math
+import multiprocessing
+import os
+import shutil
+import struct
+import subprocess
+import sys
+import tempfile
+import time
+import zlib
+
+import numpy as np
+
+import figure_style as fs
+import rope_mechanics as rm
+from explore_parameters import (HANDLING_LIMIT, MASS_RANGE, PARAMETERS, PAPER_MODEL,
+                                SPECIMEN_MASSES)
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+ANIMATION_DIR = os.path.join(SCRIPT_DIR, fs.OUTPUT_DIR, 'animations')
+
+FORMATS = ('mp4', 'gif', 'apng')
+EXTENSIONS = {'.mp4': 'mp4', '.gif': 'gif', '.png': 'apng', '.apng': 'apng'}
+
+FRAMES = 300
+FPS = 30
+SIZE = (1920, 1080)  # pixels
+ANIMATION_DPI = 150  # sets the text size relative to the frame
+SEGMENT_FRAMES = 30  # frames per worker task
+MP4_QUALITY = 18  # x264 constant rate factor (lower is better)
+
+# Figure 12's specimens: (label, color, marker)
+SPECIMENS = [('Experimental Replica', 'green', 'o'), ('Ahu Akivi (typical)', 'blue', 's'),
+             ('Paro', 'orange', '^'), ('Ahu Tongariki (largest)', 'orange', '^'),
+             ('Te Tokanga (quarry)', 'red', 'X')]
+
+
+# ============================================================================
+# SCENE
+# ============================================================================
+
+class SweepScene:
+    """Figure 12's lower panel, built once; `frame(value)` renders the
+    parameter at `value` by moving its animated artists"""
+
+    def __init__(self, parameter, size=SIZE, dpi=ANIMATION_DPI):
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+
+        fs.apply_style()
+        self.parameter = parameter
+        self.label, self.fmt = {name: (label, fmt) for name, label, _, _, _, fmt
+                                in PARAMETERS}[parameter]
+        self.fig = Figure(figsize=(size[0] / dpi, size[1] / dpi), dpi=dpi)
+        self.canvas = FigureCanvasAgg(self.fig)
+        ax = self.ax = self.fig.add_subplot()
+
+        # Static: grip zones, thresholds, the paper model and the transport limit
+        ax.fill_between([0, 300], 0, 40, alpha=0.1, color='green')
+        ax.fill_between([0, 300], 40, 50, alpha=0.1, color='orange')
+        ax.fill_between([0, 300], 50, 150, alpha=0.15, color='red')
+        ax.axhline(40, color='orange', linestyle='--', linewidth=2, alpha=0.7,
+                   label='Difficult to grip (40 mm)')
+        ax.axhline(50, color='red', linestyle='-', linewidth=2.5, alpha=0.8,
+                   label='Maximum grip limit (50 mm)')
+        ax.axhline(70, color='darkred', linestyle=':', linewidth=2, alpha=0.6,
+                   label='Physically impossible (70 mm)')
+        ax.axvline(90, color='purple', linestyle='-.', linewidth=2, alpha=0.5,
+                   label='Observed transport limit (~90 tons)')
+        ax.plot(MASS_RANGE, rm.diameter_from_mass(MASS_RANGE, **PAPER_MODEL),
+                color='gray', linewidth=1.5, alpha=0.6,
+                label=f'Paper model (SF={PAPER_MODEL["safety_factor"]:g})')
+
+        # Animated: everything the parameter moves
+        self.curve, = ax.plot(MASS_RANGE, MASS_RANGE, 'b-', linewidth=2.5, alpha=0.8,
+                              label='Required diameter', animated=True)
+        self.half_curve, = ax.plot(MASS_RANGE, MASS_RANGE, 'b--', linewidth=2, alpha=0.6,
+                                   label='At half the safety factor', animated=True)
+        self.points = [ax.plot(mass, 0, marker=marker, markersize=12 if mass < 100 else 15,
+                               color=color, markeredgecolor='black', markeredgewidth=1.5,
+                               linestyle='none', label=label, zorder=5, animated=True)[0]
+                       for mass, (label, color, marker) in zip(SPECIMEN_MASSES, SPECIMENS)]
+        self.limit_line = ax.axvline(0, color='blue', linestyle=':', linewidth=1.5,
+                                     animated=True)
+        self.readout = ax.text(0.98, 0.04, '', transform=ax.transAxes, ha='right',
+                               va='bottom', fontsize=14, fontweight='bold', animated=True,
+                               bbox=dict(boxstyle='round', facecolor='white', alpha=0.8))
+        self.animated = [self.curve, self.half_curve, *self.points, self.limit_line,
+                         self.readout]
+
+        ax.set_xlabel('Moai Mass (metric tons)', fontweight='bold')
+        ax.set_ylabel('Required Rope Diameter (mm)', fontweight='bold')
+        ax.set_title('Physical Limits of Rope Technology for Moai Transport',
+                     fontsize=13, fontweight='bold')
+        # Fixed limits keep the background valid; larger diameters are clipped
+        ax.set_xlim(0, 300)
+        ax.set_ylim(0, 150)
+        ax.legend(loc='upper left', fontsize=8, ncol=2)
+        ax.grid(True, alpha=0.3)
+        self.fig.tight_layout()
+
+        self.canvas.draw()
+        self.background = self.canvas.copy_from_bbox(self.fig.bbox)
+
+    def update(self, value):
+        """Move the animated artists to the parameter at `value`"""
+        model = dict(PAPER_MODEL, **{self.parameter: value})
+        safety_factor = model.pop('safety_factor')
+
+        def diameter(masses, factor=safety_factor):
+            return rm.diameter_from_mass(masses, safety_factor=factor, **model)
+
+        self.curve.set_ydata(diameter(MASS_RANGE))
+        self.half_curve.set_ydata(diameter(MASS_RANGE, safety_factor / 2))
+        for point, specimen in zip(self.points, diameter(SPECIMEN_MASSES)):
+            point.set_ydata([specimen])
+        limit = rm.mass_from_diameter(HANDLING_LIMIT, safety_factor=safety_factor, **model)
+        self.limit_line.set_xdata([limit, limit])
+        self.readout.set_text(f"{self.label}: {self.fmt % value}\n"
+                              f"{HANDLING_LIMIT} mm rope moves up to {limit:.0f} t")
+
+    def frame(self, value):
+        """RGB pixels (height, width, 3) of the frame at `value`"""
+        self.update(value)
+        self.canvas.restore_region(self.background)
+        for artist in self.animated:
+            self.fig.draw_artist(artist)
+        return np.asarray(self.canvas.buffer_rgba())[..., :3].copy()
+
+
+# ============================================================================
+# WORKERS
+# ============================================================================
+
+_SCENE = None
+
+
+def _start_worker(parameter, size):
+    """Build the worker's scene once; every segment it renders reuses it"""
+    global _SCENE
+    import matplotlib
+    matplotlib.use('Agg')
+    _SCENE = SweepScene(parameter, size)
+
+
+def ffmpeg_path():
+    import matplotlib
+    return shutil.which(matplotlib.rcParams['animation.ffmpeg_path'])
+
+
+def _encode_mp4(frames, path, fps, threads):
+    """Pipe `frames` into ffmpeg as one H.264 segment"""
+    height, width, _ = frames[0].shape
+    command = [ffmpeg_path(), '-loglevel', 'error', '-y',
+               '-f', 'rawvideo', '-pix_fmt', 'rgb24', '-s', f'{width}x{height}',
+               '-r', str(fps), '-i', '-',
+               '-c:v', 'libx264', '-crf', str(MP4_QUALITY), '-pix_fmt', 'yuv420p',
+               '-threads', str(threads), path]
+    process = subprocess.Popen(command, stdin=subprocess.PIPE)
+    for frame in frames:
+        process.stdin.write(frame.tobytes())
+    process.stdin.close()
+    if process.wait():
+        raise RuntimeError(f"ffmpeg failed on {os.path.basename(path)}")
+    return path
+
+
+def _encode_image(frame, fmt):
+    """One frame as GIF (palette from the frame) or PNG bytes"""
+    import io
+    from PIL import Image
+    image = Image.fromarray(frame)
+    buffer = io.BytesIO()
+    if fmt == 'gif':
+        image.quantize(256, method=Image.Quantize.FASTOCTREE).save(buffer, format='GIF')
+    else:
+        image.save(buffer, format='PNG', compress_level=6)
+    return buffer.getvalue()
+
+
+def _render_segment(index, values, fmt, fps, scratch, threads):
+    """Render the frames at `values` and encode them: a segment file path
+    (MP4) or a list of per-frame GIF/PNG bytes"""
+    frames = [_SCENE.frame(value) for value in values]
+    if fmt == 'mp4':
+        return _encode_mp4(frames, os.path.join(scratch, f'segment{index:04d}.mp4'),
+                           fps, threads)
+    return [_encode_image(frame, fmt) for frame in frames]
+
+
+# ============================================================================
+# JOINING SEGMENTS
+# ============================================================================
+
+def _join_mp4(segments, output):
+    """Concatenate H.264 segments without re-encoding"""
+    listing = os.path.join(os.path.dirname(segments[0]), 'segments.txt')
+    with open(listing, 'w', encoding='utf-8') as f:
+        f.writelines(f"file '{path}'\n" for path in segments)
+    subprocess.run([ffmpeg_path(), '-loglevel', 'error', '-y', '-f', 'concat',
+                    '-safe', '0', '-i', listing, '-c', 'copy',
+                    '-movflags', '+faststart', '-f', 'mp4', output], check=True)
+
+
+def _gif_blocks(data):
+    """(color table, image descriptor, image data) of a single-frame GIF"""
+    flags, position, table = data[10], 13, b''
+    if flags & 0x80:
+        size = 3 << ((flags & 7) + 1)
+        table, position = data[13:13 + size], 13 + size
+    while data[position] == 0x21:  # extension blocks
+        position += 2
+        while data[position]:
+            position += data[position] + 1
+        position += 1
+    descriptor = data[position:position + 10]
+    position += 10
+    if descriptor[9] & 0x80:
+        size = 3 << ((descriptor[9] & 7) + 1)
+        table, position = data[position:position + size], position + size
+    return table, descriptor, data[position:data.rindex(b';')]
+
+
+def _write_gif(f, frames, fps):
+    """Stitch single-frame GIFs into a looping animation, each frame keeping
+    its own palette as a local color table"""
+    delays = np.diff(np.round(np.arange(len(frames) + 1) * 100 / fps)).astype(int)
+    # GIF89a: Pillow writes GIF87a for a plain frame, but the loop and
+    # frame-delay extensions below are GIF89a blocks
+    f.write(b'GIF89a' + frames[0][6:10] + b'\x00\x00\x00')  # screen size, no global table
+    f.write(b'\x21\xff\x0bNETSCAPE2.0\x03\x01\x00\x00\x00')  # loop forever
+    for data, delay in zip(frames, delays):
+        table, descriptor, image = _gif_blocks(data)
+        f.write(b'\x21\xf9\x04\x00' + struct.pack('<H', delay) + b'\x00\x00')
+        bits = int(math.log2(len(table) // 3)) - 1
+        f.write(descriptor[:9] + bytes([(descriptor[9] & 0x40) | 0x80 | bits]))
+        f.write(table + image)
+    f.write(b';')
+
+
+def _png_chunks(data):
+    """(type, payload) of every chunk of a PNG"""
+    position = 8
+    while position < len(data):
+        length, kind = struct.unpack('>I4s', data[position:position + 8])
+        yield kind, data[position + 8:position + 8 + length]
+        position += 12 + length
+
+
+def _chunk(kind, payload):
+    return (struct.pack('>I', len(payload)) + kind + payload
+            + struct.pack('>I', zlib.crc32(kind + payload)))
+
+
+def _write_apng(f, frames, fps):
+    """Stitch PNGs into a looping APNG: each frame's compressed image data
+    becomes its IDAT (first frame) or fdAT chunks, unrecompressed"""
+    header = dict(_png_chunks(frames[0]))[b'IHDR']
+    width, height = struct.unpack('>II', header[:8])
+    f.write(frames[0][:8] + _chunk(b'IHDR', header))
+    f.write(_chunk(b'acTL', struct.pack('>II', len(frames), 0)))
+    sequence = 0
+    for index, data in enumerate(frames):
+        f.write(_chunk(b'fcTL', struct.pack('>IIIIIHHBB', sequence, width, height,
+                                            0, 0, 1, fps, 0, 0)))
+        sequence += 1
+        for kind, payload in _png_chunks(data):
+            if kind != b'IDAT':
+                continue
+            if index == 0:
+                f.write(_chunk(b'IDAT', payload))
+            else:
+                f.write(_chunk(b'fdAT', struct.pack('>I', sequence) + payload))
+                sequence += 1
+    f.write(_chunk(b'IEND', b''))
+
+
+# ============================================================================
+# ANIMATION
+# ============================================================================
+
+def default_output(parameter, start, stop, fmt):
+    extension = 'png' if fmt == 'apng' else fmt
+    return os.path.join(ANIMATION_DIR, f'figure12_{parameter}_{start:g}_{stop:g}.{extension}')
+
+
+def animate(parameter, start, stop, output, fmt='mp4', frames=FRAMES, fps=FPS,
+            size=SIZE, jobs=None):
+    """Render the sweep of `parameter` from `start` to `stop` to `output`;
+    return the elapsed wall time (s)"""
+    begin = time.perf_counter()
+    values = np.linspace(start, stop, frames)
+    segments = [values[i:i + SEGMENT_FRAMES] for i in range(0, frames, SEGMENT_FRAMES)]
+    jobs = jobs or max(1, min(len(segments), os.cpu_count() or 1))
+    threads = max(1, (os.cpu_count() or 1) // jobs)  # ffmpeg threads per worker
+    directory = os.path.dirname(os.path.abspath(output))
+    os.makedirs(directory, exist_ok=True)
+    temporary = output + '.tmp'
+
+    # Spawned workers start with a clean matplotlib state
+    context = multiprocessing.get_context('spawn')
+    with tempfile.TemporaryDirectory(dir=directory) as scratch, \
+            concurrent.futures.ProcessPoolExecutor(
+                max_workers=jobs, mp_context=context, initializer=_start_worker,
+                initargs=(parameter, size)) as pool:
+        futures = [pool.submit(_render_segment, index, segment, fmt, fps, scratch, threads)
+                   for index, segment in enumerate(segments)]
+        encoded = [future.result() for future in futures]
+        try:
+            if fmt == 'mp4':
+                _join_mp4(encoded, temporary)
+            else:
+                with open(temporary, 'wb') as f:
+                    images = [data for segment in encoded for data in segment]
+                    (_write_gif if fmt == 'gif' else _write_apng)(f, images, fps)
+            os.replace(temporary, output)
+        finally:
+            if os.path.exists(temporary):
+                os.remove(temporary)
+    return time.perf_counter() - begin
+
+
+def benchmark(parameter='tensile_strength', frames=10, size=SIZE):
+    """Seconds per frame: a figure rebuilt per frame vs the reused scene"""
+    import matplotlib
+    matplotlib.use('Agg')
+    values = np.linspace(400, 1000, frames)
+
+    start = time.perf_counter()
+    for value in values:
+        SweepScene(parameter, size).frame(value)
+    rebuilt = (time.perf_counter() - start) / frames
+
+    scene = SweepScene(parameter, size)
+    start = time.perf_counter()
+    for value in values:
+        scene.frame(value)
+    reused = (time.perf_counter() - start) / frames
+
+    print(f"{size[0]}x{size[1]} frames of a {parameter} sweep:")
+    for name, seconds in (('rebuilt figure', rebuilt), ('reused artists', reused)):
+        print(f"  {name:<16} {1000 * seconds:7.1f} ms/frame "
+              f"({FRAMES} frames: {FRAMES * seconds:5.1f} s on one core)")
+
+
+def _size(text):
+    width, _, height = text.lower().partition('x')
+    return int(width), int(height)
+
+
+def main(argv=None):
+    names = [name for name, *_ in PARAMETERS]
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('parameter', nargs='?', choices=names,
+                        help='rope-model parameter to sweep')
+    parser.add_argument('start', nargs='?', type=float, help='first frame value')
+    parser.add_argument('stop', nargs='?', type=float, help='last frame value')
+    parser.add_argument('-o', '--output',
+                        help='output file (default: figures/animations/...)')
+    parser.add_argument('--format', choices=FORMATS,
+                        help='default: from the output extension, else mp4')
+    parser.add_argument('--frames', type=int, default=FRAMES)
+    parser.add_argument('--fps', type=int, default=FPS)
+    parser.add_argument('--size', type=_size, default=SIZE, help='WIDTHxHEIGHT pixels')
+    parser.add_argument('--jobs', type=int, help='worker processes (default: CPUs)')
+    parser.add_argument('--benchmark', action='store_true',
+                        help='time rebuilt vs reused frames instead of animating')
+    args = parser.parse_args(argv)
+
+    if args.benchmark:
+        benchmark(args.parameter or 'tensile_strength', size=args.size)
+        return 0
+    if args.stop is None:
+        parser.error('PARAMETER, START and STOP are required')
+    fmt = args.format or EXTENSIONS.get(os.path.splitext(args.output or '')[1], 'mp4')
+    output = args.output or default_output(args.parameter, args.start, args.stop, fmt)
+    if fmt == 'mp4':
+        if ffmpeg_path() is None:
+            raise SystemExit("animate_sweep: MP4 needs ffmpeg (on PATH or "
+                             "rcParams['animation.ffmpeg_path']); use --format gif or apng")
+        if args.size[0] % 2 or args.size[1] % 2:
+            raise SystemExit("animate_sweep: MP4 frame sizes must be even")
+
+    elapsed = animate(args.parameter, args.start, args.stop, output, fmt, args.frames,
+                      args.fps, args.size, args.jobs)
+    print(f"{args.frames} frames ({args.size[0]}x{args.size[1]}, {fmt}) written to "
+          f"{os.path.relpath(output)} in {elapsed:.1f} s "
+          f"({os.path.getsize(output) / 1e6:.1f} MB)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,382 @@
+"""
+Benchmark Figure Rendering
+
+Times every figure script (figure9.py ... figure14.py) stage by stage over
+repeated runs, so a slow figure can be traced to its cause and a change that
+slows the build down is noticed:
+
+    data    figure_data.figureN() (model evaluation, Monte Carlo envelopes)
+    plot    everything else in the script (creating axes and artists)
+    layout  tight_layout() and the tight bounding box of save_figure()
+    render  the Agg draw that save_figure() crops the raster outputs from
+    png     PNG encoding (runs in a thread, concurrently with the PDF)
+    pdf     PDF writing
+    derivatives  web-resolution and thumbnail encodes (threads as well)
+
+plus `total` (the whole script) and the peak resident memory of the run.
+Each run is a fresh spawned process that writes into a temporary directory,
+so runs do not share caches or memory and figures/ is left untouched. The
+production model is evaluated once beforehand (it is cached on disk), as in
+build_figures.py.
+
+Usage:
+    python3 benchmark_figures.py                    # all figures, 3 runs each
+    python3 benchmark_figures.py figure12 -n 5
+    python3 benchmark_figures.py --draft            # 100 dpi PNG previews
+    python3 benchmark_figures.py --save-baseline    # record the reference
+
+Results are written as JSON (default .benchmarks/latest.json) and compared
+against a baseline (default .benchmarks/baseline.json, if present): a stage
+regresses when its median exceeds the baseline median by more than
+--threshold (default 20%) and by more than --min-delta (default 10 ms, to
+ignore noise in stages that take almost no time); peak memory is compared
+with the same relative threshold. The script exits non-zero on a
+regression. Baselines are only comparable on the same machine and mode.
+"""
+
+import argparse
+import concurrent.futures
+import contextlib
+import datetime
+import functools
+import importlib
+import io
+import json
+import multiprocessing
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import threading
+import time
+
+from build_figures import SCRIPT_DIR, resolve_scripts
+
+STAGES = ('data', 'plot', 'layout', 'render', 'png', 'pdf', 'derivatives', 'total')
+
+BENCHMARK_DIR = os.path.join(SCRIPT_DIR, '.benchmarks')
+DEFAULT_OUTPUT = os.path.join(BENCHMARK_DIR, 'latest.json')
+DEFAULT_BASELINE = os.path.join(BENCHMARK_DIR, 'baseline.json')
+
+DEFAULT_REPEAT = 3
+DEFAULT_THRESHOLD = 0.2  # relative slowdown that counts as a regression
+DEFAULT_MIN_DELTA = 0.010  # s; smaller absolute slowdowns are noise
+
+
+# ============================================================================
+# STAGE TIMING
+# ============================================================================
+
+class StageTimer:
+    """Accumulates wall time per stage.
+
+    Nested timed calls (tight_layout measuring bounding boxes, say) count
+    towards the outermost stage only. Nesting is tracked per thread, so the
+    PNG encodes that save_figure runs in its thread pool are timed on their
+    own while the PDF is written. `accounted` is the main-thread wall time
+    covered by stages and save_figure calls; the rest of a script is `plot`.
+    """
+
+    def __init__(self):
+        self.seconds = dict.fromkeys(STAGES, 0.0)
+        self.accounted = 0.0
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def _depth(self):
+        return getattr(self._local, 'depth', 0)
+
+    def wrap(self, stage, function):
+        """`function` with its calls timed as `stage` (a name, or a callable
+        mapping the call arguments to a name)"""
+        @functools.wraps(function)
+        def timed(*args, **kwargs):
+            if self._depth():
+                return function(*args, **kwargs)
+            name = stage(*args, **kwargs) if callable(stage) else stage
+            self._local.depth = 1
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                self._local.depth = 0
+                with self._lock:
+                    self.seconds[name] = self.seconds.get(name, 0.0) + elapsed
+                    if threading.current_thread() is threading.main_thread() \
+                            and not getattr(self._local, 'exporting', False):
+                        self.accounted += elapsed
+        return timed
+
+    def wrap_export(self, function):
+        """save_figure with its wall time accounted once: its stages overlap
+        (PNG encodes run while the PDF is written)"""
+        @functools.wraps(function)
+        def timed(*args, **kwargs):
+            self._local.exporting = True
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                self._local.exporting = False
+                self.accounted += time.perf_counter() - start
+        return timed
+
+
+def _savefig_stage(fig, fname, *args, **kwargs):
+    """Stage of a savefig call: the output format (png, pdf, ...)"""
+    fmt = kwargs.get('format') or os.path.splitext(str(fname))[1][1:]
+    return fmt.lower() or 'png'
+
+
+def instrument(timer):
+    """Route the stages of every figure script through `timer`"""
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    import figure_data
+    import figure_export
+
+    for name, function in figure_data.figure_functions.items():
+        wrapped = timer.wrap('data', function)
+        figure_data.figure_functions[name] = wrapped
+        setattr(figure_data, function.__name__, wrapped)
+    Figure.tight_layout = timer.wrap('layout', Figure.tight_layout)
+    Figure.get_tightbbox = timer.wrap('layout', Figure.get_tightbbox)
+    FigureCanvasAgg.draw = timer.wrap('render', FigureCanvasAgg.draw)
+    Figure.savefig = timer.wrap(_savefig_stage, Figure.savefig)
+    figure_export._write_raster = timer.wrap(
+        lambda pixels, path, fmt, dpi: fmt, figure_export._write_raster)
+    figure_export._write_derivative = timer.wrap('derivatives',
+                                                 figure_export._write_derivative)
+    # Figure scripts run `from figure_export import save_figure` after this
+    figure_export.save_figure = timer.wrap_export(figure_export.save_figure)
+
+
+def peak_rss_mb():
+    """Peak resident memory of this process (MB)"""
+    import resource
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return peak / (1 << 20 if sys.platform == 'darwin' else 1 << 10)
+
+
+def time_figure(script):
+    """Run one figure script with stage timing (in a fresh process);
+    return (script, {stage: seconds}, peak RSS in MB, error)"""
+    os.environ['MPLBACKEND'] = 'Agg'
+    if SCRIPT_DIR not in sys.path:
+        sys.path.insert(0, SCRIPT_DIR)
+
+    import runpy
+    import traceback
+    import warnings
+
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+
+    timer = StageTimer()
+    instrument(timer)
+    error = None
+    with tempfile.TemporaryDirectory() as directory:
+        # Outputs go to <tmp>/figures/; figure inputs use absolute paths
+        os.chdir(directory)
+        start = time.perf_counter()
+        try:
+            with contextlib.redirect_stdout(io.StringIO()), \
+                    warnings.catch_warnings():
+                # Layout warnings are the build's business, not the benchmark's
+                warnings.simplefilter('ignore')
+                runpy.run_path(os.path.join(SCRIPT_DIR, script), run_name='__main__')
+        except BaseException:
+            error = traceback.format_exc()
+        finally:
+            plt.close('all')
+        timer.seconds['total'] = time.perf_counter() - start
+        os.chdir(SCRIPT_DIR)
+    seconds = timer.seconds
+    seconds['plot'] = max(0.0, seconds['total'] - timer.accounted)
+    return script, seconds, peak_rss_mb(), error
+
+
+# ============================================================================
+# BENCHMARK
+# ============================================================================
+
+def summarize(samples):
+    """Median, minimum and all samples of one measurement"""
+    return {'median': statistics.median(samples), 'min': min(samples),
+            'samples': samples}
+
+
+def environment():
+    """What the timings depend on, recorded with the results"""
+    import matplotlib
+    import numpy
+    import PIL
+    import figure_style
+    return {'date': datetime.datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(), 'machine': platform.machine(),
+            'cpus': os.cpu_count(), 'numpy': numpy.__version__,
+            'matplotlib': matplotlib.__version__, 'pillow': PIL.__version__,
+            'draft': figure_style.is_draft(), 'dpi': figure_style.figure_dpi(),
+            'formats': list(figure_style.output_formats())}
+
+
+def run_benchmark(scripts, repeat=DEFAULT_REPEAT):
+    """Time `scripts` `repeat` times each, one fresh process per run"""
+    # Evaluate the shared production model once (cached on disk), so the
+    # first run of a figure does not pay for computing it
+    importlib.import_module('production_model').production_model()
+    context = multiprocessing.get_context('spawn')
+    results = {'environment': environment(), 'repeat': repeat, 'figures': {}}
+
+    print("=" * 70)
+    print(f"BENCHMARKING {len(scripts)} FIGURES ({repeat} runs each, "
+          f"{results['environment']['dpi']} dpi)")
+    print("=" * 70)
+    print(f"{'Figure':<10}" + "".join(f"{stage[:6]:>7}" for stage in STAGES)
+          + f"{'RSS MB':>8}")
+    print("-" * 70)
+    failures = 0
+    # Runs are sequential so they do not compete for CPU or memory bandwidth
+    with concurrent.futures.ProcessPoolExecutor(max_workers=1, mp_context=context,
+                                                max_tasks_per_child=1) as pool:
+        for script in scripts:
+            runs = []
+            for _ in range(repeat):
+                _, seconds, rss, error = pool.submit(time_figure, script).result()
+                if error is not None:
+                    break
+                runs.append((seconds, rss))
+            if error is not None:
+                failures += 1
+                print(f"{script[:-3]:<10}FAILED\n{error}")
+                continue
+            stages = {stage: summarize([seconds.get(stage, 0.0)
+                                        for seconds, _ in runs]) for stage in STAGES}
+            figure = {'stages': stages,
+                      'peak_rss_mb': summarize([rss for _, rss in runs])}
+            results['figures'][script[:-3]] = figure
+            print(f"{script[:-3]:<10}" + "".join(
+                f"{stages[stage]['median']:>7.3f}" for stage in STAGES)
+                + f"{figure['peak_rss_mb']['median']:>8.0f}")
+    print("-" * 70)
+    print("Median seconds per stage; png and deriv(atives) run concurrently "
+          "with pdf")
+    return results, failures
+
+
+# ============================================================================
+# BASELINE COMPARISON
+# ============================================================================
+
+def compare(results, baseline, threshold=DEFAULT_THRESHOLD,
+            min_delta=DEFAULT_MIN_DELTA):
+    """Regressions of `results` against `baseline`: a list of
+    (figure, measurement, baseline value, new value, relative change)"""
+    regressions = []
+    for name, figure in results['figures'].items():
+        reference = baseline.get('figures', {}).get(name)
+        if reference is None:
+            continue
+        measurements = [(stage, figure['stages'][stage]['median'],
+                         reference['stages'].get(stage, {}).get('median'), min_delta)
+                        for stage in STAGES]
+        measurements.append(('peak_rss_mb', figure['peak_rss_mb']['median'],
+                             reference['peak_rss_mb']['median'], 0.0))
+        for measurement, new, old, floor in measurements:
+            if old is None:
+                continue
+            if new > old * (1 + threshold) and new - old > floor:
+                change = new / old - 1 if old else float('inf')
+                regressions.append((name, measurement, old, new, change))
+    return regressions
+
+
+def print_comparison(results, baseline, regressions, threshold):
+    """Total time per figure against the baseline, then any regressions"""
+    print("=" * 70)
+    print(f"COMPARISON WITH BASELINE ({baseline['environment']['date']}, "
+          f"threshold {threshold:.0%})")
+    print("=" * 70)
+    if baseline['environment'].get('dpi') != results['environment']['dpi']:
+        print("Warning: baseline was recorded at "
+              f"{baseline['environment'].get('dpi')} dpi")
+    for name, figure in results['figures'].items():
+        reference = baseline.get('figures', {}).get(name)
+        if reference is None:
+            print(f"  {name:<12} not in baseline")
+            continue
+        old = reference['stages']['total']['median']
+        new = figure['stages']['total']['median']
+        print(f"  {name:<12} {old:>8.3f} s -> {new:>8.3f} s  ({new / old - 1:+.0%})")
+    print("-" * 70)
+    if not regressions:
+        print("No regressions")
+    for name, measurement, old, new, change in regressions:
+        unit = ' MB' if measurement == 'peak_rss_mb' else ' s'
+        print(f"  REGRESSION {name} {measurement}: {old:.3f}{unit} -> "
+              f"{new:.3f}{unit} ({change:+.0%})")
+    print("=" * 70)
+
+
+def write_json(results, path):
+    """Write results atomically"""
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path + '.tmp', 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2)
+        f.write('\n')
+    os.replace(path + '.tmp', path)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('figures', nargs='*',
+                        help='figures to benchmark (default: all)')
+    parser.add_argument('-n', '--repeat', type=int, default=DEFAULT_REPEAT,
+                        help='runs per figure (default: %(default)s)')
+    parser.add_argument('--draft', action='store_true',
+                        help='benchmark the 100 dpi PNG previews')
+    parser.add_argument('-o', '--output', default=DEFAULT_OUTPUT,
+                        help='results JSON (default: .benchmarks/latest.json)')
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE,
+                        help='baseline JSON to compare against '
+                             '(default: .benchmarks/baseline.json)')
+    parser.add_argument('--save-baseline', action='store_true',
+                        help='also store the results as the baseline')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='relative slowdown reported as a regression '
+                             '(default: %(default)s)')
+    parser.add_argument('--min-delta', type=float, default=DEFAULT_MIN_DELTA,
+                        help='smallest slowdown in seconds reported as a '
+                             'regression (default: %(default)s)')
+    args = parser.parse_args(argv)
+    if args.repeat < 1:
+        parser.error('--repeat must be at least 1')
+
+    if args.draft:
+        # Inherited by the spawned workers
+        os.environ['ROPE_DRAFT'] = '1'
+
+    results, failures = run_benchmark(resolve_scripts(args.figures), args.repeat)
+    write_json(results, args.output)
+    print(f"Results written to {args.output}")
+
+    regressions = []
+    if args.save_baseline:
+        write_json(results, args.baseline)
+        print(f"Baseline written to {args.baseline}")
+    elif os.path.exists(args.baseline):
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold, args.min_delta)
+        print_comparison(results, baseline, regressions, args.threshold)
+    return 1 if failures or regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,404 @@
+"""
+Build All Paper Figures
+
+Runs every figure script (figure9.py ... figure14.py) headless on the Agg
+backend in a process pool, so regenerating the full set takes about as long as
+the slowest figure instead of the sum of all six.
+
+Usage:
+    python3 build_figures.py                  # build all figures
+    python3 build_figures.py figure12 figure13
+    python3 build_figures.py -j 2 --verbose   # two workers, show script output
+    python3 build_figures.py --draft          # 100 dpi PNG previews only
+    python3 build_figures.py --compact        # smaller publication PDFs
+    python3 build_figures.py --tiff           # add TIFFs for the publisher
+
+Reports the wall time of each figure and exits non-zero if any script fails.
+
+Builds are incremental: each figure is keyed by a content hash of its script,
+the local modules it imports, their resolved model parameters (upper-case
+module globals, which must be plain JSON-serializable values), and the
+matplotlib version and rcParams. A figure is skipped when its key and the
+hashes of its figures/figureN_* outputs (PNG, PDF, web copies, thumbnail,
+TIFF) match the build manifest (figures/build_manifest.json). Use --force to
+re-render everything.
+
+--draft renders screen-resolution PNG previews into figures/preview/ (with
+their own manifest) for fast layout iteration; see figure_style.py.
+
+--compact writes smaller, faster-opening publication PDFs (simplified paths,
+TrueType font subsets; see figure_export.py).
+
+Every build also rewrites figures/key_values.json, the numbers the captions
+and manuscript sections quote (see key_values.py); render_docs.py fills the
+Markdown templates from it.
+
+--trace [FILE] records a Chrome/Perfetto trace of the build (default
+.traces/build.json): the build's own key and model spans plus, for every
+rendered figure, its imports, model evaluation, per-axes drawing, layout
+and saving (see figure_trace.py). Combine with --force to trace every figure.
+"""
+
+import argparse
+import concurrent.futures
+import contextlib
+import glob
+import hashlib
+import importlib
+import io
+import json
+import multiprocessing
+import os
+import re
+import sys
+import time
+import traceback
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+FIGURE_SCRIPTS = ['figure9.py', 'figure10.py', 'figure11.py',
+                  'figure12.py', 'figure13.py', 'figure14.py']
+
+MANIFEST_NAME = 'build_manifest.json'
+
+IMPORT_PATTERN = re.compile(r'^\s*(?:from|import)\s+(\w+)', re.MULTILINE)
+
+
+# ============================================================================
+# CONTENT HASHING
+# ============================================================================
+
+def file_hash(path):
+    """SHA-256 of a file's bytes"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def local_dependencies(script):
+    """Local modules imported by `script`, directly or indirectly (sorted)"""
+    found = set()
+    pending = [script]
+    while pending:
+        with open(os.path.join(SCRIPT_DIR, pending.pop()), encoding='utf-8') as f:
+            source = f.read()
+        for name in IMPORT_PATTERN.findall(source):
+            module_file = name + '.py'
+            if module_file not in found and \
+                    os.path.exists(os.path.join(SCRIPT_DIR, module_file)):
+                found.add(module_file)
+                pending.append(module_file)
+    return sorted(found)
+
+
+def _plain(value):
+    """JSON form of the NumPy values json.dumps cannot serialize itself"""
+    import numpy as np
+    if isinstance(value, (np.ndarray, np.generic)):
+        return value.tolist()
+    if isinstance(value, np.dtype):
+        return value.descr
+    raise TypeError(type(value).__name__)
+
+
+def resolved_parameters(modules):
+    """Upper-case module constants (the model parameters) of local modules,
+    serialized deterministically as JSON"""
+    if SCRIPT_DIR not in sys.path:
+        sys.path.insert(0, SCRIPT_DIR)
+    parameters = {}
+    for module_file in modules:
+        module = importlib.import_module(module_file[:-3])
+        for name, value in sorted(vars(module).items()):
+            if not name.isupper():
+                continue
+            # A repr may hold memory addresses and change on every run,
+            # which would silently make every figure stale
+            try:
+                parameters[f'{module.__name__}.{name}'] = json.dumps(
+                    value, sort_keys=True, default=_plain)
+            except (TypeError, ValueError) as error:
+                raise TypeError(
+                    f"{module.__name__}.{name} is not a plain value (numbers, "
+                    f"strings, lists, tuples, dicts): {error}. Rename it in "
+                    "lower case if it is not a model parameter") from None
+    return parameters
+
+
+def data_files(modules):
+    """Data files (e.g. moai_catalog.csv) declared by local modules in DATA_FILES"""
+    if SCRIPT_DIR not in sys.path:
+        sys.path.insert(0, SCRIPT_DIR)
+    paths = []
+    for module_file in modules:
+        module = importlib.import_module(module_file[:-3])
+        paths += [path for path in getattr(module, 'DATA_FILES', ())
+                  if path not in paths]
+    return paths
+
+
+def matplotlib_state():
+    """Matplotlib version and rcParams as seen by an Agg worker"""
+    import matplotlib
+    matplotlib.use('Agg')
+    params = {key: repr(value) for key, value in matplotlib.rcParams.items()}
+    return {'version': matplotlib.__version__, 'rcParams': params}
+
+
+def figure_key(script, mpl_state):
+    """Content hash of everything that determines a figure's output"""
+    modules = local_dependencies(script)
+    digest = hashlib.sha256()
+    for name in [script] + modules:
+        digest.update(name.encode())
+        digest.update(file_hash(os.path.join(SCRIPT_DIR, name)).encode())
+    for path in data_files(modules):
+        digest.update(os.path.basename(path).encode())
+        digest.update(file_hash(path).encode())
+    import figure_style
+    state = {'parameters': resolved_parameters(modules), 'matplotlib': mpl_state,
+             'draft': figure_style.is_draft(), 'compact': figure_style.is_compact(),
+             'formats': figure_style.output_formats(),
+             'derivatives': figure_style.output_derivatives()}
+    digest.update(json.dumps(state, sort_keys=True).encode())
+    return digest.hexdigest()
+
+
+def output_dir():
+    """Absolute figures/ directory (figures/preview/ in draft mode)"""
+    import figure_style
+    return os.path.join(SCRIPT_DIR, figure_style.output_dir())
+
+
+def figure_outputs(script):
+    """Existing figures/figureN_* files written by `script`"""
+    stem = script[:-3]
+    paths = []
+    for extension in ('png', 'pdf', 'webp', 'tif'):
+        paths += glob.glob(os.path.join(output_dir(), f'{stem}_*.{extension}'))
+    return sorted(paths)
+
+
+# ============================================================================
+# BUILD MANIFEST
+# ============================================================================
+
+def load_manifest():
+    path = os.path.join(output_dir(), MANIFEST_NAME)
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_manifest(manifest):
+    """Write the manifest atomically"""
+    os.makedirs(output_dir(), exist_ok=True)
+    path = os.path.join(output_dir(), MANIFEST_NAME)
+    with open(path + '.tmp', 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+        f.write('\n')
+    os.replace(path + '.tmp', path)
+
+
+def record_outputs(script):
+    """Output hashes keyed by path relative to the script directory"""
+    return {os.path.relpath(path, SCRIPT_DIR): file_hash(path)
+            for path in figure_outputs(script)}
+
+
+def is_up_to_date(entry, key):
+    """True if the manifest entry matches `key` and its outputs are intact"""
+    if not entry or entry.get('key') != key or not entry.get('outputs'):
+        return False
+    for relpath, digest in entry['outputs'].items():
+        path = os.path.join(SCRIPT_DIR, relpath)
+        if not os.path.exists(path) or file_hash(path) != digest:
+            return False
+    return True
+
+
+# ============================================================================
+# RENDERING
+# ============================================================================
+
+
+def render_figure(script, trace=False):
+    """Run one figure script headless; return (script, seconds, output,
+    error, trace events or None)"""
+    os.environ['MPLBACKEND'] = 'Agg'
+    os.chdir(SCRIPT_DIR)
+    if SCRIPT_DIR not in sys.path:
+        sys.path.insert(0, SCRIPT_DIR)
+
+    import runpy
+    import warnings
+
+    tracer = None
+    if trace:
+        # Before matplotlib is imported, so its import is traced too; a
+        # worker keeps one tracer for all the figures it renders
+        import figure_trace
+        tracer = figure_trace.install()
+
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+
+    output = io.StringIO()
+    error = None
+    start = time.perf_counter()
+    try:
+        with contextlib.redirect_stdout(output), warnings.catch_warnings():
+            # plt.show() is a no-op on Agg; silence its warning
+            warnings.filterwarnings('ignore', message='.*non-interactive.*')
+            if tracer is None:
+                runpy.run_path(os.path.join(SCRIPT_DIR, script), run_name='__main__')
+            else:
+                with tracer.span(f'run {script}', 'figure'):
+                    runpy.run_path(os.path.join(SCRIPT_DIR, script),
+                                   run_name='__main__')
+    except BaseException:
+        error = traceback.format_exc()
+    finally:
+        plt.close('all')
+    elapsed = time.perf_counter() - start
+    events = None
+    if tracer is not None:
+        # Hand over what was recorded since the worker's previous figure
+        events, tracer.events = tracer.events, []
+    return script, elapsed, output.getvalue(), error, events
+
+
+def resolve_scripts(names):
+    """Map command-line names (figure12, figure12.py) to figure scripts"""
+    if not names:
+        return list(FIGURE_SCRIPTS)
+    scripts = []
+    for name in names:
+        script = name if name.endswith('.py') else name + '.py'
+        if script not in FIGURE_SCRIPTS:
+            raise SystemExit(f"Unknown figure '{name}' "
+                             f"(choose from {', '.join(FIGURE_SCRIPTS)})")
+        scripts.append(script)
+    return scripts
+
+
+def build(scripts, jobs=None, verbose=False, force=False, trace=None):
+    """Render out-of-date `scripts` in parallel; return the number of failures.
+
+    With `trace` (a path), write a Chrome trace of the build there.
+    """
+    import figure_trace
+    tracer = figure_trace.Tracer('build_figures.py', enabled=trace is not None)
+    start = time.perf_counter()
+    manifest = load_manifest()
+    with tracer.span('matplotlib state', 'params'):
+        mpl_state = matplotlib_state()
+    keys = {}
+    for script in scripts:
+        with tracer.span(f'key {script}', 'params'):
+            keys[script] = figure_key(script, mpl_state)
+    stale = [script for script in scripts
+             if force or not is_up_to_date(manifest.get(script), keys[script])]
+
+    # Evaluate the shared production model once (it is cached on disk), so
+    # the figures that use it do not each recompute it in their own worker
+    if any('production_model.py' in local_dependencies(script) for script in stale):
+        with tracer.span('production_model', 'model'):
+            importlib.import_module('production_model').production_model()
+
+    jobs = jobs or max(1, min(len(stale), os.cpu_count() or 1))
+    # Spawned workers start with a clean matplotlib state
+    context = multiprocessing.get_context('spawn')
+
+    print("=" * 70)
+    print(f"BUILDING {len(stale)} OF {len(scripts)} FIGURES "
+          f"({jobs} workers, Agg backend)")
+    print("=" * 70)
+
+    for script in scripts:
+        if script not in stale:
+            print(f"  {script:<14} {'':>9}   up to date")
+
+    failures = 0
+    with concurrent.futures.ProcessPoolExecutor(max_workers=jobs,
+                                                mp_context=context) as pool:
+        futures = [pool.submit(render_figure, script, trace is not None)
+                   for script in stale]
+        # While the workers render: the values the captions quote, once per
+        # build (see key_values.py and render_docs.py)
+        with tracer.span('key_values', 'model'):
+            key_values = importlib.import_module('key_values')
+            values_changed = key_values.write_key_values(key_values.key_values())
+        for future in concurrent.futures.as_completed(futures):
+            script, elapsed, output, error, events = future.result()
+            tracer.events += events or []
+            status = 'ok' if error is None else 'FAILED'
+            print(f"  {script:<14} {elapsed:>7.2f} s   {status}")
+            if verbose and output:
+                print(output)
+            if error is not None:
+                failures += 1
+                manifest.pop(script, None)
+                print(error)
+            else:
+                manifest[script] = {'key': keys[script],
+                                    'outputs': record_outputs(script)}
+    save_manifest(manifest)
+    wall = time.perf_counter() - start
+    if trace is not None:
+        figure_trace.write_trace(tracer.events, trace)
+
+    print("-" * 70)
+    print(f"Key values {'updated' if values_changed else 'unchanged'} "
+          f"(run render_docs.py to update the captions)")
+    print(f"Total wall time: {wall:.2f} s, {failures} failed")
+    if trace is not None:
+        print(f"Trace written to {trace} (open in https://ui.perfetto.dev)")
+    print("=" * 70)
+    return failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('figures', nargs='*',
+                        help='figures to build (default: all)')
+    parser.add_argument('-j', '--jobs', type=int, default=None,
+                        help='number of worker processes (default: one per CPU, '
+                             'at most one per figure)')
+    parser.add_argument('-v', '--verbose', action='store_true',
+                        help='print the output of each figure script')
+    parser.add_argument('-f', '--force', action='store_true',
+                        help='re-render figures even if they are up to date')
+    parser.add_argument('--draft', action='store_true',
+                        help='render fast screen-resolution PNG previews '
+                             'into figures/preview/')
+    parser.add_argument('--compact', action='store_true',
+                        help='write compact publication PDFs (simplified paths, '
+                             'TrueType font subsets)')
+    parser.add_argument('--tiff', action='store_true',
+                        help='also write a TIFF of each figure for the publisher')
+    parser.add_argument('--trace', nargs='?', metavar='FILE',
+                        const=os.path.join(SCRIPT_DIR, '.traces', 'build.json'),
+                        help='write a Chrome/Perfetto trace of the build '
+                             '(default: .traces/build.json)')
+    args = parser.parse_args(argv)
+
+    if args.draft:
+        # Inherited by the spawned workers
+        os.environ['ROPE_DRAFT'] = '1'
+    if args.compact:
+        os.environ['ROPE_COMPACT'] = '1'
+    if args.tiff:
+        os.environ['ROPE_TIFF'] = '1'
+
+    failures = build(resolve_scripts(args.figures), args.jobs, args.verbose,
+                     args.force, args.trace)
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -2,16 +2,16 @@
 Verify Figure 9 calculations against paper specifications
 """
 
-import numpy as np
+import rope_mechanics as rm
 
 print("=" * 70)
 print("FIGURE 9 VERIFICATION")
 print("=" * 70)
 
 # Paper specifications
-tensile_strength = 916  # MPa
-packing_efficiency = 0.65  # 65% fiber packing efficiency
-construction_efficiency = 0.75  # 75% construction efficiency
+tensile_strength = rm.TENSILE_STRENGTH  # MPa
+packing_efficiency = rm.PACKING_EFFICIENCY  # 65% fiber packing efficiency
+construction_efficiency = rm.CONSTRUCTION_EFFICIENCY  # 75% construction efficiency
 
 print("\nPaper specifications:")
 print(f"- Tensile strength: {tensile_strength} MPa")
@@ -28,15 +28,12 @@ diameters = [10, 20, 45]
 
 print("\nFigure 9 code calculations (WITHOUT packing efficiency):")
 for d in diameters:
-    area = np.pi * (d/2)**2  # mm²
-    breaking_load = tensile_strength * area * construction_efficiency / 1000  # kN
+    breaking_load = rm.breaking_load(d, packing_efficiency=1.0)  # kN
     print(f"  D = {d} mm: Breaking Load = {breaking_load:.1f} kN")
 
 print("\nCorrected calculations (WITH packing efficiency):")
 for d in diameters:
-    area = np.pi * (d/2)**2  # mm²
-    effective_area = area * packing_efficiency
-    breaking_load = tensile_strength * effective_area * construction_efficiency / 1000  # kN
+    breaking_load = rm.breaking_load(d)  # kN
     print(f"  D = {d} mm: Breaking Load = {breaking_load:.1f} kN")
 
 print("\nPaper formula (0.35 × D²):")
@@ -56,18 +53,13 @@ print(f"\nAssumptions: 1 kN per ton, safety factor = {safety_factor}")
 
 print("\nFigure 9 code calculations (WITHOUT packing efficiency):")
 for mass in moai_masses:
-    force_per_rope = mass * 1000  # N
-    required_breaking_load = force_per_rope * safety_factor / 1000  # kN
-    required_diameter = 2 * np.sqrt(required_breaking_load * 1000 /
-                                    (tensile_strength * construction_efficiency * np.pi))
+    required_diameter = rm.diameter_from_mass(mass, safety_factor=safety_factor,
+                                              packing_efficiency=1.0)
     print(f"  {mass} ton moai: Required diameter = {required_diameter:.1f} mm")
 
 print("\nCorrected calculations (WITH packing efficiency):")
 for mass in moai_masses:
-    force_per_rope = mass * 1000  # N
-    required_breaking_load = force_per_rope * safety_factor / 1000  # kN
-    required_diameter = 2 * np.sqrt(required_breaking_load * 1000 /
-                                    (tensile_strength * packing_efficiency * construction_efficiency * np.pi))
+    required_diameter = rm.diameter_from_mass(mass, safety_factor=safety_factor)
     print(f"  {mass} ton moai: Required diameter = {required_diameter:.1f} mm")
 
 print("\n" + "=" * 70)
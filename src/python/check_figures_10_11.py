@@ -2,17 +2,17 @@
 Verify Figures 10 and 11 calculations against paper specifications
 """
 
-import numpy as np
+import rope_mechanics as rm
 
 print("=" * 70)
 print("FIGURES 10 AND 11 VERIFICATION")
 print("=" * 70)
 
 # Paper specifications
-tensile_strength = 916  # MPa
-packing_efficiency = 0.65  # 65% fiber packing efficiency
-construction_efficiency = 0.75  # 75% construction efficiency
-safety_factor = 10
+tensile_strength = rm.TENSILE_STRENGTH  # MPa
+packing_efficiency = rm.PACKING_EFFICIENCY  # 65% fiber packing efficiency
+construction_efficiency = rm.CONSTRUCTION_EFFICIENCY  # 75% construction efficiency
+safety_factor = rm.SAFETY_FACTOR
 
 print("\nPaper specifications:")
 print(f"- Tensile strength: {tensile_strength} MPa")
@@ -42,10 +42,7 @@ for mass, diameter in figure10_values.items():
 
 print("\nCorrect values (with packing efficiency):")
 for mass in figure10_values.keys():
-    working_load = mass * 1.0  # kN
-    required_breaking_load = working_load * safety_factor  # kN
-    correct_diameter = 2 * np.sqrt(required_breaking_load * 1000 /
-                                   (tensile_strength * packing_efficiency * construction_efficiency * np.pi))
+    correct_diameter = rm.diameter_from_mass(mass, safety_factor=safety_factor)
     hardcoded = figure10_values[mass]
     print(f"  {mass} ton moai: {correct_diameter:.1f} mm (hardcoded: {hardcoded} mm, error: {hardcoded - correct_diameter:.1f} mm)")
 
@@ -64,20 +61,15 @@ typical_mass = [15, 12, 14, 86]  # tons
 
 print("\nFigure 11 code calculations (WITHOUT packing efficiency):")
 for i, mass in enumerate(typical_mass):
-    working_load = mass * 1.0  # kN
-    required_breaking_load = working_load * safety_factor
-    diameter_wrong = 2 * np.sqrt(required_breaking_load * 1000 /
-                                 (tensile_strength * construction_efficiency * np.pi))
+    diameter_wrong = rm.diameter_from_mass(mass, safety_factor=safety_factor,
+                                           packing_efficiency=1.0)
     print(f"  {categories[i]}: {mass} tons -> {diameter_wrong:.1f} mm")
 
 print("\nCorrected calculations (WITH packing efficiency):")
 for i, mass in enumerate(typical_mass):
-    working_load = mass * 1.0  # kN
-    required_breaking_load = working_load * safety_factor
-    diameter_correct = 2 * np.sqrt(required_breaking_load * 1000 /
-                                   (tensile_strength * packing_efficiency * construction_efficiency * np.pi))
-    diameter_wrong = 2 * np.sqrt(required_breaking_load * 1000 /
-                                 (tensile_strength * construction_efficiency * np.pi))
+    diameter_correct = rm.diameter_from_mass(mass, safety_factor=safety_factor)
+    diameter_wrong = rm.diameter_from_mass(mass, safety_factor=safety_factor,
+                                           packing_efficiency=1.0)
     print(f"  {categories[i]}: {mass} tons -> {diameter_correct:.1f} mm (was {diameter_wrong:.1f} mm, error: {diameter_wrong - diameter_correct:.1f} mm)")
 
 print("\n" + "=" * 70)
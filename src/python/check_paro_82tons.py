@@ -2,21 +2,15 @@
 Calculate rope diameter for Paro at 82 tons instead of 86 tons
 """
 
-import numpy as np
+import rope_inverse as ri
+import rope_mechanics as rm
 
 # Paper specifications
-tensile_strength = 916  # MPa
-packing_efficiency = 0.65  # 65% fiber packing efficiency
-construction_efficiency = 0.75  # 75% construction efficiency
-safety_factor = 10
+safety_factor = rm.SAFETY_FACTOR
 
 def calc_rope_diameter(mass_tons):
     """Calculate required rope diameter for given moai mass"""
-    working_load = mass_tons * 1.0  # kN
-    required_breaking_load = working_load * safety_factor
-    diameter = 2 * np.sqrt(required_breaking_load * 1000 /
-                           (tensile_strength * packing_efficiency * construction_efficiency * np.pi))
-    return diameter
+    return rm.diameter_from_mass(mass_tons, safety_factor=safety_factor)
 
 print("=" * 70)
 print("PARO MASS CORRECTION: 86 tons → 82 tons")
@@ -45,4 +39,7 @@ print("\nOther moai for context:")
 for mass in [80, 82, 85, 86, 90]:
     print(f"  {mass} tons: {calc_rope_diameter(mass):.1f} mm")
 
+largest = ri.invert('diameter', 50.0, 'mass', safety_factor=safety_factor)
+print(f"\nLargest moai within the 50 mm limit: {largest:.1f} tons")
+
 print("=" * 70)
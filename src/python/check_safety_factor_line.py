@@ -2,18 +2,11 @@
 Verify the "breaking load / 8" line in figure 9 is correct
 """
 
-import numpy as np
+import rope_mechanics as rm
 
-# Parameters from figure 9
-tensile_strength = 916  # MPa
-packing_efficiency = 0.65
-construction_efficiency = 0.75
-
-# Calculate for a 10 mm rope
+# Calculate for a 10 mm rope (parameters from figure 9)
 diameter = 10  # mm
-area = np.pi * (diameter/2)**2  # mm²
-effective_area = area * packing_efficiency
-breaking_load = tensile_strength * effective_area * construction_efficiency / 1000  # kN
+breaking_load = rm.breaking_load(diameter)  # kN
 
 print("=" * 70)
 print("SAFETY FACTOR LINE VERIFICATION")
@@ -58,8 +51,7 @@ for load in moai_loads:
     required_breaking = load * 8
     print(f"  {load} kN working load → needs {required_breaking} kN breaking load (SF=8)")
     # Find rope diameter needed
-    required_area = required_breaking * 1000 / (tensile_strength * packing_efficiency * construction_efficiency)
-    required_diameter = 2 * np.sqrt(required_area / np.pi)
+    required_diameter = rm.diameter_from_breaking_load(required_breaking)
     print(f"    → requires {required_diameter:.1f} mm diameter rope")
 
 print("\n" + "=" * 70)
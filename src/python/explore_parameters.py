@@ -0,0 +1,393 @@
+"""
+Interactive Parameter Explorer for Figures 9-13
+
+One window with a panel per figure (9A, 9B, 10, 11, 12, 13) and sliders for
+the rope-model parameters: tensile strength, packing efficiency,
+construction efficiency, safety factor and working load per ton. Answers
+"what if packing is 55%?" without editing constants and re-rendering
+figure12.py at 600 dpi.
+
+Only the artists that depend on the parameters (curves, fills, bars and
+marker lines) are redrawn when a slider moves. They are animated: the
+static rest of the window (axes, grids, grip zones, reference lines,
+legends, tick labels) is drawn once and cached as background bitmaps, one
+per panel, slider row and the readout block. Each slider update restores
+the regions of the panels that parameter affects, redraws their animated
+artists and the moved slider, and blits only those regions. Text is the
+expensive part of a redraw, so the quoted numbers sit in one readout block
+(static labels, a single animated text of values) that is redrawn only
+when a value actually changes. The axis limits are fixed so the
+backgrounds stay valid; values beyond them are clipped, and the readout
+still shows them.
+
+The panels are simplified versions of the figures. Every diameter uses the
+slider's safety factor, and the Figure 12 panel adds a curve at half of it.
+They are computed with rope_mechanics.py and production_kernels.py
+directly, so an update evaluates no Monte Carlo band and touches no
+production cache.
+
+Usage:
+    python3 explore_parameters.py              # needs an interactive backend
+    python3 explore_parameters.py --benchmark  # headless: blit vs full redraw fps
+
+Keys: r resets every slider to the paper model.
+"""
+
+import argparse
+import sys
+import time
+
+import numpy as np
+
+import figure_data as fd
+import figure_style as fs
+import moai_catalog as mc
+import production_kernels as pk
+import production_model as pm
+import rope_mechanics as rm
+
+# (name, label, minimum, maximum, paper value, format)
+PARAMETERS = [
+    ('tensile_strength', 'Tensile strength (MPa)', 280, 1200, rm.TENSILE_STRENGTH, '%.0f'),
+    ('packing_efficiency', 'Packing efficiency', 0.40, 1.00, rm.PACKING_EFFICIENCY, '%.2f'),
+    ('construction_efficiency', 'Construction efficiency', 0.50, 0.95,
+     rm.CONSTRUCTION_EFFICIENCY, '%.2f'),
+    ('safety_factor', 'Safety factor', 2, 15, rm.SAFETY_FACTOR, '%.1f'),
+    ('load_per_ton', 'Load per ton (kN/t)', 0.5, 3.0, rm.LOAD_PER_TON, '%.2f'),
+]
+PAPER_MODEL = {name: value for name, _, _, _, value, _ in PARAMETERS}
+
+DIAMETERS = np.linspace(0, 50, 200)  # mm, Figure 9A
+MASS_RANGE = np.linspace(1, 300, 300)  # tons, Figures 9B and 12
+MARKED_DIAMETERS = (10, 45)  # mm
+GRIP_MASSES = (4, 15, 80, mc.mass('Paro'))  # tons, Figure 10
+CATEGORY_MASSES = mc.masses(fd.FIGURE11_SPECIMENS)
+SPECIMEN_MASSES = mc.masses(fd.FIGURE12_SPECIMENS)
+PRODUCTION_MASSES = np.array(pm.MOAI_MASSES)
+HANDLING_LIMIT = 50  # mm
+
+# (label, value text from explorer_data) of the key-value readout
+READOUTS = [
+    ('9A  10 / 45 mm rope', lambda d: '{:.0f} / {:.0f} kN'.format(*d['marked_loads'])),
+    (f'9B  {HANDLING_LIMIT} mm rope moves', lambda d: f"{d['mass_at_handling_limit']:.0f} t"),
+    ('10  4 / 15 / 80 t', lambda d: '{:.0f} / {:.0f} / {:.0f} mm'.format(*d['grip_diameters'][:3])),
+    ('11  platform / Paro', lambda d: '{:.0f} / {:.0f} mm'.format(*d['category_diameters'][2:])),
+    ('12  Paro / Tongariki', lambda d: '{:.1f} / {:.1f} mm'.format(*d['specimen_diameters'][2:4])),
+    ('12  Te Tokanga', lambda d: f"{d['specimen_diameters'][4]:.0f} mm"),
+    ('13  Paro, per set', lambda d: f"{d['person_days'][-1]:.0f} p-d, {d['fiber_mass'][-1]:.0f} kg"),
+]
+
+
+# ============================================================================
+# MODEL
+# ============================================================================
+
+def explorer_data(tensile_strength, packing_efficiency, construction_efficiency,
+                  safety_factor, load_per_ton):
+    """Every parameter-dependent value the panels draw"""
+    strength = {'tensile_strength': tensile_strength,
+                'packing_efficiency': packing_efficiency,
+                'construction_efficiency': construction_efficiency}
+    rope = dict(strength, load_per_ton=load_per_ton)
+
+    def diameter(masses, factor=safety_factor):
+        return rm.diameter_from_mass(masses, safety_factor=factor, **rope)
+
+    production_diameter = diameter(PRODUCTION_MASSES)
+    fiber = pk.fiber_mass(production_diameter)
+    return {
+        'breaking_load': rm.breaking_load(DIAMETERS, **strength),
+        'marked_loads': rm.breaking_load(np.array(MARKED_DIAMETERS), **strength),
+        'range_diameter': diameter(MASS_RANGE),
+        'range_diameter_half': diameter(MASS_RANGE, safety_factor / 2),
+        'grip_diameters': diameter(np.array(GRIP_MASSES)),
+        'category_diameters': diameter(CATEGORY_MASSES),
+        'specimen_diameters': diameter(SPECIMEN_MASSES),
+        'mass_at_handling_limit': rm.mass_from_diameter(
+            HANDLING_LIMIT, safety_factor=safety_factor, **rope),
+        'fiber_mass': fiber,
+        'person_days': sum(pk.labor_by_stage(fiber, production_diameter).values()),
+        'production_days': pk.serial_days(fiber),
+    }
+
+
+# ============================================================================
+# EXPLORER
+# ============================================================================
+
+class ParameterExplorer:
+    """The explorer window: static panels, animated artists and sliders.
+
+    The window is split into blit regions, one per panel and one per slider
+    row, each with its own cached background and animated artists. A slider
+    update redraws the moved slider and only the panels that depend on its
+    parameter.
+    """
+
+    def __init__(self, fig=None):
+        import matplotlib.pyplot as plt
+        from matplotlib.widgets import Slider
+
+        self.fig = fig or plt.figure(figsize=(15, 9))
+        grid = self.fig.add_gridspec(2, 3, left=0.06, right=0.98, top=0.95,
+                                     bottom=0.32, hspace=0.4, wspace=0.28)
+        axes = [self.fig.add_subplot(grid[i, j]) for i in range(2) for j in range(3)]
+        data = explorer_data(**PAPER_MODEL)
+        # Panel axes -> its animated artists
+        self.panels = {}
+        for ax, build in zip(axes, (self._figure9a, self._figure9b, self._figure10,
+                                    self._figure11, self._figure12, self._figure13)):
+            self.panels[ax] = build(ax, data)
+        # Figure 9A does not depend on the safety factor or the working load
+        self.dependents = {name: list(self.panels) for name, *_ in PARAMETERS}
+        for name in ('safety_factor', 'load_per_ton'):
+            self.dependents[name] = axes[1:]
+
+        self.sliders = {}
+        self.slider_artists = {}
+        for i, (name, label, low, high, value, fmt) in enumerate(PARAMETERS):
+            ax = self.fig.add_axes([0.15, 0.23 - 0.045 * i, 0.45, 0.03])
+            slider = Slider(ax, label, low, high, valinit=value, valfmt=fmt)
+            # The slider is blitted with the panels, not redrawn with the canvas
+            slider.drawon = False
+            slider.on_changed(lambda _, name=name: self.update(name))
+            self.sliders[name] = slider
+            self.slider_artists[name] = [slider.poly, *ax.lines, slider.valtext]
+
+        # Key values beside the sliders: static labels, animated numbers
+        self.fig.text(0.7, 0.25, '\n'.join(label for label, _ in READOUTS),
+                      va='top', fontsize=8, linespacing=1.4)
+        self.readout = self.fig.text(0.95, 0.25, '', va='top', ha='right',
+                                     fontsize=8, linespacing=1.4)
+        self.readout_text = None
+
+        for artists in (*self.panels.values(), *self.slider_artists.values(),
+                        [self.readout]):
+            for artist in artists:
+                artist.set_animated(True)
+        self.backgrounds = {}
+        self.fig.canvas.mpl_connect('draw_event', self._on_draw)
+        self.fig.canvas.mpl_connect('key_press_event', self._on_key)
+
+    def _figure9a(self, ax, data):
+        ax.set_title('Fig. 9A  Breaking load', fontsize=10)
+        ax.set_xlabel('Rope diameter (mm)')
+        ax.set_ylabel('Breaking load (kN)')
+        ax.set_xlim(0, 50)
+        ax.set_ylim(0, 1500)
+        ax.grid(True, alpha=0.3)
+        self.load_fill = ax.fill_between(DIAMETERS, 0, data['breaking_load'],
+                                         alpha=0.2, color='blue')
+        self.load_line, = ax.plot(DIAMETERS, data['breaking_load'], 'b-', linewidth=2)
+        self.load_points, = ax.plot(MARKED_DIAMETERS, data['marked_loads'], 'ro')
+        return [self.load_fill, self.load_line, self.load_points]
+
+    def _figure9b(self, ax, data):
+        ax.set_title('Fig. 9B  Required diameter', fontsize=10)
+        ax.set_xlabel('Moai mass (tons)')
+        ax.set_ylabel('Diameter (mm)')
+        ax.set_xlim(0, 300)
+        ax.set_ylim(0, 150)
+        ax.grid(True, alpha=0.3)
+        ax.axhline(HANDLING_LIMIT, color='red', linestyle='--', linewidth=1.5)
+        self.required_line, = ax.plot(MASS_RANGE, data['range_diameter'], 'b-',
+                                      linewidth=2)
+        self.limit_marker = ax.axvline(0, color='purple', linestyle=':', linewidth=1.5)
+        return [self.required_line, self.limit_marker]
+
+    def _figure10(self, ax, data):
+        ax.set_title('Fig. 10  Grip limits', fontsize=10)
+        ax.set_xlabel('Rope diameter (mm)')
+        hands = np.array([180, 190, 200, 210, 220])  # mm circumference
+        y = np.arange(len(hands))
+        ax.barh(y, hands * 0.45 / np.pi, color='orange', alpha=0.5, label='Maximum grip')
+        ax.barh(y, hands * 0.35 / np.pi, color='green', alpha=0.6,
+                label='Comfortable grip')
+        ax.axvspan(HANDLING_LIMIT, 70, color='red', alpha=0.15)
+        ax.set_yticks(y)
+        ax.set_yticklabels([f'{h} mm' for h in hands], fontsize=8)
+        ax.set_xlim(0, 70)
+        ax.legend(loc='lower right', fontsize=7)
+        self.grip_lines = [ax.axvline(0, color=color, linewidth=2)
+                           for color in ('blue', 'purple', 'red', 'darkred')]
+        return list(self.grip_lines)
+
+    def _figure11(self, ax, data):
+        ax.set_title('Fig. 11  Moai categories', fontsize=10)
+        ax.set_ylabel('Rope diameter (mm)')
+        self.category_bars = ax.bar(['Quarry', 'Road', 'Platform', 'Paro'],
+                                    data['category_diameters'],
+                                    color='steelblue', alpha=0.8)
+        ax.axhline(HANDLING_LIMIT, color='red', linestyle='--', linewidth=1.5)
+        ax.set_ylim(0, 120)
+        ax.grid(True, alpha=0.3, axis='y')
+        return list(self.category_bars)
+
+    def _figure12(self, ax, data):
+        ax.set_title('Fig. 12  Documented specimens', fontsize=10)
+        ax.set_xlabel('Moai mass (tons)')
+        ax.set_ylabel('Diameter (mm)')
+        ax.fill_between([0, 300], 0, 40, color='green', alpha=0.1)
+        ax.fill_between([0, 300], 40, 50, color='orange', alpha=0.1)
+        ax.fill_between([0, 300], 50, 150, color='red', alpha=0.15)
+        ax.axvline(90, color='purple', linestyle='-.', alpha=0.5)
+        ax.set_xlim(0, 300)
+        ax.set_ylim(0, 150)
+        ax.grid(True, alpha=0.3)
+        self.specimen_line, = ax.plot(MASS_RANGE, data['range_diameter'], 'b-',
+                                      linewidth=2, label='Safety factor')
+        self.specimen_half, = ax.plot(MASS_RANGE, data['range_diameter_half'], 'b--',
+                                      linewidth=1.5, alpha=0.6, label='Half of it')
+        self.specimen_points, = ax.plot(SPECIMEN_MASSES, data['specimen_diameters'],
+                                        'o', color='darkorange', markeredgecolor='black')
+        ax.legend(loc='lower right', fontsize=7)
+        return [self.specimen_line, self.specimen_half, self.specimen_points]
+
+    def _figure13(self, ax, data):
+        ax.set_title('Fig. 13  Labor per rope set', fontsize=10)
+        ax.set_ylabel('Person-days')
+        self.labor_bars = ax.bar(['Exp.', 'Typical', '40 t', '60 t', 'Paro'],
+                                 data['person_days'], color='saddlebrown', alpha=0.7)
+        ax.set_ylim(0, 600)
+        ax.grid(True, alpha=0.3, axis='y')
+        return list(self.labor_bars)
+
+    # ------------------------------------------------------------------------
+
+    def parameters(self):
+        return {name: slider.val for name, slider in self.sliders.items()}
+
+    def set_artists(self, data):
+        """Move the animated artists to `data` (from explorer_data)"""
+        load = data['breaking_load']
+        self.load_fill.set_data(DIAMETERS, 0, load)
+        self.load_line.set_ydata(load)
+        self.load_points.set_ydata(data['marked_loads'])
+
+        self.required_line.set_ydata(data['range_diameter'])
+        limit = data['mass_at_handling_limit']
+        self.limit_marker.set_xdata([limit, limit])
+
+        for line, value in zip(self.grip_lines, data['grip_diameters']):
+            line.set_xdata([value, value])
+        for bars, values in ((self.category_bars, data['category_diameters']),
+                             (self.labor_bars, data['person_days'])):
+            for bar, value in zip(bars, values):
+                bar.set_height(value)
+
+        self.specimen_line.set_ydata(data['range_diameter'])
+        self.specimen_half.set_ydata(data['range_diameter_half'])
+        self.specimen_points.set_ydata(data['specimen_diameters'])
+
+        self.readout.set_text('\n'.join(value(data) for _, value in READOUTS))
+
+    def _regions(self, name=None):
+        """(bbox, artists) of every blit region, or of those `name` affects"""
+        from matplotlib.transforms import Bbox
+
+        panels = self.panels if name is None else self.dependents[name]
+        names = self.sliders if name is None else (name,)
+        # Antialiased edges of clipped artists reach just outside the axes
+        regions = [(ax.bbox.expanded(1, 1).padded(3), self.panels[ax]) for ax in panels]
+        width = self.fig.bbox.width
+        for slider_name in names:
+            # The value text lies right of the slider axes
+            bbox = self.sliders[slider_name].ax.bbox
+            regions.append((Bbox.from_extents(0, bbox.y0 - 4, 0.68 * width, bbox.y1 + 4),
+                            self.slider_artists[slider_name]))
+        # Text is the costliest artist: redraw the numbers only when they change
+        if name is None or self.readout.get_text() != self.readout_text:
+            self.readout_text = self.readout.get_text()
+            height = self.fig.bbox.height
+            regions.append((Bbox.from_extents(0.68 * width, 0, width, 0.27 * height),
+                            [self.readout]))
+        return regions
+
+    def _on_draw(self, event):
+        """Cache the static background of every region after a full draw"""
+        canvas = self.fig.canvas
+        self.set_artists(explorer_data(**self.parameters()))
+        regions = self._regions()
+        self.backgrounds = {id(artists[0]): canvas.copy_from_bbox(bbox)
+                            for bbox, artists in regions}
+        for _, artists in regions:
+            for artist in artists:
+                self.fig.draw_artist(artist)
+
+    def update(self, name):
+        """Recompute the model and blit the regions parameter `name` affects"""
+        canvas = self.fig.canvas
+        self.set_artists(explorer_data(**self.parameters()))
+        if not self.backgrounds:
+            canvas.draw_idle()
+            return
+        for bbox, artists in self._regions(name):
+            canvas.restore_region(self.backgrounds[id(artists[0])])
+            for artist in artists:
+                self.fig.draw_artist(artist)
+            canvas.blit(bbox)
+        canvas.flush_events()
+
+    def reset(self):
+        for slider in self.sliders.values():
+            slider.reset()
+
+    def _on_key(self, event):
+        if event.key == 'r':
+            self.reset()
+
+
+# ============================================================================
+# BENCHMARK
+# ============================================================================
+
+def benchmark(steps=60):
+    """Frames per second of blitted updates and of full redraws (Agg)"""
+    import matplotlib
+    matplotlib.use('Agg')
+
+    explorer = ParameterExplorer()
+    explorer.fig.canvas.draw()
+    sweeps = [(slider, np.linspace(slider.valmin, slider.valmax, steps))
+              for slider in explorer.sliders.values()]
+
+    def run(full):
+        start = time.perf_counter()
+        for slider, values in sweeps:
+            for value in values:
+                slider.set_val(value)
+                if full:
+                    explorer.fig.canvas.draw()
+            slider.reset()
+        return steps * len(sweeps) / (time.perf_counter() - start)
+
+    for name, full in (('blitted update', False), ('full redraw', True)):
+        print(f"  {name:<16} {run(full):7.1f} fps")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--benchmark', action='store_true',
+                        help='measure update rates headless instead of opening '
+                             'the window')
+    parser.add_argument('--steps', type=int, default=60,
+                        help='slider positions per parameter in --benchmark')
+    args = parser.parse_args(argv)
+
+    fs.apply_style()
+    import matplotlib
+    # Screen resolution, not the 600 dpi of the saved figures
+    matplotlib.rcParams['figure.dpi'] = fs.DRAFT_DPI
+    if args.benchmark:
+        print(f"Explorer updates, {args.steps} positions x {len(PARAMETERS)} sliders:")
+        benchmark(args.steps)
+        return 0
+
+    import matplotlib.pyplot as plt
+    explorer = ParameterExplorer()  # noqa: F841 (keeps the callbacks alive)
+    plt.show()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -8,15 +8,15 @@ capability and the rope diameters required for moai transport of various sizes.
 import matplotlib.pyplot as plt
 import numpy as np
 
-# Set publication-quality parameters
-plt.rcParams['font.family'] = 'serif'
-plt.rcParams['font.size'] = 10
-plt.rcParams['axes.labelsize'] = 11
-plt.rcParams['axes.titlesize'] = 12
-plt.rcParams['xtick.labelsize'] = 9
-plt.rcParams['ytick.labelsize'] = 9
-plt.rcParams['legend.fontsize'] = 9
-plt.rcParams['figure.dpi'] = 600
+from figure_export import save_figure
+import figure_data as fd
+import figure_style as fs
+
+# Set publication-quality parameters (draft resolution with ROPE_DRAFT=1)
+fs.apply_style()
+
+# All plotted numbers (see figure_data.py)
+data = fd.figure10()
 
 # Create figure
 fig, ax = plt.subplots(figsize=(10, 7))
@@ -26,15 +26,15 @@ fig, ax = plt.subplots(figsize=(10, 7))
 # ============================================================================
 
 # Human hand circumference range (mm)
-hand_circumference = np.array([180, 190, 200, 210, 220])
+hand_circumference = data['hand_circumference']
 hand_labels = ['Small', 'Small-Med', 'Medium', 'Med-Large', 'Large']
 
 # Maximum grippable rope diameter
 # Comfortable grip: approximately 35% of hand circumference / π
-max_grip_comfortable = hand_circumference * 0.35 / np.pi  # diameter (mm)
+max_grip_comfortable = data['max_grip_comfortable']  # diameter (mm)
 
 # Maximum grip (difficult): approximately 45% of hand circumference / π
-max_grip_limit = hand_circumference * 0.45 / np.pi  # diameter (mm)
+max_grip_limit = data['max_grip_limit']  # diameter (mm)
 
 # ============================================================================
 # Plot Grip Capability
@@ -49,29 +49,26 @@ bars1 = ax.barh(x_pos - width/2, max_grip_comfortable, width,
 bars2 = ax.barh(x_pos + width/2, max_grip_limit, width, 
                 label='Maximum grip (difficult)', color='orange', alpha=0.7)
 
+# Share of the whole workforce able to grip each diameter (hand-circumference
+# distributions by cohort, see grip_model.py), on a secondary axis
+diameter_grid = data['diameter_grid']
+ax_share = ax.twinx()
+ax_share.plot(diameter_grid, 100 * data['share_comfortable'],
+              color='darkgreen', linewidth=1.5, label='Workforce able: comfortable')
+ax_share.plot(diameter_grid, 100 * data['share_maximum'],
+              color='darkorange', linewidth=1.5, linestyle='-.',
+              label='Workforce able: maximum')
+ax_share.set_ylim(0, 105)
+ax_share.set_ylabel('Share of Workforce Able to Grip (%)')
+
 # ============================================================================
 # Add Rope Diameter Requirements for Different Moai Masses
 # ============================================================================
 
 # Calculate required rope diameters using paper specifications
-tensile_strength = 916  # MPa
-packing_efficiency = 0.65  # 65% fiber packing efficiency
-construction_efficiency = 0.75  # 75% construction efficiency
-safety_factor = 10
-
-def calc_rope_diameter(mass_tons):
-    """Calculate required rope diameter for given moai mass"""
-    working_load = mass_tons * 1.0  # kN
-    required_breaking_load = working_load * safety_factor
-    diameter = 2 * np.sqrt(required_breaking_load * 1000 /
-                           (tensile_strength * packing_efficiency * construction_efficiency * np.pi))
-    return diameter
-
-# Calculate diameters for different moai sizes
-d_4ton = calc_rope_diameter(4)
-d_15ton = calc_rope_diameter(15)
-d_80ton = calc_rope_diameter(80)
-d_82ton = calc_rope_diameter(82)
+# (916 MPa, 65% packing, 75% construction efficiency, SF=10)
+paro_mass = data['paro_mass']
+d_4ton, d_15ton, d_80ton, d_82ton = data['diameters']
 
 # Vertical lines showing required rope diameters
 ax.axvline(x=d_4ton, color='blue', linestyle='-', linewidth=2,
@@ -81,7 +78,7 @@ ax.axvline(x=d_15ton, color='purple', linestyle='--', linewidth=2,
 ax.axvline(x=d_80ton, color='red', linestyle='--', linewidth=2,
            label=f'{d_80ton:.0f} mm (80 ton moai)')
 ax.axvline(x=d_82ton, color='darkred', linestyle=':', linewidth=2,
-           label=f'{d_82ton:.0f} mm (Paro, 82 tons)')
+           label=f'{d_82ton:.0f} mm (Paro, {paro_mass:.0f} tons)')
 
 # ============================================================================
 # Highlight Impractical Zone
@@ -101,15 +98,19 @@ ax.set_yticklabels(hand_labels)
 ax.set_xlabel('Rope Diameter (mm)')
 ax.set_ylabel('Hand Size Category')
 ax.set_title('Human Hand Grip Capability vs Required Rope Diameters\nfor Moai Transport')
-ax.legend(loc='lower right', fontsize=9)
+handles, labels = ax.get_legend_handles_labels()
+share_handles, share_labels = ax_share.get_legend_handles_labels()
+ax.legend(handles + share_handles, labels + share_labels, loc='lower right', fontsize=9)
 ax.grid(True, alpha=0.3, axis='x')
 ax.set_xlim(0, 70)
 
 # Save figure
 plt.tight_layout()
-import os
-os.makedirs('figures', exist_ok=True)
-plt.savefig('figures/figure10_grip_limits.png', dpi=600, bbox_inches='tight')
-plt.savefig('figures/figure10_grip_limits.pdf', dpi=600, bbox_inches='tight')
+save_figure(fig, 'figure10_grip_limits')
+for label, diameter, comfortable, maximum in zip(
+        ['4 ton', '15 ton', '80 ton', 'Paro'], data['diameters'],
+        data['marked_comfortable'], data['marked_maximum']):
+    print(f"{label:<7} {diameter:5.1f} mm: "
+          f"{comfortable:6.1%} comfortable, {maximum:6.1%} maximum grip")
 print("Figure 10 saved: figures/figure10_grip_limits.png and .pdf")
 plt.show()
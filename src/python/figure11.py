@@ -8,15 +8,15 @@ moai mass, and workforce requirements across different moai categories.
 import matplotlib.pyplot as plt
 import numpy as np
 
-# Set publication-quality parameters
-plt.rcParams['font.family'] = 'serif'
-plt.rcParams['font.size'] = 10
-plt.rcParams['axes.labelsize'] = 11
-plt.rcParams['axes.titlesize'] = 12
-plt.rcParams['xtick.labelsize'] = 9
-plt.rcParams['ytick.labelsize'] = 9
-plt.rcParams['legend.fontsize'] = 9
-plt.rcParams['figure.dpi'] = 600
+from figure_export import save_figure
+import figure_data as fd
+import figure_style as fs
+
+# Set publication-quality parameters (draft resolution with ROPE_DRAFT=1)
+fs.apply_style()
+
+# All plotted numbers (see figure_data.py)
+data = fd.figure11()
 
 # Create figure
 fig, ax1 = plt.subplots(figsize=(10, 8))
@@ -29,22 +29,13 @@ categories = ['Quarry\n(incomplete)', 'Road\n(abandoned)',
               'Platform\n(transported)', 'Paro\n(transported)']
 
 # Typical values for each category
-typical_mass = [15, 12, 14, 82]  # tons
+typical_mass = data['typical_mass']  # tons
 
 # Calculate rope diameter consistently with other figures
 # Using: working_load = mass * 1.0 kN/ton, SF=10, 916 MPa, 65% packing, 75% construction efficiency
-tensile_strength = 916  # MPa
-packing_efficiency = 0.65  # fiber packing efficiency (65%)
-construction_efficiency = 0.75  # rope construction efficiency (75%)
-safety_factor = 10
-rope_diameter_required = []
-for mass in typical_mass:
-    working_load = mass * 1.0  # kN
-    required_breaking_load = working_load * safety_factor
-    diameter = 2 * np.sqrt(required_breaking_load * 1000 / (tensile_strength * packing_efficiency * construction_efficiency * np.pi))
-    rope_diameter_required.append(diameter)
-
-people_required = [10, 8, 10, 60]  # estimated people per rope team
+rope_diameter_required = data['rope_diameter']
+
+people_required = data['people_required']  # estimated people per rope team
 
 x = np.arange(len(categories))
 width = 0.25
@@ -91,7 +82,7 @@ ax1.text(0.5, 52, 'Practical handling limit (50 mm)',
 # Add Annotation for Paro
 # ============================================================================
 
-paro_diameter = rope_diameter_required[3]  # Paro is 4th category
+paro_diameter = data['paro_diameter']  # Paro is 4th category
 ax1.annotate(f'Paro ({paro_diameter:.0f} mm)\nat the practical\nhandling limit',
              xy=(3, paro_diameter), xytext=(0.5, 55),
              arrowprops=dict(arrowstyle='->', color='orange', lw=1.5),
@@ -141,9 +132,6 @@ ax1.legend(lines1 + lines2 + lines3, labels1 + labels2 + labels3,
 
 # Save figure
 plt.tight_layout()
-import os
-os.makedirs('figures', exist_ok=True)
-plt.savefig('figures/figure11_transport_scenarios.png', dpi=600, bbox_inches='tight')
-plt.savefig('figures/figure11_transport_scenarios.pdf', dpi=600, bbox_inches='tight')
+save_figure(fig, 'figure11_transport_scenarios')
 print("Figure 11 saved: figures/figure11_transport_scenarios.png and .pdf")
 plt.show()
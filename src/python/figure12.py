@@ -11,15 +11,15 @@ Demonstrates where rope technology reaches its physical impossibility limit.
 import matplotlib.pyplot as plt
 import numpy as np
 
-# Set publication-quality parameters
-plt.rcParams['font.family'] = 'serif'
-plt.rcParams['font.size'] = 10
-plt.rcParams['axes.labelsize'] = 11
-plt.rcParams['axes.titlesize'] = 12
-plt.rcParams['xtick.labelsize'] = 9
-plt.rcParams['ytick.labelsize'] = 9
-plt.rcParams['legend.fontsize'] = 9
-plt.rcParams['figure.dpi'] = 600
+from figure_export import save_figure
+import figure_data as fd
+import figure_style as fs
+
+# Set publication-quality parameters (draft resolution with ROPE_DRAFT=1)
+fs.apply_style()
+
+# All plotted numbers (see figure_data.py)
+data = fd.figure12()
 
 # Create figure with two subplots
 fig, (ax_top, ax_bottom) = plt.subplots(2, 1, figsize=(12, 10))
@@ -30,28 +30,13 @@ fig, (ax_top, ax_bottom) = plt.subplots(2, 1, figsize=(12, 10))
 
 moai_names = ['Experimental\nReplica', 'Ahu Akivi\n(typical)', 'Paro',
               'Ahu Tongariki\n(largest)', 'Te Tokanga\n(quarry)']
-moai_masses = np.array([4.3, 18, 82, 90, 260])  # metric tons
-
-# Rope calculation parameters
-tensile_strength = 916  # MPa for T. cordifolia
-packing_efficiency = 0.65  # fiber packing efficiency (65%)
-construction_efficiency = 0.75  # rope construction efficiency (75%)
-safety_factors_sf10 = 10
-safety_factors_sf5 = 5
-
-# Calculate required rope diameter
-# Assume working load = 1 kN per ton (simplified)
-working_load = moai_masses * 1.0  # kN
-
-# Calculate required breaking load
-required_breaking_load_sf10 = working_load * safety_factors_sf10  # kN
-required_breaking_load_sf5 = working_load * safety_factors_sf5  # kN
+moai_masses = data['moai_masses']  # metric tons
 
-# Calculate diameter: d = 2 × sqrt(Breaking_load / (tensile_strength × π × packing_efficiency × construction_efficiency))
-required_diameter_sf10 = 2 * np.sqrt(required_breaking_load_sf10 * 1000 /
-                                     (tensile_strength * packing_efficiency * construction_efficiency * np.pi))
-required_diameter_sf5 = 2 * np.sqrt(required_breaking_load_sf5 * 1000 /
-                                    (tensile_strength * packing_efficiency * construction_efficiency * np.pi))
+# Required rope diameter at safety factors 10 and 5
+# (916 MPa, 65% packing, 75% construction efficiency, 1 kN working load per ton)
+# d = 2 × sqrt(Breaking_load / (tensile_strength × π × packing_efficiency × construction_efficiency))
+required_diameter_sf10 = data['diameter_sf10']
+required_diameter_sf5 = data['diameter_sf5']
 
 # Colors based on transport status
 colors = ['green', 'blue', 'orange', 'orange', 'red']
@@ -132,15 +117,14 @@ ax_top.grid(True, alpha=0.3, axis='y')
 # ============================================================================
 
 # Generate continuous curves
-moai_range = np.linspace(1, 300, 500)
-working_load_range = moai_range * 1.0
-required_breaking_load_range_sf10 = working_load_range * 10
-required_breaking_load_range_sf5 = working_load_range * 5
+moai_range = data['moai_range']
+diameter_sf10, diameter_sf5 = data['range_sf10'], data['range_sf5']
 
-diameter_sf10 = 2 * np.sqrt(required_breaking_load_range_sf10 * 1000 /
-                            (tensile_strength * packing_efficiency * construction_efficiency * np.pi))
-diameter_sf5 = 2 * np.sqrt(required_breaking_load_range_sf5 * 1000 /
-                           (tensile_strength * packing_efficiency * construction_efficiency * np.pi))
+# Parameter uncertainty envelope for SF=10 (see rope_uncertainty.py)
+mass_grid = data['mass_grid']
+bands = data['bands']
+ax_bottom.fill_between(mass_grid, bands[5], bands[95], alpha=0.2, color='blue',
+                       label='SF=10, 5–95% range (parameter uncertainty)')
 
 # Plot continuous curves
 ax_bottom.plot(moai_range, diameter_sf10, 'b-', linewidth=2.5, 
@@ -182,7 +166,7 @@ ax_bottom.text(200, 100, 'IMPOSSIBLE\n(exceeds grip capability)',
                bbox=dict(boxstyle='round', facecolor='red', alpha=0.2))
 
 # Add transport limit line
-transport_limit_mass = 90
+transport_limit_mass = data['transport_limit_mass']
 ax_bottom.axvline(x=transport_limit_mass, color='purple', linestyle='-.', 
                   linewidth=2, alpha=0.5)
 ax_bottom.text(transport_limit_mass + 5, 130, 
@@ -201,10 +185,7 @@ ax_bottom.grid(True, alpha=0.3)
 
 # Save figure
 plt.tight_layout()
-import os
-os.makedirs('figures', exist_ok=True)
-plt.savefig('figures/figure12_moai_progression.png', dpi=600, bbox_inches='tight')
-plt.savefig('figures/figure12_moai_progression.pdf', dpi=600, bbox_inches='tight')
+save_figure(fig, 'figure12_moai_progression')
 
 # Print summary data
 print("Figure 12 saved: figures/figure12_moai_progression.png and .pdf")
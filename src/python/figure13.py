@@ -14,15 +14,13 @@ fiber processing techniques.
 import matplotlib.pyplot as plt
 import numpy as np
 
-# Set publication-quality parameters
-plt.rcParams['font.family'] = 'serif'
-plt.rcParams['font.size'] = 10
-plt.rcParams['axes.labelsize'] = 11
-plt.rcParams['axes.titlesize'] = 12
-plt.rcParams['xtick.labelsize'] = 9
-plt.rcParams['ytick.labelsize'] = 9
-plt.rcParams['legend.fontsize'] = 9
-plt.rcParams['figure.dpi'] = 600
+from figure_export import save_figure
+import figure_data as fd
+import figure_style as fs
+import production_model as pm
+
+# Set publication-quality parameters (draft resolution with ROPE_DRAFT=1)
+fs.apply_style()
 
 # Create figure with 2x2 subplots
 fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(14, 11))
@@ -31,41 +29,31 @@ fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(14, 11))
 # PARAMETERS FROM LITERATURE AND CALCULATIONS
 # ============================================================================
 
-# Rope requirements (from our analysis)
-moai_masses = np.array([4.3, 18, 40, 60, 82])  # tons
+# Rope requirements (from our analysis): the whole production chain
+# (diameter, fiber, schedule, labor) comes from the shared cached model
+# in production_model.py, which Figure 14 reuses (see figure_data.py)
+data = fd.figure13()
+production = data['production']
+
+moai_masses = production.masses  # tons
 moai_labels = ['Experimental\n4.3t', 'Typical\n18t', 'Large\n40t',
                'Very Large\n60t', 'Paro\n82t']
 
-# Calculate rope diameter needed (SF=10, 916 MPa, 65% packing, 75% construction efficiency)
-tensile_strength = 916  # MPa
-packing_efficiency = 0.65  # fiber packing efficiency (65%)
-construction_efficiency = 0.75  # rope construction efficiency (75%)
-safety_factor = 10
-working_load = moai_masses * 1.0  # kN/ton
-required_breaking_load = working_load * safety_factor
-rope_diameter = 2 * np.sqrt(required_breaking_load * 1000 /
-                            (tensile_strength * packing_efficiency * construction_efficiency * np.pi))
+# Rope diameter needed (SF=10, 916 MPa, 65% packing, 75% construction efficiency)
+rope_diameter = production.diameter
 
 # From Folk (2018): experimental rope data
 # 6,000g fiber from 2 trees, 4m rope used 1,200g
 # For 30.5m rope: ~9,150g needed, ~3 trees
-# Scaling: 300g fiber per meter of rope for their diameter
-
-# Estimate fiber mass per meter for different diameters
-# Assuming linear density scales with cross-sectional area (diameter²)
-experimental_diameter = 25  # mm (estimated from their experiment)
-experimental_fiber_per_meter = 300  # g/m
-
-# Scale to our rope diameters
-fiber_per_meter = experimental_fiber_per_meter * (rope_diameter / experimental_diameter)**2
+# Scaling: 300g fiber per meter of rope for their (~25 mm) diameter,
+# linear density scaling with cross-sectional area (diameter²)
 
-# Assume 3 ropes per moai (2 lateral, 1 stabilizing)
-# Average rope length: 30m (from experiments)
-rope_length = 30  # meters per rope
-n_ropes = 3
+# 3 ropes per moai (2 lateral, 1 stabilizing), 30m average length
+rope_length = production.parameters.rope_length  # meters per rope
+n_ropes = production.parameters.n_ropes
 
 # Total fiber mass needed (kg)
-total_fiber_mass = (fiber_per_meter * rope_length * n_ropes) / 1000  # convert to kg
+total_fiber_mass = production.fiber_mass
 
 # ============================================================================
 # PANEL 1 (TOP LEFT): Fiber Mass Required
@@ -96,26 +84,35 @@ for i, mass in enumerate(total_fiber_mass):
 # Drying/preparation: ~3 days
 # Rope construction: ~0.3 days per meter of finished rope (with 2-4 people)
 
-harvesting_time = total_fiber_mass * 0.5
-retting_time = 38  # fixed (from paper)
-preparation_time = 3  # fixed
-construction_time = (rope_length * n_ropes) * 0.3
+# The stages are scheduled as a task DAG (see production_schedule.py):
+# - serial: all fiber in one batch, one crew and one retting pit
+#   (harvesting + retting + preparation + construction, back to back)
+# - parallel: fiber split into 3 batches retted in 3 pits, so retting of
+#   the first batch overlaps harvesting of the next
+serial_schedule = production.serial_schedule
+parallel_schedule = production.parallel_schedule
 
-# Create stacked bar chart
-width = 0.6
+# Stacked bars: critical-path days per stage for each schedule
+width = 0.38
 x_pos = np.arange(len(moai_masses))
-
-p1 = ax2.bar(x_pos, harvesting_time, width, label='Harvesting & Processing',
-             color='darkgreen', alpha=0.7)
-p2 = ax2.bar(x_pos, np.ones(len(moai_masses)) * retting_time, width,
-             bottom=harvesting_time, label='Retting (can be parallel)',
-             color='orange', alpha=0.7)
-p3 = ax2.bar(x_pos, np.ones(len(moai_masses)) * preparation_time, width,
-             bottom=harvesting_time + retting_time,
-             label='Drying/Preparation', color='lightblue', alpha=0.7)
-p4 = ax2.bar(x_pos, construction_time, width,
-             bottom=harvesting_time + retting_time + preparation_time,
-             label='Rope Construction', color='brown', alpha=0.7)
+stage_styles = [('harvest', 'Harvesting & Processing', 'darkgreen'),
+                ('retting', 'Retting', 'orange'),
+                ('preparation', 'Drying/Preparation', 'lightblue'),
+                ('construction', 'Rope Construction', 'brown')]
+
+for offset, result, hatch in [(-width/2, serial_schedule, None),
+                              (width/2, parallel_schedule, '//')]:
+    bottom = np.zeros(len(moai_masses))
+    for stage, label, color in stage_styles:
+        days = result['critical_days'][stage]
+        ax2.bar(x_pos + offset, days, width, bottom=bottom,
+                label=label if hatch is None else None,
+                color=color, alpha=0.7, hatch=hatch, edgecolor='black',
+                linewidth=0.5)
+        bottom = bottom + days
+
+ax2.bar(0, 0, 0, color='white', edgecolor='black', hatch='//',
+        label='3 batches, parallel retting')
 
 ax2.set_ylabel('Time (days)', fontweight='bold')
 ax2.set_xlabel('Moai Specimen', fontweight='bold')
@@ -125,12 +122,16 @@ ax2.set_title('B. Production Timeline for Rope Sets',
               fontweight='bold', fontsize=12)
 ax2.legend(loc='upper left', fontsize=8)
 ax2.grid(True, alpha=0.3, axis='y')
+ax2.set_ylim(0, max(serial_schedule['makespan']) * 1.35)
 
 # Add total time labels
-total_time = harvesting_time + retting_time + preparation_time + construction_time
-for i, tt in enumerate(total_time):
-    ax2.text(i, tt + 2, f'{tt:.0f}d', ha='center', va='bottom',
-             fontsize=8, fontweight='bold')
+total_time = serial_schedule['makespan']
+parallel_time = parallel_schedule['makespan']
+for i, (tt, pt) in enumerate(zip(total_time, parallel_time)):
+    ax2.text(i - width/2, tt + 2, f'{tt:.0f}d', ha='center', va='bottom',
+             fontsize=7, fontweight='bold')
+    ax2.text(i + width/2, pt + 2, f'{pt:.0f}d', ha='center', va='bottom',
+             fontsize=7, fontweight='bold')
 
 # ============================================================================
 # PANEL 3 (BOTTOM LEFT): Labor Investment (Person-Days)
@@ -142,19 +143,14 @@ for i, tt in enumerate(total_time):
 # Preparation: 2 people
 # Construction: 2-4 people (scales with rope diameter)
 
-people_harvesting = 3
-people_retting = 0.5 / retting_time  # minimal daily supervision
-people_preparation = 2
-people_construction = 2 + (rope_diameter / 20)  # more people for thicker rope
-
 # Person-days for each stage
-pd_harvesting = harvesting_time * people_harvesting
-pd_retting = retting_time * people_retting
-pd_preparation = preparation_time * people_preparation
-pd_construction = construction_time * people_construction
+pd_harvesting = production.stage_person_days['harvest']
+pd_retting = production.stage_person_days['retting']
+pd_preparation = production.stage_person_days['preparation']
+pd_construction = production.stage_person_days['construction']
 
 # Total person-days
-total_person_days = pd_harvesting + pd_retting + pd_preparation + pd_construction
+total_person_days = production.person_days
 
 # Create grouped bar chart
 x_pos = np.arange(len(moai_masses))
@@ -194,21 +190,27 @@ for i, tpd in enumerate(total_person_days):
 # Assume rope lasts for 1-2 km of transport, then needs replacement
 # Transport distances from quarry: 1-18 km (average ~6 km)
 
-distances = np.array([0.5, 1, 2, 5, 10, 15, 18])  # km
-rope_lifetime_km = 1.5  # km per rope set (conservative estimate)
+distances = data['distances']  # km
+rope_lifetime_km = production.parameters.rope_lifetime_km  # km per rope set
 
 # Calculate cumulative person-days for each moai type over distance
 colors_line = ['green', 'blue', 'purple', 'orange', 'red']
 
-for i, (mass, label, color) in enumerate(zip(moai_masses, moai_labels, colors_line)):
-    # Number of rope sets needed
-    rope_sets_needed = np.ceil(distances / rope_lifetime_km)
-    # Cumulative person-days
-    cumulative_pd = rope_sets_needed * total_person_days[i]
-
+for label, color, cumulative_pd in zip(moai_labels, colors_line,
+                                       data['cumulative_person_days']):
     ax4.plot(distances, cumulative_pd, 'o-', linewidth=2, markersize=6,
              label=label.replace('\n', ' '), color=color, alpha=0.8)
 
+# Rope lifetime as a distribution: fatigue of Paro's ropes under simulated
+# walking load cycles (rainflow + S-N + Miner's rule, see rope_fatigue.py)
+lifetime_p10, lifetime_p90 = data['lifetime_p10'], data['lifetime_p90']
+distance_grid = np.linspace(distances[0], distances[-1], 500)
+ax4.fill_between(distance_grid,
+                 pm.rope_sets(distance_grid, lifetime_p90) * total_person_days[-1],
+                 pm.rope_sets(distance_grid, lifetime_p10) * total_person_days[-1],
+                 color='red', alpha=0.12, linewidth=0,
+                 label='Paro, fatigue\nlifetime P10–P90')
+
 ax4.set_xlabel('Transport Distance (km)', fontweight='bold')
 ax4.set_ylabel('Cumulative Person-Days (Rope Production)', fontweight='bold')
 ax4.set_title('D. Cumulative Labor Investment vs Transport Distance',
@@ -236,33 +238,37 @@ print("  - Fiber requirements scale with rope diameter²")
 print("  - Retting time: 38 days (can process multiple batches in parallel)")
 print("  - Rope lifetime: ~1.5 km of transport")
 print("\n" + "-"*70)
-print(f"{'Moai Type':<20} {'Mass':<8} {'Fiber':<10} {'Days':<8} {'Person-Days':<12} {'Ropes/6km'}")
+print(f"{'Moai Type':<20} {'Mass':<8} {'Fiber':<10} {'Days':<8} {'Par.':<6} {'Person-Days':<12} {'Ropes/6km'}")
 print("-"*70)
 
 for i, (mass, label) in enumerate(zip(moai_masses, moai_labels)):
     label_clean = label.replace('\n', ' ')
-    rope_sets_6km = np.ceil(6 / rope_lifetime_km)
-    cumulative_6km = rope_sets_6km * total_person_days[i]
+    rope_sets_6km = production.rope_sets_transport[i]
+    cumulative_6km = production.person_days_transport[i]
     print(f"{label_clean:<20} {mass:>6.1f}t {total_fiber_mass[i]:>8.1f}kg "
-          f"{total_time[i]:>6.0f}d {total_person_days[i]:>10.0f}pd "
+          f"{total_time[i]:>6.0f}d {parallel_time[i]:>4.0f}d {total_person_days[i]:>10.0f}pd "
           f"{rope_sets_6km:.0f} sets ({cumulative_6km:.0f}pd)")
 
 print("-"*70)
 print("\nKey Insights:")
 print("  • Rope production scales 2.8× from experimental to Paro")
 print("  • Most time is spent in retting (38 days), which can be parallelized")
-print("  • For average 6km transport, 4 rope sets needed (replacement every ~1.5km)")
+print(f"  • Retting 3 batches in parallel shortens Paro's rope set from "
+      f"{total_time[-1]:.0f} to {parallel_time[-1]:.0f} days "
+      f"(harvesting crew {parallel_schedule['utilization']['harvest'][-1]:.0%} busy)")
+print(f"  • For average 6km transport, {production.rope_sets_transport[-1]:.0f} rope sets "
+      f"needed (replacement every ~{rope_lifetime_km:g}km)")
+print(f"  • Fatigue model: Paro's ropes last {lifetime_p10:.1f}–{lifetime_p90:.1f} km "
+      f"(P10–P90), {pm.rope_sets(6, lifetime_p90):.0f}–{pm.rope_sets(6, lifetime_p10):.0f} "
+      f"rope sets for 6 km")
 print("  • Paro (86t) required ~" + f"{total_person_days[-1]:.0f}" +
       " person-days per rope set")
 print("  • Total investment for Paro over 6km: ~" +
-      f"{np.ceil(6/rope_lifetime_km) * total_person_days[-1]:.0f}" + " person-days")
+      f"{production.person_days_transport[-1]:.0f}" + " person-days")
 print("="*70 + "\n")
 
 # Save figure
 plt.tight_layout()
-import os
-os.makedirs('figures', exist_ok=True)
-plt.savefig('figures/figure13_rope_production_investment.png', dpi=600, bbox_inches='tight')
-plt.savefig('figures/figure13_rope_production_investment.pdf', dpi=600, bbox_inches='tight')
+save_figure(fig, 'figure13_rope_production_investment')
 print("Figure 13 saved: figures/figure13_rope_production_investment.png and .pdf\n")
 plt.show()
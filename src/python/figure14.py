@@ -10,15 +10,12 @@ import matplotlib.pyplot as plt
 import numpy as np
 from matplotlib.patches import Rectangle
 
-# Set publication-quality parameters
-plt.rcParams['font.family'] = 'serif'
-plt.rcParams['font.size'] = 10
-plt.rcParams['axes.labelsize'] = 11
-plt.rcParams['axes.titlesize'] = 12
-plt.rcParams['xtick.labelsize'] = 9
-plt.rcParams['ytick.labelsize'] = 9
-plt.rcParams['legend.fontsize'] = 9
-plt.rcParams['figure.dpi'] = 600
+from figure_export import save_figure
+import figure_data as fd
+import figure_style as fs
+
+# Set publication-quality parameters (draft resolution with ROPE_DRAFT=1)
+fs.apply_style()
 
 # Create figure
 fig = plt.figure(figsize=(15, 10))
@@ -30,17 +27,15 @@ gs = fig.add_gridspec(2, 3, height_ratios=[1.2, 1.3], hspace=0.4, wspace=0.35)
 # DATA FOR MOAI SPECIMENS
 # ============================================================================
 
-moai_masses = np.array([4.3, 18, 40, 60, 82])
+# Same cached production chain as Figure 13 (production_model.py,
+# see figure_data.py)
+data = fd.figure14()
+production = data['production']
+
+moai_masses = production.masses
 
-# Calculate rope diameters using correct formula with packing efficiency
-tensile_strength = 916  # MPa
-packing_efficiency = 0.65  # fiber packing efficiency (65%)
-construction_efficiency = 0.75  # rope construction efficiency (75%)
-safety_factor = 10
-working_load = moai_masses * 1.0  # kN/ton
-required_breaking_load = working_load * safety_factor
-rope_diameters = 2 * np.sqrt(required_breaking_load * 1000 /
-                             (tensile_strength * packing_efficiency * construction_efficiency * np.pi))
+# Rope diameters from the shared rope model (with packing efficiency)
+rope_diameters = production.diameter
 
 moai_data = {
     'names': ['Experimental\nReplica\n(Hunt & Lipo)',
@@ -53,11 +48,16 @@ moai_data = {
     'colors': ['#2ecc71', '#3498db', '#9b59b6', '#e67e22', '#e74c3c']
 }
 
-# Calculate derived metrics
-fiber_mass = np.array([3.4, 14.4, 32.0, 48.0, 68.9])  # kg
-production_days = np.array([70, 75, 84, 92, 102])  # days
-person_days = np.array([78, 107, 145, 178, 218])  # person-days per rope set
-person_days_6km = np.array([311, 427, 581, 710, 871])  # cumulative for 6km transport
+# Derived metrics
+fiber_mass = production.fiber_mass  # kg
+production_days = production.production_days  # days
+person_days = production.person_days  # person-days per rope set
+person_days_6km = production.person_days_transport  # cumulative for 6km transport
+transport_km = production.parameters.transport_distance_km
+transport_sets = production.rope_sets_transport[0]
+
+# Daily labor capacity of the community (~3,500 people, 20% working age)
+daily_capacity = data['daily_capacity']  # person-days per day
 
 # ============================================================================
 # TOP PANEL: Moai Silhouettes with Rope Requirements
@@ -115,14 +115,16 @@ ax_top.set_title('Moai Size and Corresponding Rope Requirements',
 ax_ml = fig.add_subplot(gs[1, 0])
 
 # Stacked horizontal bar chart showing timeline breakdown
-stages = ['Harvesting\n& Processing', 'Retting\n(38 days)',
+stages = ['Harvesting\n& Processing',
+          f'Retting\n({production.parameters.retting_days:.0f} days)',
           'Drying &\nPreparation', 'Rope\nConstruction']
 
-# Time breakdown (days) for each stage
-harvesting = fiber_mass * 0.5
-retting = np.ones(len(moai_data['names'])) * 38
-preparation = np.ones(len(moai_data['names'])) * 3
-construction = np.array([27, 27, 29, 32, 41])
+# Time breakdown (days) for each stage along the serial schedule
+critical_days = production.serial_schedule['critical_days']
+harvesting = critical_days['harvest']
+retting = critical_days['retting']
+preparation = critical_days['preparation']
+construction = critical_days['construction']
 
 y_positions = np.arange(len(moai_data['names']))
 
@@ -140,7 +142,7 @@ ax_ml.barh(y_positions, construction, left=harvesting+retting+preparation,
 
 # Add total time labels
 for i, total in enumerate(production_days):
-    ax_ml.text(total + 2, i, f'{total}d', va='center', fontsize=9,
+    ax_ml.text(total + 2, i, f'{total:.0f}d', va='center', fontsize=9,
                fontweight='bold')
 
 ax_ml.set_yticks(y_positions)
@@ -150,7 +152,7 @@ ax_ml.set_xlabel('Production Time (days)', fontweight='bold')
 ax_ml.set_title('A. Production Timeline per Rope Set', fontweight='bold')
 ax_ml.legend(loc='lower right', fontsize=7, framealpha=0.9)
 ax_ml.grid(True, alpha=0.3, axis='x')
-ax_ml.set_xlim(0, 120)
+ax_ml.set_xlim(0, max(production_days) * 1.15)
 
 # Add note about parallelization
 ax_ml.text(0.98, 0.05, 'Note: Retting can be\nparallelized across batches',
@@ -204,20 +206,25 @@ bars1 = ax_bl.bar(x_pos - width/2, person_days, width,
                   label='Single Rope Set', color='lightblue',
                   alpha=0.7, edgecolor='black', linewidth=1)
 bars2 = ax_bl.bar(x_pos + width/2, person_days_6km, width,
-                  label='6 km Transport (4 sets)', color='darkblue',
+                  label=f'{transport_km:g} km Transport ({transport_sets:.0f} sets)',
+                  color='darkblue',
                   alpha=0.7, edgecolor='black', linewidth=1)
 
 ax_bl.set_xticks(x_pos)
 ax_bl.set_xticklabels([f'{m:.0f}t' for m in moai_data['masses']], fontsize=9)
 ax_bl.set_xlabel('Moai Mass (tons)', fontweight='bold')
 ax_bl.set_ylabel('Cumulative Person-Days', fontweight='bold')
-ax_bl.set_title('C. Single Set vs 6 km Transport Investment', fontweight='bold')
+ax_bl.set_title(f'C. Single Set vs {transport_km:g} km Transport Investment',
+                fontweight='bold')
 ax_bl.legend(loc='upper left', fontsize=8)
 ax_bl.grid(True, alpha=0.3, axis='y')
+ax_bl.set_ylim(0, max(person_days_6km) * 1.4)
 
 # Add callout for Paro
-ax_bl.annotate('Paro: 871 person-days\nfor 6 km transport',
-               xy=(4, person_days_6km[4]), xytext=(3, person_days_6km[4] + 200),
+ax_bl.annotate(f'Paro: {person_days_6km[4]:,.0f} person-days\n'
+               f'for {transport_km:g} km transport',
+               xy=(4, person_days_6km[4]),
+               xytext=(2.4, person_days_6km[4] * 1.18),
                arrowprops=dict(arrowstyle='->', color='red', lw=2),
                fontsize=9, color='red', fontweight='bold',
                bbox=dict(boxstyle='round,pad=0.5', facecolor='yellow', alpha=0.5))
@@ -231,10 +238,7 @@ plt.suptitle('Rope Production Investment: Time and Labor Requirements Across Moa
              fontsize=14, fontweight='bold', y=0.98)
 
 plt.tight_layout()
-import os
-os.makedirs('figures', exist_ok=True)
-plt.savefig('figures/figure14_rope_investment_comparison.png', dpi=600, bbox_inches='tight')
-plt.savefig('figures/figure14_rope_investment_comparison.pdf', dpi=600, bbox_inches='tight')
+save_figure(fig, 'figure14_rope_investment_comparison')
 
 # Print summary table
 print("\n" + "="*90)
@@ -245,7 +249,7 @@ print("-"*90)
 
 for i, name in enumerate(moai_data['names']):
     name_clean = name.replace('\n', ' ')
-    pct_daily = (person_days_6km[i] / 700) * 100  # assuming 700 pd/day capacity (3,500 pop)
+    pct_daily = (person_days_6km[i] / daily_capacity) * 100
     print(f"{name_clean:<25} {moai_data['masses'][i]:>6.1f}t "
           f"{moai_data['diameters'][i]:>7.1f}mm {production_days[i]:>5.0f}d "
           f"{person_days[i]:>7.0f}pd {person_days_6km[i]:>8.0f}pd {pct_daily:>10.1f}%")
@@ -256,7 +260,7 @@ print(f"  • Production time range: {min(production_days):.0f}-{max(production_
 print(f"  • Labor per set range: {min(person_days):.0f}-{max(person_days):.0f} person-days")
 print(f"  • 6km transport range: {min(person_days_6km):.0f}-{max(person_days_6km):.0f} person-days")
 print(f"  • Scaling factor: {person_days[-1]/person_days[0]:.1f}× (Paro vs Experimental)")
-print(f"  • Max investment: {max(person_days_6km):.0f} pd = {max(person_days_6km)/700:.1%} of daily community capacity")
+print(f"  • Max investment: {max(person_days_6km):.0f} pd = {max(person_days_6km)/daily_capacity:.1%} of daily community capacity")
 print("\nConclusion: Rope production was FEASIBLE for all transported moai.")
 print("Size limits reflect organizational/physiological constraints, not production capacity.")
 print("="*90 + "\n")
@@ -267,9 +271,13 @@ print("=" * 70)
 print("Population: ~3,000-4,000 people (peak period)")
 print("Daily labor capacity: ~600-800 person-days (20% working age)")
 print("\nRope investment for 6km transport as % of daily capacity:")
-print("  • Experimental (4.3t): 311 pd = ~44% (~11 hours)")
-print("  • Typical (18t): 427 pd = ~61% (~15 hours)")
-print("  • Paro (86t): 871 pd = ~124% (~1.2 days)")
+for i in (0, 1, len(moai_masses) - 1):
+    share = person_days_6km[i] / daily_capacity
+    duration = (f'~{share * 24:.0f} hours' if share < 1
+                else f'~{share:.1f} days')
+    short_name = moai_data['names'][i].split('\n')[0]
+    print(f"  • {short_name} ({moai_masses[i]:g}t): "
+          f"{person_days_6km[i]:,.0f} pd = ~{share:.0%} ({duration})")
 print("\nConclusion: All rope production requirements were well within")
 print("community capacity. Size limits reflect organizational constraints")
 print("(rope handling, coordination) not material or production capacity.")
@@ -7,17 +7,16 @@ This script generates a two-panel figure showing:
 """
 
 import matplotlib.pyplot as plt
-import numpy as np
-
-# Set publication-quality parameters
-plt.rcParams['font.family'] = 'serif'
-plt.rcParams['font.size'] = 10
-plt.rcParams['axes.labelsize'] = 11
-plt.rcParams['axes.titlesize'] = 12
-plt.rcParams['xtick.labelsize'] = 9
-plt.rcParams['ytick.labelsize'] = 9
-plt.rcParams['legend.fontsize'] = 9
-plt.rcParams['figure.dpi'] = 600
+
+from figure_export import save_figure
+import figure_data as fd
+import figure_style as fs
+
+# Set publication-quality parameters (draft resolution with ROPE_DRAFT=1)
+fs.apply_style()
+
+# All plotted numbers (see figure_data.py)
+data = fd.figure9()
 
 # Create figure with two subplots
 fig, (ax_left, ax_right) = plt.subplots(1, 2, figsize=(12, 5))
@@ -26,19 +25,11 @@ fig, (ax_left, ax_right) = plt.subplots(1, 2, figsize=(12, 5))
 # LEFT PANEL: Breaking Load vs Diameter
 # ============================================================================
 
-# Parameters
-diameters = np.linspace(5, 60, 100)  # mm
-tensile_strength = 916  # MPa for T. cordifolia
-packing_efficiency = 0.65  # fiber packing efficiency (65%)
-construction_efficiency = 0.75  # rope construction efficiency (75%)
+# Parameters (916 MPa, 65% packing, 75% construction efficiency; see rope_mechanics.py)
+diameters = data['diameters']  # mm
 
-# Calculate cross-sectional area
-area = np.pi * (diameters/2)**2  # mm^2
-effective_area = area * packing_efficiency  # account for fiber packing
-
-# Calculate breaking load
 # Breaking Load (N) = Tensile Strength (MPa) × Effective Area (mm²) × Construction Efficiency
-breaking_load = tensile_strength * effective_area * construction_efficiency / 1000  # Convert to kN
+breaking_load = data['breaking_load']  # kN
 
 # Plot main curve
 ax_left.plot(diameters, breaking_load, 'b-', linewidth=2, 
@@ -52,22 +43,16 @@ ax_left.axhline(y=80, color='orange', linestyle='--', linewidth=1.5,
                 label='80 ton moai requirement (~80 kN)')
 
 # Add safety factor line
-safety_factor_8 = breaking_load / 8
+safety_factor_8 = breaking_load / data['margin_factor']
 ax_left.plot(diameters, safety_factor_8, 'r--', linewidth=1, alpha=0.5, 
              label='Breaking load / 8 (safety margin)')
 
-# Mark specific points
-diameter_10mm = 10
-idx_10 = np.argmin(np.abs(diameters - diameter_10mm))
-ax_left.plot(diameter_10mm, breaking_load[idx_10], 'ro', markersize=8)
-ax_left.text(diameter_10mm, breaking_load[idx_10] + 20, f'10 mm\n{breaking_load[idx_10]:.0f} kN',
-             ha='center', fontsize=8)
-
-diameter_45mm = 45
-idx_45 = np.argmin(np.abs(diameters - diameter_45mm))
-ax_left.plot(diameter_45mm, breaking_load[idx_45], 'ro', markersize=8)
-ax_left.text(diameter_45mm, breaking_load[idx_45] + 40, f'45 mm\n{breaking_load[idx_45]:.0f} kN',
-             ha='center', fontsize=8)
+# Mark specific points (10 mm and 45 mm)
+for diameter, load, offset in zip(data['marked_diameters'], data['marked_loads'],
+                                  (20, 40)):
+    ax_left.plot(diameter, load, 'ro', markersize=8)
+    ax_left.text(diameter, load + offset, f'{diameter} mm\n{load:.0f} kN',
+                 ha='center', fontsize=8)
 
 # Labels and formatting
 ax_left.set_xlabel('Rope Diameter (mm)')
@@ -83,22 +68,20 @@ ax_left.set_ylim(0, 1200)
 # ============================================================================
 
 # Moai masses to analyze
-moai_masses = np.array([4, 10, 20, 40, 60, 80, 82])  # tons
+paro_mass = data['paro_mass']
+moai_masses = data['moai_masses']  # tons
 
-# Assume working load = 1 kN per ton (simplified estimate)
-force_per_rope = moai_masses * 1000  # N
-
-# Safety factor
-safety_factor = 10
-
-# Required breaking load
-required_breaking_load = force_per_rope * safety_factor / 1000  # kN
-
-# Calculate required diameter from breaking load
+# Assume working load = 1 kN per ton (simplified estimate), safety factor 10
 # Rearranging: Breaking Load = Tensile Strength × π × (d/2)² × Packing Efficiency × Construction Efficiency
 # d = 2 × sqrt(Breaking Load / (Tensile Strength × π × Packing Efficiency × Construction Efficiency))
-required_diameter = 2 * np.sqrt(required_breaking_load * 1000 /
-                                (tensile_strength * packing_efficiency * construction_efficiency * np.pi))
+required_diameter = data['required_diameter']
+
+# Parameter uncertainty envelope (tensile strength, packing, construction
+# efficiency and load per ton sampled; see rope_uncertainty.py)
+mass_grid = data['mass_grid']
+bands = data['bands']
+ax_right.fill_between(mass_grid, bands[5], bands[95], alpha=0.15, color='blue',
+                      label='5–95% range (parameter uncertainty)')
 
 # Plot required diameter vs mass
 ax_right.plot(moai_masses, required_diameter, 'b-o', linewidth=2, markersize=6)
@@ -110,10 +93,9 @@ ax_right.fill_between(moai_masses, 50, 70, alpha=0.2, color='red',
                        label='Difficult to handle')
 
 # Mark Paro
-paro_mass = 82
-paro_idx = np.argmin(np.abs(moai_masses - paro_mass))
-ax_right.plot(paro_mass, required_diameter[paro_idx], 'r*', markersize=15)
-ax_right.text(paro_mass, required_diameter[paro_idx] + 3, f'Paro\n(82 tons, {required_diameter[paro_idx]:.0f} mm)',
+paro_diameter = data['paro_diameter']
+ax_right.plot(paro_mass, paro_diameter, 'r*', markersize=15)
+ax_right.text(paro_mass, paro_diameter + 3, f'Paro\n({paro_mass:.0f} tons, {paro_diameter:.0f} mm)',
               ha='center', fontsize=9, weight='bold')
 
 # Labels and formatting
@@ -127,9 +109,6 @@ ax_right.set_ylim(0, 70)
 
 # Save figure
 plt.tight_layout()
-import os
-os.makedirs('figures', exist_ok=True)
-plt.savefig('figures/figure9_tensile_strength_scaling.png', dpi=600, bbox_inches='tight')
-plt.savefig('figures/figure9_tensile_strength_scaling.pdf', dpi=600, bbox_inches='tight')
+save_figure(fig, 'figure9_tensile_strength_scaling')
 print("Figure 9 saved: figures/figure9_tensile_strength_scaling.png and .pdf")
 plt.show()
@@ -0,0 +1,237 @@
+"""
+Figure Data: The Numbers Behind Each Figure, Without Matplotlib
+
+Every figure script draws what one function here computes, so the numbers a
+figure shows can be checked (or printed, or exported) without importing
+matplotlib or rendering anything:
+
+    import figure_data as fd
+    data = fd.figure9()                                  # paper model
+    data = fd.figure9(packing_efficiency=1.0, paro_mass=86, n_samples=0)
+
+Each function returns a dict of arrays and scalars. Rope-strength inputs
+(tensile_strength, packing_efficiency, construction_efficiency,
+load_per_ton) can be overridden as keyword arguments, and `paro_mass`
+replaces the catalog mass of Paro, which is how the corrected captions
+(no packing efficiency, 86 t) are reproduced by verify_captions.py.
+Monte Carlo envelopes use `n_samples` samples (default: the draft or
+publication count from figure_style); n_samples=0 skips them.
+
+Usage:
+    python3 figure_data.py      # print every figure's key values (headless)
+"""
+
+import numpy as np
+
+import figure_style as fs
+import grip_model as gm
+import moai_catalog as mc
+import production_model as pm
+import rope_fatigue as rf
+import rope_mechanics as rm
+import rope_uncertainty as ru
+
+ROPE_PARAMETERS = ('tensile_strength', 'packing_efficiency',
+                   'construction_efficiency', 'load_per_ton')
+
+
+def _rope(rope):
+    """Validated rope-model overrides (keys of ROPE_PARAMETERS)"""
+    unknown = set(rope) - set(ROPE_PARAMETERS)
+    if unknown:
+        raise ValueError(f"Unknown rope parameter(s) {sorted(unknown)} "
+                         f"(choose from {ROPE_PARAMETERS})")
+    return rope
+
+
+def _strength(rope):
+    """Overrides that breaking_load() accepts (all but load_per_ton)"""
+    return {name: value for name, value in rope.items() if name != 'load_per_ton'}
+
+
+def _masses(names, paro_mass):
+    """Catalog masses of `names`, with Paro's replaced by `paro_mass`"""
+    masses = mc.masses(names)
+    if paro_mass is not None:
+        masses[names.index('Paro')] = paro_mass
+    return masses
+
+
+def _bands(mass_grid, n_samples):
+    """5-95% diameter envelope over `mass_grid`, or None for n_samples=0"""
+    if n_samples is None:
+        n_samples = fs.monte_carlo_samples()
+    if not n_samples:
+        return None
+    return ru.simulate_diameter_bands(mass_grid, n_samples=n_samples,
+                                      percentiles=(5, 95))
+
+
+# ============================================================================
+# FIGURES 9-12: ROPE DIAMETER
+# ============================================================================
+
+def figure9(paro_mass=None, n_samples=None, **rope):
+    """Breaking load vs diameter (left) and diameter vs mass (right)"""
+    rope = _rope(rope)
+    diameters = np.linspace(5, 60, 100)  # mm
+    breaking_load = rm.breaking_load(diameters, **_strength(rope))  # kN
+    # Labelled points are the curve samples nearest 10 and 45 mm
+    marked = np.array([10, 45])
+    marked_index = np.abs(diameters[None, :] - marked[:, None]).argmin(axis=1)
+
+    paro_mass = mc.mass('Paro') if paro_mass is None else paro_mass
+    moai_masses = np.array([4, 10, 20, 40, 60, 80, paro_mass])  # tons
+    safety_factor = 10
+    required_diameter = rm.diameter_from_mass(moai_masses,
+                                              safety_factor=safety_factor, **rope)
+    mass_grid = np.linspace(1, 90, 40)
+    return {'diameters': diameters, 'breaking_load': breaking_load,
+            'margin_factor': 8, 'marked_diameters': marked,
+            'marked_loads': breaking_load[marked_index],
+            'moai_masses': moai_masses, 'safety_factor': safety_factor,
+            'required_diameter': required_diameter,
+            'paro_mass': paro_mass, 'paro_diameter': required_diameter[-1],
+            'handling_limit': 50,
+            'mass_grid': mass_grid, 'bands': _bands(mass_grid, n_samples)}
+
+
+def figure10(paro_mass=None, **rope):
+    """Hand grip limits against the rope diameters of four moai masses"""
+    rope = _rope(rope)
+    hand_circumference = np.array([180, 190, 200, 210, 220])  # mm
+    paro_mass = mc.mass('Paro') if paro_mass is None else paro_mass
+    masses = np.array([4, 15, 80, paro_mass])
+    diameters = rm.diameter_from_mass(masses, **rope)
+
+    grip = gm.GripModel()
+    diameter_grid = np.linspace(0, 70, 701)
+    return {'hand_circumference': hand_circumference,
+            'max_grip_comfortable': hand_circumference * gm.COMFORTABLE_RATIO / np.pi,
+            'max_grip_limit': hand_circumference * gm.MAXIMUM_RATIO / np.pi,
+            'masses': masses, 'diameters': diameters, 'paro_mass': paro_mass,
+            'handling_limit': 50,
+            'diameter_grid': diameter_grid,
+            'share_comfortable': grip.workforce_fraction(diameter_grid, 'comfortable'),
+            'share_maximum': grip.workforce_fraction(diameter_grid, 'maximum'),
+            'marked_comfortable': grip.workforce_fraction(diameters, 'comfortable'),
+            'marked_maximum': grip.workforce_fraction(diameters, 'maximum')}
+
+
+FIGURE11_SPECIMENS = ['Typical quarry moai', 'Typical road moai',
+                      'Typical platform moai', 'Paro']
+
+
+def figure11(paro_mass=None, **rope):
+    """Rope diameter, mass and team size by moai category"""
+    rope = _rope(rope)
+    typical_mass = _masses(FIGURE11_SPECIMENS, paro_mass)  # tons
+    safety_factor = 10
+    rope_diameter = rm.diameter_from_mass(typical_mass, safety_factor=safety_factor,
+                                          **rope)
+    return {'typical_mass': typical_mass, 'safety_factor': safety_factor,
+            'rope_diameter': rope_diameter, 'paro_diameter': rope_diameter[3],
+            'people_required': np.array([10, 8, 10, 60]),  # per rope team
+            'handling_limit': 50}
+
+
+FIGURE12_SPECIMENS = ['Experimental Replica', 'Ahu Akivi (typical)', 'Paro',
+                      'Ahu Tongariki (largest)', 'Te Tokanga']
+
+
+def figure12(paro_mass=None, n_samples=None, **rope):
+    """Named specimens (top) and the continuous mass-diameter curve (bottom)"""
+    rope = _rope(rope)
+    moai_masses = _masses(FIGURE12_SPECIMENS, paro_mass)  # tons
+    safety_factors = np.array([[10], [5]])
+    diameter_sf10, diameter_sf5 = rm.diameter_from_mass(
+        moai_masses, safety_factor=safety_factors, **rope)
+
+    moai_range = np.linspace(1, 300, 500)
+    range_sf10, range_sf5 = rm.diameter_from_mass(
+        moai_range, safety_factor=safety_factors, **rope)
+    mass_grid = np.linspace(1, 300, 60)
+    return {'moai_masses': moai_masses, 'safety_factors': safety_factors.ravel(),
+            'diameter_sf10': diameter_sf10, 'diameter_sf5': diameter_sf5,
+            'grip_thresholds': (40, 50, 70),  # difficult, maximum, impossible
+            'transport_limit_mass': 90,
+            'moai_range': moai_range, 'range_sf10': range_sf10,
+            'range_sf5': range_sf5,
+            'mass_grid': mass_grid, 'bands': _bands(mass_grid, n_samples)}
+
+
+# ============================================================================
+# FIGURES 13-14: ROPE PRODUCTION
+# ============================================================================
+
+def figure13(fatigue_ropes=200):
+    """Production chain, transport sweep and Paro's fatigue lifetime band.
+
+    fatigue_ropes=0 skips the fatigue simulation.
+    """
+    production = pm.production_model()
+    distances = np.array([0.5, 1, 2, 5, 10, 15, 18])  # km
+    rope_sets = pm.rope_sets(distances, production.parameters.rope_lifetime_km)
+    data = {'production': production, 'distances': distances,
+            'cumulative_person_days': rope_sets * production.person_days[:, None],
+            'lifetime_p10': None, 'lifetime_p90': None}
+    if fatigue_ropes:
+        lifetime = rf.km_to_failure(production.masses[-1], n_ropes=fatigue_ropes)
+        data['lifetime_p10'], data['lifetime_p90'] = np.percentile(lifetime, [10, 90])
+    return data
+
+
+def figure14():
+    """Production chain against the community's daily labor capacity"""
+    production = pm.production_model()
+    daily_capacity = 700  # person-days per day (~3,500 people, 20% working age)
+    return {'production': production, 'daily_capacity': daily_capacity,
+            'capacity_share': production.person_days_transport / daily_capacity}
+
+
+# Not upper-case: build_figures.py hashes upper-case globals as model parameters
+figure_functions = {9: figure9, 10: figure10, 11: figure11, 12: figure12,
+                    13: figure13, 14: figure14}
+
+
+if __name__ == '__main__':
+    import sys
+    import time
+
+    start = time.perf_counter()
+    fig9 = figure9(n_samples=0)
+    fig10 = figure10()
+    fig11 = figure11()
+    fig12 = figure12(n_samples=0)
+    fig13 = figure13(fatigue_ropes=0)
+    fig14 = figure14()
+    elapsed = time.perf_counter() - start
+    production = fig13['production']
+
+    print("=" * 70)
+    print("FIGURE DATA (headless, paper model)")
+    print("=" * 70)
+    print("Figure 9:  " + ", ".join(
+        f"{d} mm = {load:.0f} kN" for d, load in
+        zip(fig9['marked_diameters'], fig9['marked_loads'])) +
+        f"; Paro ({fig9['paro_mass']:g} t) {fig9['paro_diameter']:.1f} mm")
+    print("Figure 10: " + ", ".join(
+        f"{m:g} t = {d:.1f} mm" for m, d in zip(fig10['masses'], fig10['diameters'])))
+    print("Figure 11: " + ", ".join(
+        f"{m:g} t = {d:.1f} mm" for m, d in
+        zip(fig11['typical_mass'], fig11['rope_diameter'])))
+    print("Figure 12: " + ", ".join(
+        f"{m:g} t = {d10:.1f}/{d5:.1f} mm" for m, d10, d5 in
+        zip(fig12['moai_masses'], fig12['diameter_sf10'], fig12['diameter_sf5'])) +
+        " (SF=10/5)")
+    print("Figure 13: person-days per set " +
+          "/".join(f"{pd:.0f}" for pd in production.person_days) +
+          ", serial days " +
+          "/".join(f"{d:.0f}" for d in production.production_days))
+    print(f"Figure 14: Paro over {production.parameters.transport_distance_km:g} km "
+          f"{production.person_days_transport[-1]:,.0f} person-days = "
+          f"{fig14['capacity_share'][-1]:.1f} days of community labor")
+    print("-" * 70)
+    print(f"Computed in {elapsed * 1000:.0f} ms; matplotlib imported: "
+          f"{'matplotlib' in sys.modules}")
+    print("=" * 70)
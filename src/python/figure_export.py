@@ -0,0 +1,283 @@
+"""
+Figure Export: Render Once, Write Every Format
+
+`plt.savefig(..., bbox_inches='tight')` draws the figure twice per call (once
+to measure the tight bounding box, once to render), so saving a PNG and a PDF
+costs four full draws. save_figure draws the figure once on an Agg canvas,
+measures the tight bounding box from that draw, crops the PNG (and optional
+TIFF) straight from the rendered RGBA buffer, and writes the vector formats
+(PDF, SVG) with the precomputed bounding box. Raster encodes run in a thread
+pool while the vector formats are written.
+
+Usage:
+    fig, ax = plt.subplots()
+    ...
+    plt.tight_layout()
+    save_figure(fig, 'figure9_tensile_strength_scaling')
+
+Resolution, formats and output directory default to figure_style, which
+switches them to a fast PNG-only preview in draft mode (ROPE_DRAFT=1).
+
+Raster outputs are lossless: fully opaque renders are stored as RGB rather
+than RGBA, and publication PNGs are written with Pillow's optimizer. The
+same buffer also yields the derivatives (figure_style.output_derivatives()):
+`<name>_web.png` and `<name>_web.webp` (lossless) at WEB_DPI, and a
+`<name>_thumb.png` of THUMBNAIL_PIXELS on the longest side, downsampled
+once from the render and encoded in the thread pool with the other
+formats.
+
+In compact mode (ROPE_COMPACT=1, or compact=True) the vector formats are
+written smaller: after the raster draw, line and fill paths are simplified
+to figure_style.COMPACT_TOLERANCE_PT (dense fill_between polygons collapse
+to their visible corners), fills that still have more than
+COMPACT_RASTER_VERTICES vertices are rasterized at the output dpi, and
+fonts are embedded as TrueType subsets instead of Type 3 glyph procedures.
+The raster outputs are unaffected. Rasterizing simple fills at 600 dpi
+makes a PDF larger, not smaller, so only complex ones are rasterized.
+"""
+
+import concurrent.futures
+import io
+import os
+
+import matplotlib
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import PolyCollection
+from matplotlib.path import Path
+from matplotlib.transforms import Bbox
+from PIL import Image
+from PIL.PngImagePlugin import PngInfo
+
+import figure_style
+
+RASTER_FORMATS = ('png', 'tif', 'tiff')
+VECTOR_FORMATS = ('pdf', 'svg')
+
+
+def _opaque(image):
+    """`image` as RGB if its alpha channel is fully opaque (lossless)"""
+    if image.mode == 'RGBA' and image.getextrema()[3][0] == 255:
+        return image.convert('RGB')
+    return image
+
+
+def _encode(image, path, fmt, dpi, optimize=False):
+    """Write a Pillow image as PNG, WebP (lossless) or TIFF"""
+    if fmt == 'png':
+        info = PngInfo()
+        info.add_text('Software', f'Matplotlib version{matplotlib.__version__}, '
+                                  'https://matplotlib.org/')
+        image.save(path, format='PNG', dpi=(dpi, dpi), pnginfo=info,
+                   optimize=optimize)
+    elif fmt == 'webp':
+        image.save(path, format='WEBP', lossless=True)
+    else:
+        image.save(path, format='TIFF', dpi=(dpi, dpi), compression='tiff_lzw')
+    return path
+
+
+def _write_raster(pixels, path, fmt, dpi):
+    """Encode an RGBA pixel array with Pillow (optimized unless drafting)"""
+    image = _opaque(Image.fromarray(pixels, 'RGBA'))
+    return _encode(image, path, fmt, dpi, optimize=not figure_style.is_draft())
+
+
+def _write_derivative(image, path, fmt, dpi):
+    """Encode a downsampled derivative image"""
+    return _encode(image, path, fmt, dpi, optimize=True)
+
+
+def _downsample(image, scale):
+    """`image` scaled by `scale` < 1: a box filter for integer factors
+    (600 -> 150 dpi), Lanczos otherwise"""
+    factor = 1 / scale
+    if abs(factor - round(factor)) < 1e-9:
+        return image.reduce(int(round(factor)))
+    size = (max(1, round(image.width * scale)), max(1, round(image.height * scale)))
+    return image.resize(size, Image.LANCZOS, reducing_gap=2.0)
+
+
+def derivative_images(image, dpi, derivatives):
+    """Downsampled copies of `image` (rendered at `dpi`) needed by
+    `derivatives` ('web.png', 'thumb.png', ...): {kind: (image, dpi)}"""
+    kinds = {name.split('.')[0] for name in derivatives}
+    unknown = kinds - {'web', 'thumb'}
+    if unknown:
+        raise ValueError(f"Unknown derivative(s) {sorted(unknown)} "
+                         "(choose from 'web', 'thumb')")
+    images = {}
+    web = image
+    web_dpi = dpi
+    if dpi > figure_style.WEB_DPI:
+        web = _downsample(image, figure_style.WEB_DPI / dpi)
+        web_dpi = figure_style.WEB_DPI
+    if 'web' in kinds:
+        images['web'] = (web, web_dpi)
+    if 'thumb' in kinds:
+        thumb = web.copy()
+        thumb.thumbnail((figure_style.THUMBNAIL_PIXELS,) * 2, Image.LANCZOS)
+        images['thumb'] = (thumb, web_dpi * thumb.width / web.width)
+    return images
+
+
+def _crop_box(bbox_inches, fig, dpi):
+    """Pixel rows/columns of the tight bbox in the Agg buffer, or None if it
+    extends past the figure edges (then the buffer cannot simply be cropped)"""
+    width, height = fig.canvas.get_width_height()
+    # Same output size as savefig, which truncates the bbox size to pixels
+    # (with a little slack for floating-point noise in the bbox)
+    x0 = int(round(bbox_inches.x0 * dpi))
+    x1 = x0 + int(bbox_inches.width * dpi + 1e-6)
+    # Buffer rows run top to bottom; figure coordinates bottom to top
+    y0 = int(round(height - bbox_inches.y1 * dpi))
+    y1 = y0 + int(bbox_inches.height * dpi + 1e-6)
+    if x0 < 0 or y0 < 0 or x1 > width or y1 > height:
+        return None
+    return slice(y0, y1), slice(x0, x1)
+
+
+def rasterize_fills(fig, min_vertices=0, hatches=True):
+    """Rasterize filled areas (fill_between, stacked fills) with more than
+    `min_vertices` vertices, and hatched patches, in vector output; lines
+    and text stay vector"""
+    for ax in fig.axes:
+        for collection in ax.collections:
+            if isinstance(collection, PolyCollection) and sum(
+                    len(path.vertices) for path in collection.get_paths()) > min_vertices:
+                collection.set_rasterized(True)
+        if hatches:
+            for patch in ax.patches:
+                if patch.get_hatch():
+                    patch.set_rasterized(True)
+
+
+def _simplified_polygon(path, transform, threshold):
+    """Vertices of a closed polygon simplified in display space"""
+    # Matplotlib only simplifies paths without curve or close codes
+    outline = Path(path.vertices)
+    outline.simplify_threshold = threshold
+    cleaned = outline.cleaned(transform=transform, simplify=True)
+    return transform.inverted().transform(cleaned.vertices[cleaned.codes != Path.STOP])
+
+
+def simplify_paths(fig, tolerance_pt):
+    """Drop line and fill vertices that deviate less than `tolerance_pt`
+    points from the simplified outline"""
+    # Simplification works in display units: fills are simplified here, in
+    # pixels at the figure dpi; lines when drawn, in vector-format points
+    threshold = tolerance_pt * fig.dpi / 72
+    for ax in fig.axes:
+        for line in ax.lines:
+            # Applies to the line only; markers keep every vertex
+            line.get_path().simplify_threshold = tolerance_pt
+        for collection in ax.collections:
+            if not isinstance(collection, PolyCollection):
+                continue
+            paths = collection.get_paths()
+            if any(path.codes is not None and
+                   (path.codes > Path.LINETO).sum() > 1 for path in paths):
+                continue  # curves or several closed loops; leave as is
+            transform = collection.get_transform()
+            collection.set_verts([_simplified_polygon(path, transform, threshold)
+                                  for path in paths])
+
+
+def compact_vector_output(fig):
+    """Prepare `fig` for small vector files (see compact mode above)"""
+    simplify_paths(fig, figure_style.COMPACT_TOLERANCE_PT)
+    rasterize_fills(fig, figure_style.COMPACT_RASTER_VERTICES, hatches=False)
+
+
+def vector_rc(compact):
+    """rcParams for writing vector formats"""
+    if not compact:
+        return {}
+    return {'pdf.fonttype': figure_style.COMPACT_FONTTYPE,
+            'ps.fonttype': figure_style.COMPACT_FONTTYPE}
+
+
+def save_figure(fig, basename, formats=None, dpi=None, pad_inches=None,
+                compact=None, derivatives=None):
+    """Save `fig` as basename.<fmt> for every format with a tight bounding box.
+
+    A bare `basename` is placed in figure_style.output_dir(); `formats`,
+    `dpi`, `compact` and `derivatives` (e.g. ('web.png', 'thumb.png'),
+    written as basename_web.png, ...) default to the publication (or draft,
+    or compact) settings. The figure is drawn once on Agg at `dpi`; that
+    draw provides the tight bounding box, the raster outputs and the
+    derivatives. Returns the written paths.
+    """
+    if formats is None:
+        formats = figure_style.output_formats()
+    if derivatives is None:
+        derivatives = figure_style.output_derivatives()
+    if dpi is None:
+        dpi = figure_style.figure_dpi()
+    if compact is None:
+        compact = figure_style.is_compact()
+    if figure_style.is_draft():
+        rasterize_fills(fig)
+    directory = os.path.dirname(basename)
+    if not directory:
+        directory = figure_style.output_dir()
+        basename = os.path.join(directory, basename)
+    os.makedirs(directory, exist_ok=True)
+    if pad_inches is None:
+        pad_inches = matplotlib.rcParams['savefig.pad_inches']
+
+    original_canvas = fig.canvas
+    original_dpi = fig.dpi
+    try:
+        fig.set_dpi(dpi)
+        canvas = FigureCanvasAgg(fig)
+        canvas.draw()
+        renderer = canvas.get_renderer()
+        tight = fig.get_tightbbox(renderer).padded(pad_inches)
+        bbox = Bbox(tight.get_points())
+        crop = _crop_box(bbox, fig, dpi)
+        raster_formats = [fmt for fmt in formats if fmt in RASTER_FORMATS]
+        if crop is not None:
+            # A copy, so the encoders do not depend on the canvas buffer
+            pixels = np.asarray(canvas.buffer_rgba())[crop].copy()
+        elif raster_formats or derivatives:
+            # The bbox overflows the figure, so the buffer cannot simply be
+            # cropped: let savefig pad it (a second draw, in this case only)
+            buffer = io.BytesIO()
+            fig.savefig(buffer, format='png', dpi=dpi, bbox_inches=bbox,
+                        pad_inches=pad_inches)
+            pixels = np.asarray(Image.open(buffer).convert('RGBA'))
+        if derivatives:
+            images = derivative_images(_opaque(Image.fromarray(pixels, 'RGBA')),
+                                       dpi, derivatives)
+        if compact and len(raster_formats) < len(formats):
+            # After the raster draw, so only vector output is simplified
+            compact_vector_output(fig)
+
+        paths = []
+        with concurrent.futures.ThreadPoolExecutor() as pool, \
+                matplotlib.rc_context(vector_rc(compact)):
+            # Raster encodes first, so they run while the vector formats
+            # are written
+            jobs = [pool.submit(_write_raster, pixels, f'{basename}.{fmt}', fmt, dpi)
+                    for fmt in raster_formats]
+            for name in derivatives:
+                kind, fmt = name.split('.')
+                image, image_dpi = images[kind]
+                jobs.append(pool.submit(_write_derivative, image,
+                                        f'{basename}_{name}', fmt, image_dpi))
+            for fmt in formats:
+                if fmt not in RASTER_FORMATS:
+                    # Vector formats reuse the precomputed bbox: one draw,
+                    # no re-layout
+                    path = f'{basename}.{fmt}'
+                    fig.savefig(path, dpi=dpi, bbox_inches=bbox,
+                                pad_inches=pad_inches)
+                    paths.append(path)
+            paths += [job.result() for job in jobs]
+    finally:
+        fig.set_dpi(original_dpi)
+        fig.set_canvas(original_canvas)
+    order = ([f'{basename}.{fmt}' for fmt in formats]
+             + [f'{basename}_{name}' for name in derivatives])
+    return sorted(paths, key=order.index)
@@ -0,0 +1,101 @@
+"""
+Figure Style: Shared Publication Parameters and Draft Mode
+
+Every figure script calls apply_style() instead of setting rcParams itself.
+
+Draft mode renders at screen resolution for fast layout iteration. Enable it
+with the environment variable ROPE_DRAFT=1 (or `build_figures.py --draft`):
+
+    ROPE_DRAFT=1 python3 figure12.py
+
+In draft mode figures are rendered at 100 dpi, only the PNG is written (to
+figures/preview/ so the 600 dpi outputs are untouched), large fills and
+hatches are rasterized, and Monte Carlo envelopes use fewer samples.
+
+Publication builds also write web-resolution and thumbnail copies of each
+PNG; ROPE_TIFF=1 (or `build_figures.py --tiff`) adds a TIFF for the
+publisher.
+
+Compact mode (ROPE_COMPACT=1, or `build_figures.py --compact`) writes
+smaller publication PDFs that open faster: paths are simplified to
+COMPACT_TOLERANCE_PT, fills that stay complex are rasterized at the output
+dpi, and fonts are embedded as TrueType subsets (see figure_export.py).
+"""
+
+import os
+
+PUBLICATION_DPI = 600
+DRAFT_DPI = 100
+
+PUBLICATION_FORMATS = ('png', 'pdf')
+DRAFT_FORMATS = ('png',)
+
+PUBLICATION_SAMPLES = 500_000
+DRAFT_SAMPLES = 25_000
+
+# Raster derivatives of the publication PNG (see figure_export.py):
+# <name>_web.png/.webp at WEB_DPI and a <name>_thumb.png thumbnail
+PUBLICATION_DERIVATIVES = ('web.png', 'web.webp', 'thumb.png')
+DRAFT_DERIVATIVES = ()
+WEB_DPI = 150
+THUMBNAIL_PIXELS = 400  # longest side
+
+COMPACT_TOLERANCE_PT = 0.25  # largest path deviation removed (points)
+COMPACT_RASTER_VERTICES = 5000  # fills with more vertices are rasterized
+COMPACT_FONTTYPE = 42  # TrueType subsets instead of Type 3 glyph procedures
+
+OUTPUT_DIR = 'figures'
+PREVIEW_DIR = os.path.join('figures', 'preview')
+
+
+def _flag(name):
+    """True when the environment variable `name` is set to a true value"""
+    return os.environ.get(name, '').lower() not in ('', '0', 'false', 'no')
+
+
+def is_draft():
+    """True when draft mode is enabled through ROPE_DRAFT"""
+    return _flag('ROPE_DRAFT')
+
+
+def is_compact():
+    """True when compact PDF output is enabled through ROPE_COMPACT"""
+    return _flag('ROPE_COMPACT')
+
+
+def figure_dpi():
+    return DRAFT_DPI if is_draft() else PUBLICATION_DPI
+
+
+def output_formats():
+    formats = DRAFT_FORMATS if is_draft() else PUBLICATION_FORMATS
+    if _flag('ROPE_TIFF'):
+        formats += ('tif',)
+    return formats
+
+
+def output_derivatives():
+    return DRAFT_DERIVATIVES if is_draft() else PUBLICATION_DERIVATIVES
+
+
+def output_dir():
+    return PREVIEW_DIR if is_draft() else OUTPUT_DIR
+
+
+def monte_carlo_samples():
+    """Sample count for the uncertainty envelopes drawn in figures"""
+    return DRAFT_SAMPLES if is_draft() else PUBLICATION_SAMPLES
+
+
+def apply_style():
+    """Set publication-quality rcParams (at draft resolution in draft mode)"""
+    import matplotlib  # only here, so the helpers above work headless
+
+    matplotlib.rcParams['font.family'] = 'serif'
+    matplotlib.rcParams['font.size'] = 10
+    matplotlib.rcParams['axes.labelsize'] = 11
+    matplotlib.rcParams['axes.titlesize'] = 12
+    matplotlib.rcParams['xtick.labelsize'] = 9
+    matplotlib.rcParams['ytick.labelsize'] = 9
+    matplotlib.rcParams['legend.fontsize'] = 9
+    matplotlib.rcParams['figure.dpi'] = figure_dpi()
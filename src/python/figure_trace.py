@@ -0,0 +1,347 @@
+"""
+Figure Trace: Chrome/Perfetto Trace of a Figure Build
+
+Records what happens inside one figure script as nested spans and writes
+them in the Chrome trace-event format (open in https://ui.perfetto.dev or
+chrome://tracing):
+
+    import   every module imported while the script runs
+    params   rcParams (apply_style), model cache keys, build keys
+    model    figure_data.figureN(), the production chain, Monte Carlo
+             envelopes, fatigue simulation, grip model queries
+    draw     each axes, with the number of lines, collections, patches,
+             texts and images it holds and the paths/vertices of its
+             collections (so a 500-point fill_between shows up)
+    layout   tight_layout() and tight bounding boxes
+    savefig  each savefig call, the Agg render and each raster encode
+
+Tracing is opt-in and costs nothing unless enabled: nothing in the figure
+scripts or models refers to this module. install() patches the functions
+above in the current process.
+
+Usage:
+    python3 figure_trace.py figure12                # -> .traces/figure12.json
+    python3 figure_trace.py figure14 -o trace.json
+    python3 build_figures.py --force --trace        # every figure, one trace
+
+build_figures.py --trace renders in its worker pool as usual and merges the
+workers' traces (one process track per worker, one `run figureN.py` span per
+figure) with the build's own spans into .traces/build.json.
+"""
+
+import argparse
+import functools
+import importlib.abc
+import json
+import os
+import sys
+import threading
+import time
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+TRACE_DIR = os.path.join(SCRIPT_DIR, '.traces')
+
+
+# ============================================================================
+# TRACE EVENTS
+# ============================================================================
+
+def _now_us():
+    # CLOCK_MONOTONIC on Linux, shared by all processes, so traces of
+    # build workers line up when merged
+    return time.perf_counter_ns() / 1000
+
+
+class Tracer:
+    """Collects complete ('X') trace events of this process.
+
+    Tracer(enabled=False) records nothing, so callers can trace
+    unconditionally: `with tracer.span('name', 'cat'): ...`
+    """
+
+    def __init__(self, process_name=None, enabled=True):
+        self.enabled = enabled
+        self.pid = os.getpid()
+        self.events = []
+        self._threads = {}
+        if enabled and process_name:
+            self.events.append({'name': 'process_name', 'ph': 'M', 'pid': self.pid,
+                                'tid': 0, 'args': {'name': process_name}})
+
+    def _tid(self):
+        thread = threading.current_thread()
+        tid = threading.get_native_id()
+        if tid not in self._threads:
+            self._threads[tid] = thread.name
+            self.events.append({'name': 'thread_name', 'ph': 'M', 'pid': self.pid,
+                                'tid': tid, 'args': {'name': thread.name}})
+        return tid
+
+    def complete(self, name, category, start, end, args=None):
+        """Record a span from `start` to `end` (µs, see _now_us)"""
+        event = {'name': name, 'cat': category, 'ph': 'X', 'ts': start,
+                 'dur': end - start, 'pid': self.pid, 'tid': self._tid()}
+        if args:
+            event['args'] = args
+        self.events.append(event)  # list.append is atomic across threads
+
+    def span(self, name, category, args=None):
+        return _Span(self, name, category, args)
+
+    def wrap(self, function, category, name=None, args=None):
+        """`function` with every call recorded as a span. `name` and `args`
+        may be callables of the call arguments."""
+        @functools.wraps(function)
+        def traced(*call_args, **call_kwargs):
+            start = _now_us()
+            try:
+                return function(*call_args, **call_kwargs)
+            finally:
+                end = _now_us()
+                label = name(*call_args, **call_kwargs) if callable(name) \
+                    else name or function.__qualname__
+                details = args(*call_args, **call_kwargs) if callable(args) else args
+                self.complete(label, category, start, end, details)
+        return traced
+
+
+class _Span:
+    def __init__(self, tracer, name, category, args):
+        self.tracer, self.name, self.category, self.args = tracer, name, category, args
+
+    def __enter__(self):
+        self.start = _now_us()
+        return self
+
+    def __exit__(self, *exc):
+        if self.tracer.enabled:
+            self.tracer.complete(self.name, self.category, self.start, _now_us(),
+                                 self.args)
+        return False
+
+
+def write_trace(events, path):
+    """Write trace events as Chrome trace JSON (atomically)"""
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path + '.tmp', 'w', encoding='utf-8') as f:
+        json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f)
+        f.write('\n')
+    os.replace(path + '.tmp', path)
+
+
+# ============================================================================
+# INSTRUMENTATION
+# ============================================================================
+
+class _ImportTracer(importlib.abc.MetaPathFinder):
+    """Meta-path finder that times the execution of every module it sees
+    loaded by the finders behind it"""
+
+    def __init__(self, tracer):
+        self.tracer = tracer
+
+    def find_spec(self, fullname, path, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, 'find_spec'):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                break
+        else:
+            return None
+        loader = spec.loader
+        if loader is None or not hasattr(loader, 'exec_module') \
+                or getattr(loader.exec_module, '_traced', False):
+            return spec
+        # Patch this loader instance only; shared loaders stay untouched
+        exec_module = loader.exec_module
+        tracer = self.tracer
+
+        def traced_exec_module(module):
+            start = _now_us()
+            try:
+                exec_module(module)
+            finally:
+                tracer.complete(f'import {fullname}', 'import', start, _now_us())
+        traced_exec_module._traced = True
+        try:
+            loader.exec_module = traced_exec_module
+        except (AttributeError, TypeError):
+            pass  # built-in loaders may not allow it
+        return spec
+
+
+def _axes_name(ax):
+    """Short label of an axes: its index, then the first line of its title"""
+    index = ax.figure.axes.index(ax) if ax.figure is not None else '?'
+    title = ax.get_title().split('\n')[0]
+    return f'axes {index}: {title[:40]}' if title else f'axes {index}'
+
+
+def axes_artists(ax):
+    """Counts of the artists an axes holds, and the size of its collections"""
+    paths = vertices = 0
+    for collection in ax.collections:
+        for path in collection.get_paths():
+            paths += 1
+            vertices += len(path.vertices)
+    return {'artists': len(ax.get_children()), 'lines': len(ax.lines),
+            'collections': len(ax.collections), 'patches': len(ax.patches),
+            'texts': len(ax.texts), 'images': len(ax.images),
+            'collection_paths': paths, 'collection_vertices': vertices}
+
+
+def _savefig_args(fig, fname, *args, **kwargs):
+    return {'file': os.path.basename(str(fname)), 'dpi': kwargs.get('dpi')}
+
+
+_installed = None
+
+
+def install(tracer=None):
+    """Trace imports, model evaluation, drawing, layout and saving in this
+    process; later imports of the patched modules see the traced versions.
+
+    Installs once per process and returns the tracer in use (a new one
+    named after the process if none is given).
+    """
+    global _installed
+    if _installed is not None:
+        return _installed
+    _installed = tracer = tracer or Tracer(f'worker {os.getpid()}')
+    sys.meta_path.insert(0, _ImportTracer(tracer))
+
+    import matplotlib
+    matplotlib.use('Agg')
+    from matplotlib.axes import Axes
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    import figure_data
+    import figure_export
+    import figure_style
+    import grip_model
+    import production_model
+    import rope_fatigue
+    import rope_uncertainty
+
+    # Parameter resolution
+    figure_style.apply_style = tracer.wrap(figure_style.apply_style, 'params',
+                                           'apply_style')
+    production_model._cache_key = tracer.wrap(production_model._cache_key,
+                                              'params', 'production cache key')
+    # Model evaluation
+    for number, function in figure_data.figure_functions.items():
+        traced = tracer.wrap(function, 'model', f'figure_data.figure{number}')
+        figure_data.figure_functions[number] = traced
+        setattr(figure_data, function.__name__, traced)
+    production_model.production_model = tracer.wrap(
+        production_model.production_model, 'model', 'production_model')
+    production_model._evaluate = tracer.wrap(
+        production_model._evaluate, 'model', 'production chain (cache miss)')
+    rope_uncertainty.simulate_diameter_bands = tracer.wrap(
+        rope_uncertainty.simulate_diameter_bands, 'model', 'Monte Carlo bands',
+        args=lambda masses, n_samples=None, **kwargs: {'n_samples': n_samples})
+    rope_fatigue.km_to_failure = tracer.wrap(
+        rope_fatigue.km_to_failure, 'model', 'fatigue km_to_failure',
+        args=lambda mass, n_ropes=500, **kwargs: {'n_ropes': n_ropes})
+    grip_model.GripModel.workforce_fraction = tracer.wrap(
+        grip_model.GripModel.workforce_fraction, 'model', 'grip workforce_fraction')
+    # Drawing, layout and saving
+    Axes.draw = tracer.wrap(Axes.draw, 'draw', name=lambda ax, *a, **k: _axes_name(ax),
+                            args=lambda ax, *a, **k: axes_artists(ax))
+    Figure.tight_layout = tracer.wrap(Figure.tight_layout, 'layout', 'tight_layout')
+    Figure.get_tightbbox = tracer.wrap(Figure.get_tightbbox, 'layout', 'tight bbox')
+    FigureCanvasAgg.draw = tracer.wrap(FigureCanvasAgg.draw, 'savefig', 'Agg render')
+    Figure.savefig = tracer.wrap(Figure.savefig, 'savefig',
+                                 name=lambda fig, fname, *a, **k:
+                                 f'savefig {os.path.splitext(str(fname))[1][1:]}',
+                                 args=_savefig_args)
+    figure_export._write_raster = tracer.wrap(
+        figure_export._write_raster, 'savefig',
+        name=lambda pixels, path, fmt, dpi: f'encode {fmt}',
+        args=lambda pixels, path, fmt, dpi: {'file': os.path.basename(path),
+                                             'pixels': f'{pixels.shape[1]}x{pixels.shape[0]}'})
+    figure_export._write_derivative = tracer.wrap(
+        figure_export._write_derivative, 'savefig',
+        name=lambda image, path, fmt, dpi: f'encode {os.path.basename(path)}',
+        args=lambda image, path, fmt, dpi: {'pixels': f'{image.width}x{image.height}'})
+    # Figure scripts run `from figure_export import save_figure` after this
+    figure_export.save_figure = tracer.wrap(figure_export.save_figure, 'savefig',
+                                            'save_figure')
+    return tracer
+
+
+def trace_script(script, tracer):
+    """Run a figure script with tracing installed (in this process)"""
+    import runpy
+
+    install(tracer)
+    import matplotlib.pyplot as plt
+    with tracer.span(f'run {script}', 'figure'):
+        try:
+            runpy.run_path(os.path.join(SCRIPT_DIR, script), run_name='__main__')
+        finally:
+            plt.close('all')
+
+
+def summarize(events):
+    """Time covered by each category's spans (nested and overlapping spans
+    of one thread counted once) and the axes draws, slowest first"""
+    intervals = {}
+    for event in events:
+        if event['ph'] == 'X':
+            key = (event['cat'], event['tid'])
+            intervals.setdefault(key, []).append((event['ts'], event['ts'] + event['dur']))
+    totals = {}
+    for (category, _), spans in intervals.items():
+        covered, end = 0, float('-inf')
+        for start, stop in sorted(spans):
+            if stop > end:
+                covered += stop - max(start, end)
+                end = stop
+        totals[category] = totals.get(category, 0) + covered
+    draws = sorted((event for event in events if event.get('cat') == 'draw'),
+                   key=lambda event: -event['dur'])
+    return totals, draws
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('figure', help='figure script to trace (e.g. figure12)')
+    parser.add_argument('-o', '--output',
+                        help='trace JSON (default: .traces/<figure>.json)')
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault('MPLBACKEND', 'Agg')
+    if SCRIPT_DIR not in sys.path:
+        sys.path.insert(0, SCRIPT_DIR)
+    from build_figures import resolve_scripts
+
+    script, = resolve_scripts([args.figure])
+    output = args.output or os.path.join(TRACE_DIR, script[:-3] + '.json')
+    tracer = Tracer(script)
+    trace_script(script, tracer)
+    write_trace(tracer.events, output)
+
+    # Categories nest (savefig contains draw), so totals are not additive
+    totals, draws = summarize(tracer.events)
+    print("=" * 70)
+    print(f"TRACE OF {script} ({len(tracer.events)} events)")
+    print("=" * 70)
+    for category, total in sorted(totals.items(), key=lambda item: -item[1]):
+        print(f"  {category:<10} {total / 1000:>9.1f} ms")
+    print("-" * 70)
+    print("Slowest axes draws (all draws of the figure):")
+    for event in draws[:5]:
+        counts = event['args']
+        print(f"  {event['dur'] / 1000:>7.1f} ms  {event['name']:<48} "
+              f"{counts['artists']:>4} artists, {counts['collection_vertices']:,} "
+              f"vertices")
+    print("-" * 70)
+    print(f"Trace written to {output} (open in https://ui.perfetto.dev)")
+    print("=" * 70)
+
+
+if __name__ == '__main__':
+    main()
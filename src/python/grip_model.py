@@ -0,0 +1,153 @@
+"""
+Grip Model: Share of a Workforce Able to Grip a Rope
+
+Figure 10 compares rope diameters with five fixed hand circumferences. This
+module works with whole populations instead: each cohort (e.g. men and
+women, or age groups) has a hand-circumference distribution, and a person
+can grip a rope comfortably up to COMFORTABLE_RATIO × circumference / π and
+at most MAXIMUM_RATIO × circumference / π.
+
+GripModel tabulates every cohort's cumulative distribution once on a shared,
+evenly spaced circumference grid. A query for any number of diameters is then
+one vectorized linear interpolation for all cohorts at once (the grid index
+is computed directly, no search):
+
+    model = GripModel()
+    model.fraction_able([30, 40, 48], 'comfortable')   # per cohort
+    model.workforce_fraction(48, 'maximum')             # weighted by cohort
+    model.recruits_needed(48, crew=60)                  # people to find a crew
+
+Cohorts are distribution tuples as in rope_uncertainty ('normal',
+'uniform', 'triangular', 'fixed') or arrays of measured circumferences.
+"""
+
+import math
+
+import numpy as np
+
+import rope_uncertainty as ru
+
+# ============================================================================
+# GRIP PARAMETERS
+# ============================================================================
+
+COMFORTABLE_RATIO = 0.35  # share of hand circumference, as in Figure 10
+MAXIMUM_RATIO = 0.45
+
+# Assumed adult hand circumference (mm) by sex, roughly matching modern
+# anthropometric surveys; replace with cohort data where available
+DEFAULT_COHORTS = {
+    'men': ('normal', 214, 10),
+    'women': ('normal', 189, 9),
+}
+DEFAULT_WEIGHTS = {'men': 0.5, 'women': 0.5}
+
+GRID_RANGE = (100, 320)  # mm of hand circumference
+GRID_POINTS = 4401  # 0.05 mm spacing
+
+GRIPS = {'comfortable': COMFORTABLE_RATIO, 'maximum': MAXIMUM_RATIO}
+
+
+def _cdf(spec, grid):
+    """Cumulative distribution of a cohort on the circumference grid"""
+    if not isinstance(spec, tuple):
+        # Measured circumferences: empirical CDF
+        values = np.sort(np.asarray(spec, dtype=float))
+        return np.searchsorted(values, grid, side='right') / len(values)
+    kind, *args = spec
+    if kind == 'normal':
+        erf = np.frompyfunc(math.erf, 1, 1)
+        z = (grid - args[0]) / (args[1] * math.sqrt(2))
+        return 0.5 * (1 + erf(z).astype(float))
+    # Other distributions: invert their quantile function on a fine grid
+    probabilities = np.linspace(0, 1, 10_001)
+    return np.interp(grid, ru.quantile(spec, probabilities), probabilities,
+                     left=0, right=1)
+
+
+class GripModel:
+    """Cumulative hand-circumference lookup for a set of cohorts."""
+
+    def __init__(self, cohorts=None, weights=None,
+                 comfortable_ratio=COMFORTABLE_RATIO, maximum_ratio=MAXIMUM_RATIO):
+        cohorts = DEFAULT_COHORTS if cohorts is None else cohorts
+        if weights is None:
+            weights = DEFAULT_WEIGHTS if cohorts is DEFAULT_COHORTS else \
+                {name: 1 for name in cohorts}
+        self.names = list(cohorts)
+        self.weights = np.array([weights[name] for name in self.names], dtype=float)
+        self.weights /= self.weights.sum()
+        self.ratios = {'comfortable': comfortable_ratio, 'maximum': maximum_ratio}
+
+        self.grid = np.linspace(*GRID_RANGE, GRID_POINTS)
+        self._step = self.grid[1] - self.grid[0]
+        self.cdf = np.array([_cdf(cohorts[name], self.grid) for name in self.names])
+
+    def _circumference(self, diameters, grip):
+        """Smallest hand circumference (mm) that grips `diameters` (mm)"""
+        if grip not in self.ratios:
+            raise ValueError(f"Unknown grip '{grip}' (choose from {tuple(self.ratios)})")
+        return np.asarray(diameters, dtype=float) * np.pi / self.ratios[grip]
+
+    def fraction_able(self, diameters, grip='comfortable'):
+        """Share of each cohort able to grip each diameter.
+
+        Returns an array of shape (n_cohorts,) + diameters.shape.
+        """
+        needed = self._circumference(diameters, grip)
+        # Direct index into the evenly spaced grid, then interpolate the CDF
+        position = np.clip((needed - self.grid[0]) / self._step, 0, len(self.grid) - 1)
+        index = np.minimum(position.astype(np.intp), len(self.grid) - 2)
+        weight = position - index
+        cdf = (self.cdf[:, index] * (1 - weight) + self.cdf[:, index + 1] * weight)
+        return 1 - cdf
+
+    def workforce_fraction(self, diameters, grip='comfortable'):
+        """Share of the whole workforce (cohorts weighted) able to grip"""
+        return np.tensordot(self.weights, self.fraction_able(diameters, grip), axes=1)
+
+    def recruits_needed(self, diameters, crew, grip='comfortable'):
+        """Workforce size needed to find `crew` people able to grip"""
+        fraction = self.workforce_fraction(diameters, grip)
+        with np.errstate(divide='ignore'):
+            return np.where(fraction > 0, np.ceil(crew / np.maximum(fraction, 1e-300)),
+                            np.inf)
+
+    def diameter_at(self, share, grip='comfortable'):
+        """Largest diameter each cohort can grip with `share` of its members
+        still able to (e.g. share=0.95), shape (n_cohorts,) + share.shape"""
+        share = np.asarray(share, dtype=float)
+        circumference = np.array([np.interp(1 - share, cdf, self.grid)
+                                  for cdf in self.cdf])
+        return circumference * self.ratios[grip] / np.pi
+
+
+if __name__ == '__main__':
+    import time
+
+    import rope_mechanics as rm
+
+    model = GripModel()
+    masses = np.array([4, 15, 40, 82, 90, 260])
+    diameters = rm.diameter_from_mass(masses)
+
+    print("=" * 70)
+    print("SHARE OF WORKFORCE ABLE TO GRIP THE REQUIRED ROPE")
+    print("=" * 70)
+    print(f"{'Mass':>8} {'Rope Ø':>9} " + " ".join(
+        f"{name + ' ' + grip[:4] + '.':>12}" for grip in GRIPS for name in model.names))
+    shares = np.concatenate([model.fraction_able(diameters, grip) for grip in GRIPS])
+    for i, (mass, diameter) in enumerate(zip(masses, diameters)):
+        print(f"{mass:>6.0f} t {diameter:>7.1f}mm " +
+              " ".join(f"{share:>12.1%}" for share in shares[:, i]))
+    print("-" * 70)
+    print(f"Diameter 95% of each cohort grips comfortably: "
+          f"{model.diameter_at(0.95)[0]:.1f} mm (men), "
+          f"{model.diameter_at(0.95)[1]:.1f} mm (women)")
+
+    queries = np.linspace(5, 80, 100_000)
+    start = time.perf_counter()
+    model.fraction_able(queries, 'maximum')
+    elapsed = time.perf_counter() - start
+    print(f"100,000 diameters × {len(model.names)} cohorts in {elapsed * 1000:.1f} ms")
+    print("=" * 70)
@@ -0,0 +1,222 @@
+"""
+Key Values: Every Quantity the Text Quotes, in One Artifact
+
+Computes each number the manuscript text and captions quote (rope
+diameters, breaking loads, fiber masses, person-days, ...) once from
+figure_data.py and the production model, and writes them to
+figures/key_values.json:
+
+    {"paper":   {"diameter.paro": 48.35, "production.paro.fiber_kg": 101.0, ...},
+     "caption": {"diameter.paro": 39.92, "production.paro.fiber_kg": 68.9, ...}}
+
+"paper" is the model of Figures 9-14 (65% packing, Paro 82 t); "caption" is
+the model of the corrected captions and rope_production_section.md (no
+packing efficiency, Paro 86 t; see verify_captions.py). Names are dotted:
+`mass.<specimen>`, `diameter.<specimen>` (SF=10), `diameter_sf5.<specimen>`,
+`diameter.<N>t`, `load.<N>mm` and `load.paro_*` (kN; `_n`: N),
+`safety_factor.10mm_4t`, `rope.*`,
+`grip.*` (Figure 10's grip ranges and workforce shares),
+`production.<moai>.*`, `production.*` (including `production.ratio.*`, Paro
+over the experimental replica), `capacity.*` and, for the paper
+model, `fatigue.*`.
+
+render_docs.py fills the placeholders of the Markdown templates from this
+file; build_figures.py rewrites it on every build. Values are plain floats,
+formatted by the templates.
+
+Usage:
+    python3 key_values.py            # write figures/key_values.json
+    python3 key_values.py diameter   # print the values whose name contains it
+"""
+
+import json
+import os
+import sys
+
+import figure_data as fd
+import figure_style as fs
+import production_kernels as pk
+import production_model as pm
+import rope_mechanics as rm
+from verify_captions import CAPTION_MODEL
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+KEY_VALUES = os.path.join(SCRIPT_DIR, fs.OUTPUT_DIR, 'key_values.json')
+
+MODELS = {'paper': {}, 'caption': CAPTION_MODEL}
+
+# Names of the Figure 12 specimens and of the production chain's moai
+SPECIMENS = ('experimental', 'typical', 'paro', 'tongariki', 'te_tokanga')
+PRODUCTION_MOAI = ('experimental', 'typical', 'large', 'very_large', 'paro')
+
+# Round masses (tons) whose required diameter the text quotes
+QUOTED_MASSES = (4, 10, 15, 20, 40, 60, 80, 90, 100, 120, 150, 200)
+
+# Direct transport labor per rope team (person-days) that
+# rope_production_section.md compares rope production with: 6 km at
+# 100 m/h (Hunt and Lipo 2011)
+TRANSPORT_TEAM_PERSON_DAYS = 15
+
+
+# ============================================================================
+# VALUES
+# ============================================================================
+
+def _rope_values(model):
+    """Rope parameters, loads and diameters under `model`"""
+    rope = {name: value for name, value in model.items() if name != 'paro_mass'}
+    fig9 = fd.figure9(n_samples=0, **model)
+    fig12 = fd.figure12(n_samples=0, **model)
+    values = {
+        'rope.tensile_strength': rope.get('tensile_strength', rm.TENSILE_STRENGTH),
+        'rope.packing_efficiency': rope.get('packing_efficiency', rm.PACKING_EFFICIENCY),
+        'rope.construction_efficiency': rope.get('construction_efficiency',
+                                                 rm.CONSTRUCTION_EFFICIENCY),
+        'rope.load_per_ton': rope.get('load_per_ton', rm.LOAD_PER_TON),
+        'rope.safety_factor': fig9['safety_factor'],
+        'rope.margin_factor': fig9['margin_factor'],
+        'handling_limit': fig9['handling_limit'],
+        'mass_at_handling_limit': rm.mass_from_diameter(
+            fig9['handling_limit'], safety_factor=fig9['safety_factor'], **rope),
+    }
+    for diameter, load in zip(fig9['marked_diameters'], fig9['marked_loads']):
+        values[f'load.{diameter}mm'] = load
+    working_load = rm.required_breaking_load(fig9['paro_mass'], 1, values['rope.load_per_ton'])
+    values['load.paro_working'] = working_load  # kN
+    values['load.paro_working_n'] = 1000 * working_load
+    values['load.paro_breaking'] = working_load * fig9['safety_factor']
+    # Safety factor of a 10 mm rope pulling a 4 t moai
+    values['safety_factor.10mm_4t'] = values['load.10mm'] / (4 * values['rope.load_per_ton'])
+    for name, mass, sf10, sf5 in zip(SPECIMENS, fig12['moai_masses'],
+                                     fig12['diameter_sf10'], fig12['diameter_sf5']):
+        values[f'mass.{name}'] = mass
+        values[f'diameter.{name}'] = sf10
+        values[f'diameter_sf5.{name}'] = sf5
+    for mass in QUOTED_MASSES:
+        values[f'diameter.{mass}t'] = rm.diameter_from_mass(mass, **rope)
+    return values
+
+
+def _grip_values(model):
+    """Figure 10's grip ranges (mm) and the workforce shares able to grip
+    its marked ropes"""
+    fig10 = fd.figure10(**model)
+    values = {
+        'grip.comfortable_min': fig10['max_grip_comfortable'].min(),
+        'grip.comfortable_max': fig10['max_grip_comfortable'].max(),
+        'grip.maximum_min': fig10['max_grip_limit'].min(),
+        'grip.maximum_max': fig10['max_grip_limit'].max(),
+    }
+    labels = [f'{mass:g}t' for mass in fig10['masses'][:-1]] + ['paro']
+    for label, comfortable, maximum in zip(labels, fig10['marked_comfortable'],
+                                           fig10['marked_maximum']):
+        values[f'grip.comfortable.{label}'] = comfortable
+        values[f'grip.maximum.{label}'] = maximum
+    return values
+
+
+def _production_values(production):
+    """Per-moai production chain values of a ProductionResult"""
+    values = {
+        'production.rope_sets': production.rope_sets_transport[-1],
+        'production.transport_distance_km': production.parameters.transport_distance_km,
+        'production.rope_lifetime_km': production.parameters.rope_lifetime_km,
+        'production.retting_days': production.parameters.retting_days,
+    }
+    columns = {
+        'mass': production.masses,
+        'diameter': production.diameter,
+        'fiber_kg': production.fiber_mass,
+        'harvest_days': production.stage_days['harvest'],
+        'construction_days': production.stage_days['construction'],
+        'production_days': production.production_days,
+        'parallel_days': production.parallel_days,
+        'person_days': production.person_days,
+        'person_days_transport': production.person_days_transport,
+    }
+    for i, name in enumerate(PRODUCTION_MOAI):
+        for column, array in columns.items():
+            values[f'production.{name}.{column}'] = array[i]
+    # Paro against the experimental replica
+    for column in ('fiber_kg', 'person_days'):
+        values[f'production.ratio.{column}'] = (values[f'production.paro.{column}']
+                                                / values[f'production.experimental.{column}'])
+    values['production.rope_to_transport_labor'] = (
+        values['production.experimental.person_days_transport'] / TRANSPORT_TEAM_PERSON_DAYS)
+    return values
+
+
+def model_values(model):
+    """Every key value under one model (a dict of rope overrides and paro_mass)"""
+    values = _rope_values(model)
+    values.update(_grip_values(model))
+    rope = {name: value for name, value in model.items() if name in fd.ROPE_PARAMETERS}
+    masses = pm.MOAI_MASSES
+    if 'paro_mass' in model:
+        masses = masses[:-1] + (float(model['paro_mass']),)
+    production = pm.production_model(masses=masses, **rope)
+    values.update(_production_values(production))
+    daily_capacity = fd.figure14()['daily_capacity']
+    values['capacity.daily_person_days'] = daily_capacity
+    for name, person_days in zip(PRODUCTION_MOAI, production.person_days_transport):
+        values[f'capacity.share.{name}'] = person_days / daily_capacity
+    return values
+
+
+def key_values():
+    """{model name: {value name: float}} for every model in MODELS"""
+    values = {name: model_values(model) for name, model in MODELS.items()}
+
+    # The fatigue band is only quoted for the paper model
+    paper = values['paper']
+    fig13 = fd.figure13()
+    distance = paper['production.transport_distance_km']
+    paper['fatigue.lifetime_p10_km'] = fig13['lifetime_p10']
+    paper['fatigue.lifetime_p90_km'] = fig13['lifetime_p90']
+    # Short-lived ropes need the most sets
+    paper['fatigue.rope_sets_p10'] = pk.rope_sets(distance, fig13['lifetime_p90'])
+    paper['fatigue.rope_sets_p90'] = pk.rope_sets(distance, fig13['lifetime_p10'])
+
+    return {model: {name: float(value) for name, value in sorted(entries.items())}
+            for model, entries in values.items()}
+
+
+# ============================================================================
+# ARTIFACT
+# ============================================================================
+
+def write_key_values(values, path=KEY_VALUES):
+    """Write `values` atomically; return False if the file was already current"""
+    text = json.dumps(values, indent=2, sort_keys=True) + '\n'
+    if os.path.exists(path):
+        with open(path, encoding='utf-8') as f:
+            if f.read() == text:
+                return False
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path + '.tmp', 'w', encoding='utf-8') as f:
+        f.write(text)
+    os.replace(path + '.tmp', path)
+    return True
+
+
+def load_key_values(path=KEY_VALUES):
+    """The artifact as {'<model>.<name>': value}, computing it if absent"""
+    if not os.path.exists(path):
+        write_key_values(key_values(), path)
+    with open(path, encoding='utf-8') as f:
+        values = json.load(f)
+    return {f'{model}.{name}': value for model, entries in values.items()
+            for name, value in entries.items()}
+
+
+if __name__ == '__main__':
+    values = key_values()
+    changed = write_key_values(values)
+    patterns = sys.argv[1:]
+    for model, entries in values.items():
+        for name, value in entries.items():
+            if any(pattern in name for pattern in patterns):
+                print(f"  {model}.{name:<44} {value:,.4g}")
+    total = sum(len(entries) for entries in values.values())
+    print(f"{total} key values {'written to' if changed else 'unchanged in'} "
+          f"{os.path.relpath(KEY_VALUES)}")
@@ -0,0 +1,132 @@
+"""
+Moai Catalog: Columnar Statue Data Shared by Figures and Simulators
+
+Statue names and masses used to be typed into every script (Paro was 82 t in
+some and 86 t in others). moai_catalog.csv is now the single editable source;
+on first use it is compiled into a NumPy structured array saved as .npy in
+.cache/, and every later load memory-maps that file, so loading costs a stat()
+and an mmap no matter how many statues the catalog holds. The compiled file
+is rebuilt automatically whenever the CSV changes.
+
+Columns:
+    name       statue name
+    mass       metric tons
+    height     meters (NaN if not recorded)
+    status     transported | abandoned | incomplete | experimental
+    category   quarry | road | ahu | replica
+    distance   km from Rano Raraku (NaN if not recorded)
+
+Usage:
+    catalog = load()
+    catalog['mass'][catalog['category'] == 'ahu']
+    by_category('quarry')
+    mass('Paro')
+"""
+
+import csv
+import functools
+import os
+
+import numpy as np
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+SOURCE = os.path.join(SCRIPT_DIR, 'moai_catalog.csv')
+CACHE_DIR = os.path.join(SCRIPT_DIR, '.cache')
+
+DATA_FILES = (SOURCE,)  # content-hashed by build_figures.py
+
+CATEGORIES = ('quarry', 'road', 'ahu', 'replica')
+STATUSES = ('transported', 'abandoned', 'incomplete', 'experimental')
+
+DTYPE = np.dtype([('name', 'U48'), ('mass', 'f8'), ('height', 'f8'),
+                  ('status', 'U12'), ('category', 'U8'), ('distance', 'f8')])
+
+
+def _number(text):
+    return float(text) if text.strip() else np.nan
+
+
+def read_source(source=SOURCE):
+    """Parse the CSV catalog into a structured array"""
+    with open(source, encoding='utf-8', newline='') as f:
+        rows = csv.DictReader(line for line in f if not line.startswith('#'))
+        records = []
+        for row in rows:
+            if row['category'] not in CATEGORIES:
+                raise ValueError(f"{row['name']}: unknown category '{row['category']}'")
+            if row['status'] not in STATUSES:
+                raise ValueError(f"{row['name']}: unknown status '{row['status']}'")
+            records.append((row['name'], float(row['mass_t']),
+                            _number(row['height_m']), row['status'],
+                            row['category'], _number(row['distance_km'])))
+    return np.array(records, dtype=DTYPE)
+
+
+def compiled_path(source=SOURCE):
+    """.npy file for the current version of `source` (keyed by size and mtime)"""
+    stat = os.stat(source)
+    stem = os.path.splitext(os.path.basename(source))[0]
+    return os.path.join(CACHE_DIR, f'{stem}_{stat.st_size}_{stat.st_mtime_ns}.npy')
+
+
+def build(source=SOURCE):
+    """Compile `source` to its .npy file; returns the path"""
+    path = compiled_path(source)
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    with open(path + '.tmp', 'wb') as f:
+        np.save(f, read_source(source))
+    os.replace(path + '.tmp', path)
+    return path
+
+
+@functools.lru_cache(maxsize=None)
+def _load(path, source):
+    if not os.path.exists(path):
+        build(source)
+    return np.load(path, mmap_mode='r')
+
+
+def load(source=SOURCE):
+    """Memory-mapped catalog (read-only structured array)"""
+    return _load(compiled_path(source), source)
+
+
+def by_category(category, catalog=None):
+    """Rows of one category ('quarry', 'road', 'ahu' or 'replica')"""
+    if category not in CATEGORIES:
+        raise ValueError(f"Unknown category '{category}' (choose from {CATEGORIES})")
+    catalog = load() if catalog is None else catalog
+    return catalog[catalog['category'] == category]
+
+
+def lookup(name, catalog=None):
+    """Catalog record of the statue called `name`"""
+    catalog = load() if catalog is None else catalog
+    index = np.flatnonzero(catalog['name'] == name)
+    if len(index) == 0:
+        raise KeyError(f"No moai named '{name}' in the catalog")
+    return catalog[index[0]]
+
+
+def mass(name, catalog=None):
+    """Mass (tons) of the statue called `name`"""
+    return float(lookup(name, catalog)['mass'])
+
+
+def masses(names, catalog=None):
+    """Masses (tons) of several statues, in the order given"""
+    return np.array([mass(name, catalog) for name in names])
+
+
+if __name__ == '__main__':
+    catalog = load()
+    print("=" * 78)
+    print(f"MOAI CATALOG ({len(catalog)} statues)")
+    print("=" * 78)
+    print(f"{'Name':<28} {'Mass':>8} {'Height':>8} {'Status':<13} "
+          f"{'Category':<9} {'Distance':>8}")
+    print("-" * 78)
+    for row in catalog:
+        print(f"{row['name']:<28} {row['mass']:>6.1f} t {row['height']:>6.1f} m "
+              f"{row['status']:<13} {row['category']:<9} {row['distance']:>5.1f} km")
+    print("=" * 78)
@@ -0,0 +1,124 @@
+"""
+Production Kernels: Fiber, Labor and Rope-Set Formulas Without NumPy
+
+The rope production assumptions (Folk 2018 fiber yield, stage durations,
+crew sizes, rope lifetime, community labor) and the closed-form per-statue
+formulas built on them. Like rope_mechanics.py, every kernel is plain
+arithmetic: Python scalars are evaluated in pure Python (nothing imports
+NumPy), and NumPy arrays broadcast. production_schedule, production_model
+and transport_campaign import their parameters and building blocks from
+here, and the `rope.py` command line uses it to answer scalar queries
+without loading NumPy.
+
+Usage:
+    statue_requirements(82, 6)       # one statue, 6 km
+    statue_requirements(masses_array, distances_array)
+"""
+
+import math
+
+import rope_mechanics as rm
+
+# ============================================================================
+# PRODUCTION PARAMETERS
+# ============================================================================
+
+# Production schedule (Figure 13)
+HARVEST_DAYS_PER_KG = 0.5  # harvesting & processing, per kg of fiber
+RETTING_DAYS = 38  # water retting, fixed per batch
+PREPARATION_DAYS = 3  # drying/preparation, fixed per batch
+CONSTRUCTION_DAYS_PER_M = 0.3  # rope construction, per meter of rope
+ROPE_LENGTH = 30  # meters per rope
+N_ROPES = 3  # 2 lateral, 1 stabilizing
+
+# Fiber yield and crews
+FIBER_PER_METER = 300  # g/m for the experimental rope (Folk 2018)
+REFERENCE_DIAMETER = 25  # mm, estimated diameter of the experimental rope
+
+PEOPLE_HARVESTING = 3
+RETTING_SUPERVISION = 0.5  # person-days per rope set
+PEOPLE_PREPARATION = 2
+PEOPLE_CONSTRUCTION_BASE = 2  # plus one person per 20 mm of rope diameter
+CONSTRUCTION_MM_PER_PERSON = 20
+
+ROPE_LIFETIME_KM = 1.5  # km of transport per rope set (conservative)
+TRANSPORT_DISTANCE_KM = 6  # average transport distance from Rano Raraku
+
+# Community labor
+POPULATION = 3500  # peak-period estimate (3,000-4,000)
+WORKING_FRACTION = 0.2  # share of the population available for labor
+
+
+# ============================================================================
+# BROADCASTING BUILDING BLOCKS
+# ============================================================================
+
+def fiber_mass(diameter, fiber_per_meter=FIBER_PER_METER,
+               reference_diameter=REFERENCE_DIAMETER,
+               rope_length=ROPE_LENGTH, n_ropes=N_ROPES):
+    """Fiber (kg) for one rope set; linear density scales with diameter²"""
+    grams_per_meter = fiber_per_meter * (diameter / reference_diameter) ** 2
+    return grams_per_meter * rope_length * n_ropes / 1000
+
+
+def labor_by_stage(fiber_mass, diameter,
+                   harvest_days_per_kg=HARVEST_DAYS_PER_KG,
+                   preparation_days=PREPARATION_DAYS,
+                   construction_days_per_m=CONSTRUCTION_DAYS_PER_M,
+                   rope_length=ROPE_LENGTH, n_ropes=N_ROPES):
+    """Person-days per rope set for each production stage"""
+    construction_days = rope_length * n_ropes * construction_days_per_m
+    people_construction = (PEOPLE_CONSTRUCTION_BASE
+                           + diameter / CONSTRUCTION_MM_PER_PERSON)
+    return {
+        'harvest': fiber_mass * harvest_days_per_kg * PEOPLE_HARVESTING,
+        'retting': RETTING_SUPERVISION + 0 * fiber_mass,
+        'preparation': preparation_days * PEOPLE_PREPARATION + 0 * fiber_mass,
+        'construction': construction_days * people_construction,
+    }
+
+
+def serial_days(fiber_mass, harvest_days_per_kg=HARVEST_DAYS_PER_KG,
+                retting_days=RETTING_DAYS, preparation_days=PREPARATION_DAYS,
+                construction_days_per_m=CONSTRUCTION_DAYS_PER_M,
+                rope_length=ROPE_LENGTH, n_ropes=N_ROPES):
+    """Calendar days for one serially produced rope set: the makespan of
+    production_schedule with one unit of each resource, in closed form"""
+    return (fiber_mass * harvest_days_per_kg + retting_days
+            + preparation_days + rope_length * n_ropes * construction_days_per_m)
+
+
+def rope_sets(distance_km, rope_lifetime_km=ROPE_LIFETIME_KM):
+    """Rope sets worn out over a transport of `distance_km`"""
+    scalars = (int, float)
+    if isinstance(distance_km, scalars) and isinstance(rope_lifetime_km, scalars):
+        return float(math.ceil(distance_km / rope_lifetime_km))
+    import numpy as np
+    return np.ceil(np.asarray(distance_km) / rope_lifetime_km)
+
+
+def daily_capacity(population=POPULATION, working_fraction=WORKING_FRACTION):
+    """Person-days of community labor available per day"""
+    return population * working_fraction
+
+
+# ============================================================================
+# PER-STATUE REQUIREMENTS
+# ============================================================================
+
+def statue_requirements(masses, distances,
+                        rope_lifetime_km=ROPE_LIFETIME_KM,
+                        safety_factor=rm.SAFETY_FACTOR,
+                        fiber_per_meter=FIBER_PER_METER):
+    """Rope requirements for moving each statue; all arguments broadcast.
+
+    Returns a dict: rope_sets, fiber_mass (kg), person_days and
+    production_days (calendar days for one serially produced rope set).
+    """
+    diameter = rm.diameter_from_mass(masses, safety_factor=safety_factor)
+    fiber_per_set = fiber_mass(diameter, fiber_per_meter)
+    labor_per_set = sum(labor_by_stage(fiber_per_set, diameter).values())
+    sets = rope_sets(distances, rope_lifetime_km)
+    return {'rope_sets': sets, 'fiber_mass': sets * fiber_per_set,
+            'person_days': sets * labor_per_set,
+            'production_days': serial_days(fiber_per_set)}
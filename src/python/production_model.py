@@ -0,0 +1,184 @@
+"""
+Production Model: Fiber, Timeline and Labor per Rope Set
+
+Single source for the rope production chain shared by Figures 13 and 14:
+
+    moai mass -> rope diameter -> fiber mass -> production schedule
+              -> person-days per rope set -> person-days per transport
+
+Based on experimental data from Folk (2018): 300 g of fiber per meter of
+~25 mm rope, three 30 m ropes per moai, 38-day water retting.
+
+The building blocks (fiber_mass, labor_by_stage, rope_sets) and the
+production assumptions live in production_kernels.py (NumPy-free, so they
+also serve scalar queries) and are re-exported here. The full
+chain is evaluated by production_model(), which returns a ProductionResult and
+caches it in memory and on disk (.cache/), keyed by a hash of the parameters
+and this module's inputs. A figure build computes the chain once; every figure
+that calls production_model() with the same parameters reuses that result,
+and changing one parameter (e.g. rope_lifetime_km) recomputes it once for all
+figures.
+
+Usage:
+    result = production_model()
+    result.fiber_mass, result.person_days, result.person_days_transport
+    production_model(rope_lifetime_km=2.0)
+"""
+
+import dataclasses
+import functools
+import hashlib
+import json
+import os
+import pickle
+
+import numpy as np
+
+import moai_catalog as mc
+import production_kernels as pk
+import production_schedule as ps
+import rope_mechanics as rm
+from production_kernels import (FIBER_PER_METER, REFERENCE_DIAMETER,
+                                ROPE_LIFETIME_KM, TRANSPORT_DISTANCE_KM,
+                                fiber_mass, labor_by_stage, rope_sets)
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+CACHE_DIR = os.path.join(SCRIPT_DIR, '.cache')
+
+# ============================================================================
+# PRODUCTION PARAMETERS
+# ============================================================================
+
+# tons, Figures 13 and 14: catalog specimens plus 40 t and 60 t size classes
+MOAI_MASSES = (mc.mass('Experimental Replica'), mc.mass('Ahu Akivi (typical)'),
+               40.0, 60.0, mc.mass('Paro'))
+
+
+@dataclasses.dataclass(frozen=True)
+class ProductionParameters:
+    """Every assumption of the production chain (hashable, for caching)"""
+    masses: tuple = MOAI_MASSES
+    safety_factor: float = rm.SAFETY_FACTOR
+    load_per_ton: float = rm.LOAD_PER_TON
+    tensile_strength: float = rm.TENSILE_STRENGTH
+    packing_efficiency: float = rm.PACKING_EFFICIENCY
+    construction_efficiency: float = rm.CONSTRUCTION_EFFICIENCY
+    fiber_per_meter: float = FIBER_PER_METER
+    reference_diameter: float = REFERENCE_DIAMETER
+    rope_length: float = ps.ROPE_LENGTH
+    n_ropes: int = ps.N_ROPES
+    harvest_days_per_kg: float = ps.HARVEST_DAYS_PER_KG
+    retting_days: float = ps.RETTING_DAYS
+    preparation_days: float = ps.PREPARATION_DAYS
+    construction_days_per_m: float = ps.CONSTRUCTION_DAYS_PER_M
+    rope_lifetime_km: float = ROPE_LIFETIME_KM
+    transport_distance_km: float = TRANSPORT_DISTANCE_KM
+    parallel_batches: int = 3
+    parallel_retting_pits: int = 3
+
+
+@dataclasses.dataclass(frozen=True)
+class ProductionResult:
+    """Production chain evaluated for each moai mass (arrays over masses)"""
+    parameters: ProductionParameters
+    masses: np.ndarray
+    diameter: np.ndarray  # mm
+    fiber_mass: np.ndarray  # kg per rope set
+    stage_days: dict  # stage -> days of work per rope set
+    production_days: np.ndarray  # serial schedule makespan
+    parallel_days: np.ndarray  # makespan with parallel retting batches
+    serial_schedule: dict
+    parallel_schedule: dict
+    stage_person_days: dict  # stage -> person-days per rope set
+    person_days: np.ndarray  # per rope set
+    rope_sets_transport: np.ndarray  # rope sets for transport_distance_km
+    person_days_transport: np.ndarray
+
+
+# ============================================================================
+# CACHED FULL CHAIN
+# ============================================================================
+
+def _evaluate(params):
+    masses = np.asarray(params.masses, dtype=float)
+    diameter = rm.diameter_from_mass(masses, params.safety_factor,
+                                     params.load_per_ton,
+                                     params.tensile_strength,
+                                     params.packing_efficiency,
+                                     params.construction_efficiency)
+    fiber = fiber_mass(diameter, params.fiber_per_meter,
+                       params.reference_diameter, params.rope_length,
+                       params.n_ropes)
+
+    stage_kwargs = dict(n_ropes=params.n_ropes, rope_length=params.rope_length,
+                        harvest_days_per_kg=params.harvest_days_per_kg,
+                        retting_days=params.retting_days,
+                        preparation_days=params.preparation_days,
+                        construction_days_per_m=params.construction_days_per_m)
+    serial = ps.schedule(ps.rope_set_tasks(fiber, **stage_kwargs),
+                         ps.SERIAL_CAPACITIES)
+    parallel = ps.schedule(
+        ps.rope_set_tasks(fiber, n_batches=params.parallel_batches, **stage_kwargs),
+        {'harvest': 1, 'retting': params.parallel_retting_pits, 'construction': 1})
+
+    stage_days = {
+        'harvest': fiber * params.harvest_days_per_kg,
+        'retting': np.full_like(fiber, params.retting_days),
+        'preparation': np.full_like(fiber, params.preparation_days),
+        'construction': np.full_like(
+            fiber, params.rope_length * params.n_ropes * params.construction_days_per_m),
+    }
+    stage_person_days = labor_by_stage(fiber, diameter,
+                                       params.harvest_days_per_kg,
+                                       params.preparation_days,
+                                       params.construction_days_per_m,
+                                       params.rope_length, params.n_ropes)
+    person_days = sum(stage_person_days.values())
+    sets = rope_sets(np.full_like(fiber, params.transport_distance_km),
+                     params.rope_lifetime_km)
+
+    return ProductionResult(
+        parameters=params, masses=masses, diameter=diameter, fiber_mass=fiber,
+        stage_days=stage_days, production_days=serial['makespan'],
+        parallel_days=parallel['makespan'], serial_schedule=serial,
+        parallel_schedule=parallel, stage_person_days=stage_person_days,
+        person_days=person_days, rope_sets_transport=sets,
+        person_days_transport=sets * person_days)
+
+
+def _cache_key(params):
+    """Hash of the parameters and the source of every model module"""
+    digest = hashlib.sha256(json.dumps(dataclasses.asdict(params),
+                                       sort_keys=True).encode())
+    for module in (__file__, pk.__file__, ps.__file__, rm.__file__, mc.SOURCE):
+        with open(module, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()[:16]
+
+
+@functools.lru_cache(maxsize=32)
+def _cached(params):
+    path = os.path.join(CACHE_DIR, f'production_{_cache_key(params)}.pickle')
+    if os.path.exists(path):
+        with open(path, 'rb') as f:
+            return pickle.load(f)
+    result = _evaluate(params)
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    with open(path + '.tmp', 'wb') as f:
+        pickle.dump(result, f)
+    os.replace(path + '.tmp', path)
+    return result
+
+
+def production_model(params=None, **overrides):
+    """Evaluate (or fetch from cache) the production chain.
+
+    Pass a ProductionParameters instance and/or keyword overrides of its
+    fields, e.g. production_model(rope_lifetime_km=2.0).
+    """
+    params = params or ProductionParameters()
+    if 'masses' in overrides:
+        overrides['masses'] = tuple(float(m) for m in np.atleast_1d(overrides['masses']))
+    if overrides:
+        params = dataclasses.replace(params, **overrides)
+    return _cached(params)
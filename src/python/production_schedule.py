@@ -0,0 +1,187 @@
+"""
+Production Schedule: Resource-Constrained Critical Path for Rope Sets
+
+Figure 13 originally stacked harvesting + 38-day retting + 3-day preparation +
+0.3 d/m construction as if the stages were strictly serial. This module models
+the production of one rope set as a task DAG:
+
+    harvest batch b -> ret batch b -> dry/prepare batch b -> construct rope r
+
+Fiber is split into `n_batches` equal batches, and each rope is built from the
+batches assigned to it. Tasks compete for limited resources (harvesting crews,
+retting pits, construction crews); drying needs no crew. A list scheduler
+places every task at the earliest time its predecessors are done and a unit
+of its resource is free. Every duration may be an array over moai masses, so
+one call schedules all masses at once (the loop runs over the ~10-20 tasks,
+never over masses).
+
+With one batch and one unit of every resource the schedule reproduces the
+serial timeline of Figure 13; more batches and retting pits show where
+parallel retting shortens calendar time.
+
+Usage:
+    tasks = rope_set_tasks(fiber_mass, n_batches=3)
+    result = schedule(tasks, {'harvest': 1, 'retting': 3, 'construction': 1})
+    result['makespan'], result['critical_days']['retting']
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+# Production parameters (Figure 13), defined with the other production
+# assumptions in production_kernels.py
+from production_kernels import (CONSTRUCTION_DAYS_PER_M, HARVEST_DAYS_PER_KG,
+                                N_ROPES, PREPARATION_DAYS, RETTING_DAYS,
+                                ROPE_LENGTH)
+
+STAGES = ('harvest', 'retting', 'preparation', 'construction')
+
+SERIAL_CAPACITIES = {'harvest': 1, 'retting': 1, 'construction': 1}
+
+Task = namedtuple('Task', 'name stage resource duration predecessors')
+Task.__doc__ = """One production step; `duration` is in days (scalar or array
+over masses), `resource` is None for steps that need no crew, and
+`predecessors` are indices into the task list (which must be in
+topological order)."""
+
+
+def rope_set_tasks(fiber_mass, n_batches=1, n_ropes=N_ROPES,
+                   rope_length=ROPE_LENGTH,
+                   harvest_days_per_kg=HARVEST_DAYS_PER_KG,
+                   retting_days=RETTING_DAYS,
+                   preparation_days=PREPARATION_DAYS,
+                   construction_days_per_m=CONSTRUCTION_DAYS_PER_M):
+    """Task DAG for producing one rope set from `fiber_mass` kg of fiber"""
+    fiber_mass = np.asarray(fiber_mass, dtype=float)
+    tasks = []
+    prepared = []
+    for b in range(n_batches):
+        harvest = len(tasks)
+        tasks.append(Task(f'harvest {b + 1}', 'harvest', 'harvest',
+                          fiber_mass / n_batches * harvest_days_per_kg, ()))
+        tasks.append(Task(f'ret {b + 1}', 'retting', 'retting',
+                          np.full_like(fiber_mass, retting_days), (harvest,)))
+        tasks.append(Task(f'prepare {b + 1}', 'preparation', None,
+                          np.full_like(fiber_mass, preparation_days),
+                          (harvest + 1,)))
+        prepared.append(harvest + 2)
+
+    for r in range(n_ropes):
+        # Rope r uses batches [r*nb/nr, (r+1)*nb/nr), at least one batch
+        first = r * n_batches // n_ropes
+        last = max(first + 1, -(-(r + 1) * n_batches // n_ropes))
+        tasks.append(Task(f'construct rope {r + 1}', 'construction',
+                          'construction',
+                          np.full_like(fiber_mass, rope_length * construction_days_per_m),
+                          tuple(prepared[first:last])))
+    return tasks
+
+
+def schedule(tasks, capacities=None):
+    """Resource-constrained list schedule of `tasks`, vectorized over masses.
+
+    `capacities` maps resource name to the number of parallel units (crews,
+    retting pits); resources not listed default to one unit.
+
+    Returns a dict with
+        start, finish     (n_tasks, n_masses) start/finish day of each task
+        makespan          (n_masses,) calendar days for the rope set
+        critical          (n_tasks, n_masses) True for tasks on the critical path
+        critical_days     stage -> (n_masses,) critical-path days in that stage
+        busy_days         resource -> (n_masses,) unit-days of work
+        utilization       resource -> (n_masses,) busy / (capacity × makespan)
+    """
+    capacities = dict(capacities or {})
+    durations = np.broadcast_arrays(*[np.atleast_1d(task.duration) for task in tasks])
+    durations = np.array(durations, dtype=float)
+    n_tasks, n_masses = durations.shape
+    columns = np.arange(n_masses)
+
+    start = np.zeros((n_tasks, n_masses))
+    finish = np.zeros((n_tasks, n_masses))
+    # Task whose completion released this task (-1: none, starts at day 0)
+    binding = np.full((n_tasks, n_masses), -1)
+
+    # Per resource: when each unit becomes free and which task last used it
+    free_at = {}
+    last_task = {}
+    for task in tasks:
+        if task.resource is not None and task.resource not in free_at:
+            units = capacities.get(task.resource, 1)
+            free_at[task.resource] = np.zeros((n_masses, units))
+            last_task[task.resource] = np.full((n_masses, units), -1)
+
+    for i, task in enumerate(tasks):
+        ready = np.zeros(n_masses)
+        ready_from = np.full(n_masses, -1)
+        for p in task.predecessors:
+            later = finish[p] > ready
+            ready = np.where(later, finish[p], ready)
+            ready_from = np.where(later, p, ready_from)
+
+        if task.resource is None:
+            start[i] = ready
+            binding[i] = ready_from
+        else:
+            unit = np.argmin(free_at[task.resource], axis=1)
+            unit_free = free_at[task.resource][columns, unit]
+            waits_for_unit = unit_free > ready
+            start[i] = np.where(waits_for_unit, unit_free, ready)
+            binding[i] = np.where(waits_for_unit,
+                                  last_task[task.resource][columns, unit],
+                                  ready_from)
+        finish[i] = start[i] + durations[i]
+        if task.resource is not None:
+            free_at[task.resource][columns, unit] = finish[i]
+            last_task[task.resource][columns, unit] = i
+
+    makespan = finish.max(axis=0)
+
+    # Walk back from the last task along the binding chain
+    critical = np.zeros((n_tasks, n_masses), dtype=bool)
+    current = np.argmax(finish, axis=0)
+    for _ in range(n_tasks):
+        active = current >= 0
+        if not active.any():
+            break
+        critical[current[active], columns[active]] = True
+        current = np.where(active, binding[np.maximum(current, 0), columns], -1)
+
+    stages = [task.stage for task in tasks]
+    critical_days = {}
+    for stage in dict.fromkeys(stages):
+        rows = [i for i, s in enumerate(stages) if s == stage]
+        critical_days[stage] = (durations[rows] * critical[rows]).sum(axis=0)
+
+    busy_days = {}
+    utilization = {}
+    for resource in free_at:
+        rows = [i for i, task in enumerate(tasks) if task.resource == resource]
+        busy_days[resource] = durations[rows].sum(axis=0)
+        units = free_at[resource].shape[1]
+        utilization[resource] = busy_days[resource] / (units * makespan)
+
+    return {'start': start, 'finish': finish, 'makespan': makespan,
+            'critical': critical, 'critical_days': critical_days,
+            'busy_days': busy_days, 'utilization': utilization}
+
+
+if __name__ == '__main__':
+    fiber = np.array([5.3, 22.2, 49.3, 73.9, 101.0])  # kg, Figure 13 panel A
+    serial = schedule(rope_set_tasks(fiber), SERIAL_CAPACITIES)
+    parallel = schedule(rope_set_tasks(fiber, n_batches=3),
+                        {'harvest': 1, 'retting': 3, 'construction': 1})
+
+    print("=" * 70)
+    print("ROPE SET PRODUCTION SCHEDULE (calendar days)")
+    print("=" * 70)
+    print(f"{'Fiber':>8} {'Serial':>8} {'3 batches':>10} {'Saved':>7} "
+          f"{'Harvest util.':>14} {'Retting util.':>14}")
+    for i, kg in enumerate(fiber):
+        print(f"{kg:>6.1f}kg {serial['makespan'][i]:>7.0f}d "
+              f"{parallel['makespan'][i]:>9.0f}d "
+              f"{serial['makespan'][i] - parallel['makespan'][i]:>6.0f}d "
+              f"{parallel['utilization']['harvest'][i]:>13.0%} "
+              f"{parallel['utilization']['retting'][i]:>13.0%}")
+    print("=" * 70)
@@ -0,0 +1,222 @@
+"""
+Publish Figures to paper-figures/
+
+Copies the generated figures (src/python/figures/) to the publication
+directory (paper-figures/ at the repository root) under the names listed in
+paper-figures/manifest.json:
+
+    {"source_dir": "src/python/figures",
+     "files": {"<published name>": {"source": "<generated name>",
+                                    "sha256": "<hash of the published copy>"}}}
+
+Only files whose content hash differs from the published copy are copied,
+so a publish costs O(changed files). Hashes of unchanged files are reused
+from a stat cache (.cache/publish_stat.json, keyed by size and mtime), so
+unchanged files are not even read. Changed files are first staged next to
+their destination and fsynced; only when every copy succeeded are they
+renamed into place and the manifest rewritten (atomically). A failed
+publish leaves the previous set untouched.
+
+Files in paper-figures/ that the manifest does not list are stale: they are
+reported, and removed with --prune.
+
+Usage:
+    python3 publish_figures.py             # publish changed figures
+    python3 publish_figures.py --check     # report only; exit 1 if out of date
+    python3 publish_figures.py --prune     # also delete stale files
+    python3 publish_figures.py --init      # (re)write the name mapping
+
+--init maps every figureN_*.png/.pdf of figure9.py ... figure14.py to the
+same name, keeping the entries already in the manifest.
+"""
+
+import argparse
+import glob
+import json
+import os
+import shutil
+import sys
+
+from build_figures import FIGURE_SCRIPTS, SCRIPT_DIR, file_hash
+
+REPO_ROOT = os.path.dirname(os.path.dirname(SCRIPT_DIR))
+PUBLISH_DIR = os.path.join(REPO_ROOT, 'paper-figures')
+MANIFEST_NAME = 'manifest.json'
+SOURCE_DIR = 'src/python/figures'  # relative to the repository root
+PUBLISHED_EXTENSIONS = ('png', 'pdf')
+
+STAT_CACHE = os.path.join(SCRIPT_DIR, '.cache', 'publish_stat.json')
+
+# Never reported as stale
+KEEP = (MANIFEST_NAME, 'README.md', '.gitkeep')
+
+
+# ============================================================================
+# MANIFEST AND HASHES
+# ============================================================================
+
+def _write_json(data, path):
+    """Write JSON atomically"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path + '.tmp', 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+        f.write('\n')
+    os.replace(path + '.tmp', path)
+
+
+def load_manifest(publish_dir=PUBLISH_DIR):
+    path = os.path.join(publish_dir, MANIFEST_NAME)
+    if not os.path.exists(path):
+        return {'source_dir': SOURCE_DIR, 'files': {}}
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def default_mapping(source_dir):
+    """Every figureN_* PNG and PDF of the figure scripts, under its own name"""
+    names = []
+    for script in FIGURE_SCRIPTS:
+        for extension in PUBLISHED_EXTENSIONS:
+            pattern = os.path.join(source_dir, f'{script[:-3]}_*.{extension}')
+            # Derivatives (_web, _thumb) are not published
+            names += [os.path.basename(path) for path in sorted(glob.glob(pattern))
+                      if not path.endswith(('_web.png', '_thumb.png'))]
+    return {name: {'source': name} for name in names}
+
+
+class HashCache:
+    """SHA-256 of files, reused while their size and mtime are unchanged"""
+
+    def __init__(self, path=STAT_CACHE):
+        self.path = path
+        self.entries = {}
+        if os.path.exists(path):
+            with open(path, encoding='utf-8') as f:
+                self.entries = json.load(f)
+        self.dirty = False
+
+    def hash(self, path):
+        stat = os.stat(path)
+        key = os.path.abspath(path)
+        signature = [stat.st_size, stat.st_mtime_ns]
+        entry = self.entries.get(key)
+        if entry is None or entry['stat'] != signature:
+            entry = {'stat': signature, 'sha256': file_hash(path)}
+            self.entries[key] = entry
+            self.dirty = True
+        return entry['sha256']
+
+    def save(self):
+        if self.dirty:
+            _write_json(self.entries, self.path)
+
+
+# ============================================================================
+# PUBLISHING
+# ============================================================================
+
+def plan(manifest, publish_dir=PUBLISH_DIR, cache=None):
+    """What a publish would do: (changed, missing sources, stale files).
+
+    `changed` lists (published name, source path, source hash) for every
+    file whose published copy is absent or differs from its source.
+    """
+    cache = cache or HashCache()
+    source_dir = os.path.join(REPO_ROOT, manifest.get('source_dir', SOURCE_DIR))
+    changed, missing = [], []
+    for name, entry in sorted(manifest['files'].items()):
+        source = os.path.join(source_dir, entry['source'])
+        if not os.path.exists(source):
+            missing.append(entry['source'])
+            continue
+        digest = cache.hash(source)
+        target = os.path.join(publish_dir, name)
+        if entry.get('sha256') != digest or not os.path.exists(target) \
+                or cache.hash(target) != digest:
+            changed.append((name, source, digest))
+    listed = set(manifest['files']) | set(KEEP)
+    stale = sorted(name for name in os.listdir(publish_dir)
+                   if name not in listed and not name.startswith('.')
+                   and os.path.isfile(os.path.join(publish_dir, name))) \
+        if os.path.isdir(publish_dir) else []
+    return changed, missing, stale
+
+
+def publish(manifest, changed, publish_dir=PUBLISH_DIR, cache=None):
+    """Copy `changed` files into place all-or-nothing, then record them"""
+    os.makedirs(publish_dir, exist_ok=True)
+    staged = []
+    try:
+        for name, source, digest in changed:
+            temporary = os.path.join(publish_dir, f'.{name}.tmp')
+            with open(source, 'rb') as src, open(temporary, 'wb') as dst:
+                shutil.copyfileobj(src, dst, 1 << 20)
+                dst.flush()
+                os.fsync(dst.fileno())
+            staged.append((temporary, name, digest))
+    except BaseException:
+        for temporary, _, _ in staged:
+            os.remove(temporary)
+        raise
+    for temporary, name, digest in staged:
+        target = os.path.join(publish_dir, name)
+        os.replace(temporary, target)
+        manifest['files'][name]['sha256'] = digest
+        if cache is not None:
+            cache.hash(target)
+    _write_json(manifest, os.path.join(publish_dir, MANIFEST_NAME))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--check', action='store_true',
+                        help='only report; exit 1 if paper-figures/ is out of date')
+    parser.add_argument('--prune', action='store_true',
+                        help='delete files the manifest does not list')
+    parser.add_argument('--init', action='store_true',
+                        help='add every generated figure to the manifest under '
+                             'its own name')
+    args = parser.parse_args(argv)
+
+    manifest = load_manifest()
+    if args.init:
+        source_dir = os.path.join(REPO_ROOT, manifest.get('source_dir', SOURCE_DIR))
+        manifest['files'] = {**default_mapping(source_dir), **manifest['files']}
+    if not manifest['files']:
+        raise SystemExit("publish: the manifest lists no figures (run with --init)")
+
+    cache = HashCache()
+    changed, missing, stale = plan(manifest, cache=cache)
+
+    print("=" * 70)
+    print(f"PUBLISHING {len(manifest['files'])} FIGURE FILES TO paper-figures/")
+    print("=" * 70)
+    for name, source, _ in changed:
+        print(f"  {'would copy' if args.check else 'copy':<10}  "
+              f"{os.path.basename(source)} -> {name}")
+    for source in missing:
+        print(f"  missing     {source} (not generated; run build_figures.py)")
+    for name in stale:
+        action = 'prune' if args.prune and not args.check else 'stale'
+        print(f"  {action:<10}  {name}")
+
+    if not args.check:
+        if changed or args.init:
+            publish(manifest, changed, cache=cache)
+        if args.prune:
+            for name in stale:
+                os.remove(os.path.join(PUBLISH_DIR, name))
+        cache.save()
+
+    print("-" * 70)
+    unchanged = len(manifest['files']) - len(changed) - len(missing)
+    print(f"{len(changed)} changed, {unchanged} unchanged, {len(missing)} missing, "
+          f"{len(stale)} stale{' (pruned)' if args.prune and not args.check else ''}")
+    print("=" * 70)
+    if args.check:
+        return 1 if changed or missing or stale else 0
+    return 1 if missing else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
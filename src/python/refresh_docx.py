@@ -0,0 +1,303 @@
+"""
+Refresh Figures in the Manuscript (moai_rope.docx)
+
+Replaces the figure images embedded in the Word manuscript with the
+generated ones, without opening a word processor or rebuilding the
+document. DOCX_FIGURES maps each `word/media/*` part of the docx zip to a
+generated figure; the manuscript still uses the old figure numbers (its
+Figure 8 is figure9.py, and so on), and Figure 14 is not in it yet.
+
+    python3 refresh_docx.py              # refresh moai_rope.docx in place
+    python3 refresh_docx.py --check      # report stale images; exit 1 if any
+    python3 refresh_docx.py --list       # media parts and their captions
+    python3 refresh_docx.py -o draft.docx
+
+The embedded images are web resolution, so the 150 dpi `<name>_web.png`
+derivative is used (or the 600 dpi PNG downsampled to it, if the
+derivative has not been built; --full embeds the 600 dpi PNG). A part is
+replaced only if its bytes change (compared by CRC-32 and size, without
+decompressing the old part). Every other zip member, local header and
+compressed data, is streamed through byte for byte; only replaced parts
+are compressed. The local headers, central directory and end record are
+written by refresh_docx.py itself (zipfile only reads the old docx), so
+no private ZipFile internals are involved. When a new image has a different aspect ratio, the
+drawing's extent in word/document.xml is adjusted (width kept), so that
+part is rewritten too. The new docx is written next to the old one and
+renamed over it, so the manuscript is never left half-written.
+"""
+
+import argparse
+import io
+import os
+import re
+import struct
+import sys
+import zipfile
+import zlib
+
+import figure_style
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(os.path.dirname(SCRIPT_DIR))
+DOCX = os.path.join(REPO_ROOT, 'moai_rope.docx')
+FIGURE_DIR = os.path.join(SCRIPT_DIR, figure_style.OUTPUT_DIR)
+
+# docx media part -> generated figure (manuscript caption number)
+DOCX_FIGURES = {
+    'word/media/image13.png': 'figure9_tensile_strength_scaling',  # Figure 8
+    'word/media/image5.png': 'figure10_grip_limits',  # Figure 9
+    'word/media/image1.png': 'figure11_transport_scenarios',  # Figure 10
+    'word/media/image2.png': 'figure12_moai_progression',  # Figure 11
+    'word/media/image3.png': 'figure13_rope_production_investment',  # Figure 12
+}
+
+DOCUMENT = 'word/document.xml'
+RELATIONSHIPS = 'word/_rels/document.xml.rels'
+ASPECT_TOLERANCE = 0.01  # relative aspect change that resizes the drawing
+
+
+# ============================================================================
+# NEW IMAGES
+# ============================================================================
+
+def figure_image(name, full=False):
+    """PNG bytes to embed for generated figure `name`"""
+    web = os.path.join(FIGURE_DIR, f'{name}_web.png')
+    if not full and os.path.exists(web):
+        with open(web, 'rb') as f:
+            return f.read()
+    path = os.path.join(FIGURE_DIR, f'{name}.png')
+    if not full:
+        print(f"  ({name}_web.png not built; downsampling {name}.png)")
+    if full:
+        with open(path, 'rb') as f:
+            return f.read()
+    from PIL import Image
+    image = Image.open(path)
+    factor = max(1, round(figure_style.PUBLICATION_DPI / figure_style.WEB_DPI))
+    buffer = io.BytesIO()
+    image.reduce(factor).save(buffer, format='PNG', optimize=True,
+                              dpi=(figure_style.WEB_DPI,) * 2)
+    return buffer.getvalue()
+
+
+def png_size(data):
+    """(width, height) from a PNG header"""
+    if data[:8] != b'\x89PNG\r\n\x1a\n':
+        raise ValueError("not a PNG image")
+    return int.from_bytes(data[16:20], 'big'), int.from_bytes(data[20:24], 'big')
+
+
+# ============================================================================
+# DOCUMENT XML
+# ============================================================================
+
+def media_relationships(rels):
+    """media part name -> relationship id"""
+    return {'word/' + target: rid for rid, target in re.findall(
+        r'<Relationship [^>]*?Id="(rId\d+)"[^>]*?Target="(media/[^"]+)"', rels)}
+
+
+def _drawing(document, rid):
+    """Span of the <w:drawing> element embedding relationship `rid`"""
+    embed = document.find(f'r:embed="{rid}"')
+    if embed < 0:
+        return None
+    return (document.rfind('<w:drawing>', 0, embed),
+            document.find('</w:drawing>', embed))
+
+
+def drawing_caption(document, rid, length=70):
+    """Text following the drawing (the figure caption)"""
+    span = _drawing(document, rid)
+    if span is None:
+        return ''
+    text = re.sub(r'<[^>]+>', '', document[span[1]:span[1] + 4000])
+    return ' '.join(text.split())[:length]
+
+
+def resize_drawing(document, rid, aspect):
+    """`document` with the drawing of `rid` given width/height `aspect`
+    (width kept), or unchanged if its aspect already matches"""
+    span = _drawing(document, rid)
+    if span is None:
+        return document
+    start, end = span
+    drawing = document[start:end]
+    extent = re.search(r'<wp:extent cx="(\d+)" cy="(\d+)"', drawing)
+    width, height = int(extent.group(1)), int(extent.group(2))
+    if abs(width / height / aspect - 1) <= ASPECT_TOLERANCE:
+        return document
+    new_height = round(width / aspect)
+    drawing = re.sub(r'(<(?:wp:extent|a:ext) cx="\d+" cy=")\d+(")',
+                     rf'\g<1>{new_height}\g<2>', drawing)
+    return document[:start] + drawing + document[end:]
+
+
+# ============================================================================
+# ZIP STREAMING
+# ============================================================================
+
+# Zip records (APPNOTE.TXT 4.3.7, 4.3.12, 4.3.16), without their signatures
+LOCAL_HEADER = struct.Struct('<5H3L2H')
+CENTRAL_HEADER = struct.Struct('<6H3L5H2L')
+END_RECORD = struct.Struct('<4H2LH')
+LOCAL_SIGNATURE = b'PK\x03\x04'
+CENTRAL_SIGNATURE = b'PK\x01\x02'
+END_SIGNATURE = b'PK\x05\x06'
+UTF8_FLAG = 0x800
+
+
+def _raw_blocks(source):
+    """member -> (offset, length) of its local header, data and descriptor"""
+    infos = sorted(source.infolist(), key=lambda info: info.header_offset)
+    ends = [info.header_offset for info in infos[1:]] + [source.start_dir]
+    return {info.filename: (info.header_offset, end - info.header_offset)
+            for info, end in zip(infos, ends)}
+
+
+def _central_records(raw, source):
+    """member -> (fixed fields, name, extra, comment) of its central
+    directory record, in directory order"""
+    raw.seek(source.start_dir)
+    records = {}
+    for info in source.infolist():
+        if raw.read(4) != CENTRAL_SIGNATURE:
+            raise ValueError("unexpected central directory layout")
+        fields = list(CENTRAL_HEADER.unpack(raw.read(CENTRAL_HEADER.size)))
+        name, extra, comment = (raw.read(length) for length in fields[9:12])
+        if 0xFFFFFFFF in fields[7:9] + fields[15:16]:
+            raise ValueError(f"{info.filename}: ZIP64 members are not supported")
+        records[info.filename] = fields, name, extra, comment
+    return records
+
+
+def rewrite_zip(path, output, replacements):
+    """Copy the zip at `path` to `output`, replacing the members in
+    `replacements` (name -> bytes) and streaming every other member's
+    local header and compressed bytes through unchanged.
+
+    The records are written here rather than through ZipFile, which has no
+    public way to add an already-compressed member."""
+    with zipfile.ZipFile(path) as source, open(path, 'rb') as raw, \
+            open(output, 'wb') as target:
+        blocks = _raw_blocks(source)
+        records = _central_records(raw, source)
+        directory = []
+        for info in source.infolist():
+            fields, name, extra, comment = records[info.filename]
+            offset = target.tell()
+            if info.filename in replacements:
+                data = replacements[info.filename]
+                compressor = zlib.compressobj(zlib.Z_DEFAULT_COMPRESSION,
+                                              zlib.DEFLATED, -15)
+                compressed = compressor.compress(data) + compressor.flush()
+                crc = zlib.crc32(data)
+                flags = fields[2] & UTF8_FLAG  # sizes in the header, no descriptor
+                # version needed, flags, method, time, date, crc, sizes, name, extra
+                target.write(LOCAL_SIGNATURE + LOCAL_HEADER.pack(
+                    20, flags, zipfile.ZIP_DEFLATED, fields[4], fields[5],
+                    crc, len(compressed), len(data), len(name), 0) + name)
+                target.write(compressed)
+                fields[1:4] = 20, flags, zipfile.ZIP_DEFLATED
+                fields[6:10] = crc, len(compressed), len(data), len(name)
+                fields[10] = 0
+                extra = b''
+            else:
+                block_offset, length = blocks[info.filename]
+                raw.seek(block_offset)
+                target.write(raw.read(length))
+            fields[15] = offset
+            directory.append(CENTRAL_SIGNATURE + CENTRAL_HEADER.pack(*fields)
+                             + name + extra + comment)
+        start = target.tell()
+        for record in directory:
+            target.write(record)
+        target.write(END_SIGNATURE + END_RECORD.pack(
+            0, 0, len(directory), len(directory), target.tell() - start, start,
+            len(source.comment)) + source.comment)
+
+
+def stale_parts(docx=DOCX, full=False):
+    """Replacements needed to bring `docx` up to date: (name -> new bytes,
+    list of (media part, figure, old size, new size))"""
+    replacements, report = {}, []
+    with zipfile.ZipFile(docx) as source:
+        infos = {info.filename: info for info in source.infolist()}
+        relationships = media_relationships(source.read(RELATIONSHIPS).decode('utf-8'))
+        document = original = None
+        for part, figure in DOCX_FIGURES.items():
+            if part not in infos:
+                raise SystemExit(f"refresh_docx: {part} is not in {docx}; "
+                                 "update DOCX_FIGURES (see --list)")
+            data = figure_image(figure, full)
+            info = infos[part]
+            if (zipfile.crc32(data), len(data)) == (info.CRC, info.file_size):
+                continue
+            replacements[part] = data
+            report.append((part, figure, info.file_size, len(data)))
+            if document is None:
+                document = original = source.read(DOCUMENT).decode('utf-8')
+            width, height = png_size(data)
+            document = resize_drawing(document, relationships[part], width / height)
+        if document is not None and document != original:
+            replacements[DOCUMENT] = document.encode('utf-8')
+    return replacements, report
+
+
+def list_media(docx=DOCX):
+    """Print every media part, its mapped figure and its caption"""
+    with zipfile.ZipFile(docx) as source:
+        relationships = media_relationships(source.read(RELATIONSHIPS).decode('utf-8'))
+        document = source.read(DOCUMENT).decode('utf-8')
+        for info in source.infolist():
+            if info.filename.startswith('word/media/'):
+                rid = relationships.get(info.filename)
+                caption = drawing_caption(document, rid) if rid else '(unused)'
+                figure = DOCX_FIGURES.get(info.filename, '-')
+                print(f"{info.filename:<24} {figure:<38}\n    {caption}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('docx', nargs='?', default=DOCX,
+                        help='manuscript to refresh (default: moai_rope.docx)')
+    parser.add_argument('-o', '--output',
+                        help='write the refreshed copy here instead of in place')
+    parser.add_argument('--check', action='store_true',
+                        help='only report stale images; exit 1 if any')
+    parser.add_argument('--list', action='store_true',
+                        help='list media parts, mapped figures and captions')
+    parser.add_argument('--full', action='store_true',
+                        help='embed the 600 dpi PNGs instead of the 150 dpi copies')
+    args = parser.parse_args(argv)
+
+    if args.list:
+        list_media(args.docx)
+        return 0
+    replacements, report = stale_parts(args.docx, args.full)
+    for part, figure, old_size, new_size in report:
+        print(f"  {'stale' if args.check else 'replace'}  {part:<24} <- {figure}.png "
+              f"({old_size / 1024:,.0f} -> {new_size / 1024:,.0f} KB)")
+    if DOCUMENT in replacements:
+        print(f"  {'stale' if args.check else 'resize'}   drawing extents in {DOCUMENT}")
+    if not report:
+        print(f"{os.path.basename(args.docx)}: all {len(DOCX_FIGURES)} figures up to date")
+        return 0
+    if args.check:
+        return 1
+
+    output = args.output or args.docx
+    temporary = output + '.tmp'
+    try:
+        rewrite_zip(args.docx, temporary, replacements)
+        os.replace(temporary, output)
+    finally:
+        if os.path.exists(temporary):
+            os.remove(temporary)
+    print(f"{os.path.basename(output)}: {len(report)} figure(s) refreshed")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
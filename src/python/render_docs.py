@@ -0,0 +1,180 @@
+"""
+Render the Markdown Documents from Templates and Key Values
+
+The numbers in the captions and manuscript sections are not typed by hand:
+each document has a template in src/python/templates/ (same path as the
+document, relative to the repository root) whose placeholders name a value
+of figures/key_values.json (see key_values.py) and a Python format spec:
+
+    Paro requires {{caption.production.paro.fiber_kg:.1f}} kg of fiber
+    ... reaches approximately {{caption.production.paro.person_days_transport:,.0f}} person-days
+
+Rendering is incremental. .cache/render_docs.json records, per document,
+the template's hash, the values its placeholders referenced and the hash
+of the rendered text; a document is re-rendered only when its template or
+one of its referenced values changed (or the file is missing). A document
+whose text no longer matches what was rendered has been edited by hand:
+it is reported and left alone (exit 1) unless --force is given. Move such
+edits into the template.
+
+Usage:
+    python3 render_docs.py            # re-render documents whose values changed
+    python3 render_docs.py --check    # report only; exit 1 if any is stale
+    python3 render_docs.py --force    # re-render everything, overwriting edits
+"""
+
+import argparse
+import glob
+import hashlib
+import json
+import os
+import re
+import sys
+
+import key_values as kv
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(os.path.dirname(SCRIPT_DIR))
+TEMPLATE_DIR = os.path.join(SCRIPT_DIR, 'templates')
+STATE = os.path.join(SCRIPT_DIR, '.cache', 'render_docs.json')
+
+# {{model.name}} or {{model.name:format_spec}}
+PLACEHOLDER = re.compile(r'\{\{\s*([a-z]\w*(?:\.\w+)+)\s*(?::([^}]*))?\}\}')
+
+HEADER = ('<!-- Generated by src/python/render_docs.py from '
+          'src/python/templates/{path}; edit the template. -->\n')
+
+
+class TemplateError(ValueError):
+    """A placeholder names an unknown value or has a bad format spec"""
+
+
+def _hash(text):
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def templates(template_dir=TEMPLATE_DIR):
+    """Document paths (relative to the repository root) that have a template"""
+    paths = glob.glob(os.path.join(template_dir, '**', '*.md'), recursive=True)
+    return sorted(os.path.relpath(path, template_dir).replace(os.sep, '/')
+                  for path in paths)
+
+
+def referenced(template):
+    """Value names the placeholders of `template` use"""
+    return sorted({match.group(1) for match in PLACEHOLDER.finditer(template)})
+
+
+def render(template, values, path=''):
+    """`template` with every placeholder replaced by its formatted value"""
+    def substitute(match):
+        name, spec = match.group(1), match.group(2) or 'g'
+        line = template.count('\n', 0, match.start()) + 1
+        if name not in values:
+            raise TemplateError(f"{path}:{line}: unknown key value '{name}'")
+        try:
+            return format(values[name], spec)
+        except ValueError as error:
+            raise TemplateError(f"{path}:{line}: {name}:{spec}: {error}") from None
+    return HEADER.format(path=path) + PLACEHOLDER.sub(substitute, template)
+
+
+# ============================================================================
+# INCREMENTAL RENDERING
+# ============================================================================
+
+def load_state(path=STATE):
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_state(state, path=STATE):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path + '.tmp', 'w', encoding='utf-8') as f:
+        json.dump(state, f, indent=2, sort_keys=True)
+        f.write('\n')
+    os.replace(path + '.tmp', path)
+
+
+def _read(path):
+    with open(path, encoding='utf-8') as f:
+        return f.read()
+
+
+def status(document, template, values, entry):
+    """'current', 'stale' (template or values changed), 'missing' or 'edited'"""
+    output = os.path.join(REPO_ROOT, document)
+    if not os.path.exists(output):
+        return 'missing'
+    if entry is None:
+        # Never rendered here: current only if rendering reproduces the file
+        return 'current' if _read(output) == render(template, values, document) \
+            else 'stale'
+    if _hash(_read(output)) != entry['output']:
+        return 'edited'
+    if entry['template'] != _hash(template) or entry['values'] != \
+            {name: values.get(name) for name in referenced(template)}:
+        return 'stale'
+    return 'current'
+
+
+def render_documents(documents, values, state, force=False, check=False):
+    """Re-render the out-of-date `documents`; return {document: status}"""
+    report = {}
+    for document in documents:
+        template = _read(os.path.join(TEMPLATE_DIR, document))
+        report[document] = state_of = status(document, template, values,
+                                             state.get(document))
+        if check or state_of == 'current' and document in state:
+            continue
+        if state_of == 'edited' and not force:
+            continue
+        text = render(template, values, document)
+        output = os.path.join(REPO_ROOT, document)
+        if state_of != 'current':
+            with open(output + '.tmp', 'w', encoding='utf-8') as f:
+                f.write(text)
+            os.replace(output + '.tmp', output)
+        state[document] = {'template': _hash(template), 'output': _hash(text),
+                           'values': {name: values[name] for name in referenced(template)}}
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('documents', nargs='*',
+                        help='documents to render (default: every template)')
+    parser.add_argument('--check', action='store_true',
+                        help='only report; exit 1 if a document is out of date')
+    parser.add_argument('--force', action='store_true',
+                        help='re-render every document, overwriting hand edits')
+    args = parser.parse_args(argv)
+
+    documents = args.documents or templates()
+    values = kv.load_key_values()
+    state = load_state()
+    try:
+        report = render_documents(documents, values, state, args.force, args.check)
+    except TemplateError as error:
+        raise SystemExit(f"render_docs: {error}")
+    if not args.check:
+        save_state(state)
+
+    actions = {'stale': 'would render' if args.check else 'rendered',
+               'missing': 'would render' if args.check else 'rendered',
+               'edited': 'overwritten' if args.force and not args.check
+               else 'EDITED by hand (edit the template; --force overwrites)'}
+    for document, state_of in report.items():
+        if state_of != 'current':
+            print(f"  {document:<42} {actions[state_of]}")
+    pending = [d for d, s in report.items()
+               if s != 'current' and (args.check or s == 'edited' and not args.force)]
+    print(f"{len(report)} documents, "
+          f"{sum(s != 'current' for s in report.values())} out of date")
+    return 1 if pending else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,254 @@
+"""
+Rope: Command-Line Queries of the Rope and Production Model
+
+Answers one question without editing a script or importing matplotlib:
+
+    python3 rope.py diameter 82 --sf 8          # rope for 82 t at SF=8 (mm)
+    python3 rope.py breaking-load 45            # 45 mm rope (kN)
+    python3 rope.py fiber 4.3 18 82             # fiber per rope set (kg)
+    python3 rope.py person-days Paro --distance 6
+    python3 rope.py campaign 82 --distance 6    # one statue moved 6 km
+    python3 rope.py campaign --csv moai_catalog.csv
+
+Values on the command line are evaluated in pure Python: rope_mechanics and
+production_kernels need no NumPy, so a query costs little more than starting
+the interpreter. Statue names (e.g. Paro) are looked up in the moai catalog,
+which loads NumPy on demand.
+
+Batch input comes from a CSV file (--csv FILE) or standard input ('-'):
+one row per query, '#' lines ignored, comma or whitespace separated. A
+first row naming one of the columns is a header and selects columns by
+name (defaults: mass_t, diameter_mm, distance_km; override with --column);
+otherwise there is no header and the columns are taken in order. Batches are read into NumPy arrays (imported only then)
+and evaluated in one vectorized call.
+
+Output is CSV with a header row (--no-header to omit it).
+"""
+
+import argparse
+import csv
+import math
+import operator
+import sys
+
+import production_kernels as pk
+import rope_mechanics as rm
+
+# ============================================================================
+# QUERIES
+# ============================================================================
+
+
+def _diameter(mass, args):
+    return rm.diameter_from_mass(mass, args.sf, args.load_per_ton, args.strength,
+                                 args.packing, args.construction)
+
+
+def query_diameter(inputs, args):
+    return {'diameter_mm': _diameter(inputs['mass_t'], args)}
+
+
+def query_breaking_load(inputs, args):
+    return {'breaking_load_kN': rm.breaking_load(inputs['diameter_mm'], args.strength,
+                                                 args.packing, args.construction)}
+
+
+def query_fiber(inputs, args):
+    diameter = _diameter(inputs['mass_t'], args)
+    return {'diameter_mm': diameter,
+            'fiber_kg': pk.fiber_mass(diameter, args.fiber_per_meter)}
+
+
+def query_person_days(inputs, args):
+    diameter = _diameter(inputs['mass_t'], args)
+    fiber = pk.fiber_mass(diameter, args.fiber_per_meter)
+    per_set = sum(pk.labor_by_stage(fiber, diameter).values())
+    sets = pk.rope_sets(args.distance, args.lifetime)
+    return {'person_days_per_set': per_set, 'rope_sets': sets,
+            'person_days': sets * per_set}
+
+
+def query_campaign(inputs, args):
+    mass = inputs['mass_t']
+    diameter = _diameter(mass, args)
+    fiber = pk.fiber_mass(diameter, args.fiber_per_meter)
+    per_set = sum(pk.labor_by_stage(fiber, diameter).values())
+    sets = pk.rope_sets(inputs['distance_km'], args.lifetime)
+    return {'rope_sets': sets, 'fiber_kg': sets * fiber,
+            'person_days': sets * per_set,
+            'production_days': pk.serial_days(fiber),
+            'community_days': sets * per_set
+            / pk.daily_capacity(args.population, args.working_fraction)}
+
+
+# name -> (input columns, function); campaign takes its distance from
+# --distance when the inputs are given on the command line
+QUERIES = {
+    'diameter': (('mass_t',), query_diameter),
+    'breaking-load': (('diameter_mm',), query_breaking_load),
+    'fiber': (('mass_t',), query_fiber),
+    'person-days': (('mass_t',), query_person_days),
+    'campaign': (('mass_t', 'distance_km'), query_campaign),
+}
+
+
+# ============================================================================
+# INPUT
+# ============================================================================
+
+def parse_value(text, column):
+    """A number, or for masses a statue name from the moai catalog"""
+    try:
+        return float(text)
+    except ValueError:
+        if column != 'mass_t':
+            raise SystemExit(f"rope: '{text}' is not a number")
+    import moai_catalog as mc
+    try:
+        return float(mc.mass(text))
+    except KeyError:
+        raise SystemExit(f"rope: unknown statue '{text}'") from None
+
+
+def read_rows(lines):
+    """Split batch lines into rows of fields (comments and blanks skipped);
+    comma separated if the first row has a comma, else whitespace"""
+    lines = [line for line in lines if line.strip() and not line.lstrip().startswith('#')]
+    if lines and ',' in lines[0]:
+        return list(csv.reader(lines, skipinitialspace=True))
+    return [line.split() for line in lines]
+
+
+def batch_inputs(lines, columns):
+    """Input arrays (by column name) from batch lines"""
+    import numpy as np
+
+    rows = read_rows(lines)
+    if not rows:
+        raise SystemExit("rope: no input rows")
+    # A header names at least one expected column; a first row of values
+    # (numbers or statue names) is data
+    header = None
+    if any(name in rows[0] for name in columns):
+        header, rows = rows[0], rows[1:]
+
+    if header is None:
+        positions = range(len(columns))
+    else:
+        missing = [name for name in columns if name not in header]
+        if missing:
+            raise SystemExit(f"rope: column(s) {', '.join(missing)} not in header "
+                             f"({', '.join(header)}); use --column")
+        positions = [header.index(name) for name in columns]
+    table = list(map(operator.itemgetter(*positions), rows))
+    try:
+        values = np.array(table, dtype=float).reshape(len(rows), len(columns))
+    except ValueError:
+        # Empty cells (not recorded) evaluate to NaN; names are looked up
+        table = [row if isinstance(row, tuple) else (row,) for row in table]
+        values = np.array([[parse_value(text or 'nan', name)
+                            for text, name in zip(row, columns)]
+                           for row in table]).reshape(len(rows), len(columns))
+    return {name: values[:, i] for i, name in enumerate(columns)}
+
+
+# ============================================================================
+# OUTPUT
+# ============================================================================
+
+def write_csv(inputs, outputs, header=True, out=None):
+    """Write input and output columns as CSV rows (scalars or arrays)"""
+    out = out or sys.stdout
+    columns = {**inputs, **outputs}
+    if header:
+        out.write(','.join(columns) + '\n')
+    values = list(columns.values())
+    if all(isinstance(value, float) for value in values):
+        out.write(','.join(f'{value:.6g}' for value in values) + '\n')
+        return
+    import numpy as np
+    table = np.column_stack(np.broadcast_arrays(*values))
+    row_format = ','.join(['%.6g'] * table.shape[1]) + '\n'
+    out.write(''.join([row_format % row for row in map(tuple, table.tolist())]))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='rope', description='Query the rope and production model.')
+    parser.add_argument('query', choices=QUERIES)
+    parser.add_argument('values', nargs='*',
+                        help="masses in t (or statue names), diameters in mm for "
+                             "breaking-load; '-' reads a batch from stdin")
+    parser.add_argument('--csv', metavar='FILE', help='read a batch from a CSV file')
+    parser.add_argument('--column', metavar='NAMES',
+                        help='comma-separated input column names in the batch header')
+    parser.add_argument('--sf', type=float, default=rm.SAFETY_FACTOR,
+                        help='safety factor (default: %(default)s)')
+    parser.add_argument('--load-per-ton', type=float, default=rm.LOAD_PER_TON,
+                        help='working load, kN per ton (default: %(default)s)')
+    parser.add_argument('--strength', type=float, default=rm.TENSILE_STRENGTH,
+                        help='fiber tensile strength, MPa (default: %(default)s)')
+    parser.add_argument('--packing', type=float, default=rm.PACKING_EFFICIENCY,
+                        help='packing efficiency (default: %(default)s)')
+    parser.add_argument('--construction', type=float, default=rm.CONSTRUCTION_EFFICIENCY,
+                        help='construction efficiency (default: %(default)s)')
+    parser.add_argument('--fiber-per-meter', type=float, default=pk.FIBER_PER_METER,
+                        help='g of fiber per m at 25 mm (default: %(default)s)')
+    parser.add_argument('--distance', type=float, default=pk.TRANSPORT_DISTANCE_KM,
+                        help='transport distance, km (default: %(default)s)')
+    parser.add_argument('--lifetime', type=float, default=pk.ROPE_LIFETIME_KM,
+                        help='km per rope set (default: %(default)s)')
+    parser.add_argument('--population', type=float, default=pk.POPULATION,
+                        help='community size for campaign (default: %(default)s)')
+    parser.add_argument('--working-fraction', type=float, default=pk.WORKING_FRACTION,
+                        help='share of the population working (default: %(default)s)')
+    parser.add_argument('--no-header', action='store_true', help='omit the header row')
+    args = parser.parse_args(argv)
+
+    columns, function = QUERIES[args.query]
+    if args.csv or args.values == ['-']:
+        if args.column:
+            names = args.column.split(',')
+            if len(names) != len(columns):
+                parser.error(f"--column needs {len(columns)} name(s) for {args.query}")
+        else:
+            names = columns
+        if args.csv:
+            with open(args.csv, encoding='utf-8') as f:
+                inputs = batch_inputs(f, names)
+        else:
+            inputs = batch_inputs(sys.stdin, names)
+        inputs = dict(zip(columns, inputs.values()))
+    elif args.values:
+        inputs = {columns[0]: [parse_value(text, columns[0]) for text in args.values]}
+        if args.query == 'campaign':
+            inputs['distance_km'] = [args.distance] * len(args.values)
+    else:
+        parser.error('give values, a CSV file (--csv) or - for stdin')
+
+    n_rows = len(inputs[columns[0]])
+    if isinstance(inputs[columns[0]], list):
+        # Command-line values: pure Python, one row at a time
+        results = []
+        for i in range(n_rows):
+            row = {name: values[i] for name, values in inputs.items()}
+            results.append(function(row, args))
+            write_csv(row, results[-1], header=not args.no_header and i == 0)
+        outputs = {name: [result[name] for result in results] for name in results[0]}
+    else:
+        outputs = function(inputs, args)
+        write_csv(inputs, outputs, header=not args.no_header)
+
+    if args.query == 'campaign' and n_rows > 1:
+        # Statues without a recorded distance (NaN) do not count
+        counted = [i for i, distance in enumerate(inputs['distance_km'])
+                   if math.isfinite(distance)]
+        totals = {name: sum(outputs[name][i] for i in counted)
+                  for name in ('rope_sets', 'person_days', 'community_days')}
+        print(f"# {len(counted)} statues: {totals['rope_sets']:,.0f} rope sets, "
+              f"{totals['person_days']:,.0f} person-days = "
+              f"{totals['community_days']:.1f} days of community labor")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,219 @@
+"""
+Rope Inverse: Which Input Reaches a Target Output?
+
+The check scripts answer "what diameter for mass X" by evaluating hand-picked
+masses. invert() runs the model backwards: give it a target value (or an
+array of targets) for one output and the name of the input to solve for, and
+it returns the input value(s) that reach the target, all other inputs held at
+the paper values or given overrides.
+
+Pairs with a closed form (diameter vs mass, safety factor, tensile strength
+or load per ton) are solved directly. Everything else uses a batched
+bracketed root finder (Illinois false position) that updates all targets at
+once, so thousands of targets cost about as much as one.
+
+Usage:
+    invert('diameter', 50, 'mass')                      # largest mass under 50 mm
+    invert('person_days_transport', [800, 1000], 'safety_factor', mass=82)
+    invert('diameter', 50, 'tensile_strength', mass=260)
+"""
+
+import numpy as np
+
+import moai_catalog as mc
+import production_model as pm
+import rope_mechanics as rm
+
+# ============================================================================
+# FORWARD MODEL
+# ============================================================================
+
+INPUTS = {
+    'mass': mc.mass('Paro'),  # tons
+    'safety_factor': rm.SAFETY_FACTOR,
+    'load_per_ton': rm.LOAD_PER_TON,  # kN per ton
+    'tensile_strength': rm.TENSILE_STRENGTH,  # MPa
+    'packing_efficiency': rm.PACKING_EFFICIENCY,
+    'construction_efficiency': rm.CONSTRUCTION_EFFICIENCY,
+    'fiber_per_meter': pm.FIBER_PER_METER,  # g/m at the reference diameter
+    'reference_diameter': pm.REFERENCE_DIAMETER,  # mm
+    'distance_km': pm.TRANSPORT_DISTANCE_KM,
+    'rope_lifetime_km': pm.ROPE_LIFETIME_KM,
+}
+
+OUTPUTS = ('diameter', 'breaking_load', 'fiber_mass', 'person_days',
+           'person_days_transport')
+
+# Search interval for each input when no closed form exists
+BRACKETS = {
+    'mass': (0.01, 10_000),
+    'safety_factor': (0.1, 100),
+    'load_per_ton': (0.01, 100),
+    'tensile_strength': (1, 100_000),
+    'packing_efficiency': (0.01, 1),
+    'construction_efficiency': (0.01, 1),
+    'fiber_per_meter': (1, 10_000),
+    'reference_diameter': (1, 500),
+    'distance_km': (0.01, 100),
+    'rope_lifetime_km': (0.01, 100),
+}
+
+
+def forward(mass=INPUTS['mass'], safety_factor=INPUTS['safety_factor'],
+            load_per_ton=INPUTS['load_per_ton'],
+            tensile_strength=INPUTS['tensile_strength'],
+            packing_efficiency=INPUTS['packing_efficiency'],
+            construction_efficiency=INPUTS['construction_efficiency'],
+            fiber_per_meter=INPUTS['fiber_per_meter'],
+            reference_diameter=INPUTS['reference_diameter'],
+            distance_km=INPUTS['distance_km'],
+            rope_lifetime_km=INPUTS['rope_lifetime_km']):
+    """Every model output for the given inputs (all arguments broadcast)"""
+    load = rm.required_breaking_load(mass, safety_factor, load_per_ton)
+    diameter = rm.diameter_from_breaking_load(load, tensile_strength,
+                                              packing_efficiency,
+                                              construction_efficiency)
+    fiber = pm.fiber_mass(diameter, fiber_per_meter, reference_diameter)
+    labor = sum(pm.labor_by_stage(fiber, diameter).values())
+    return {'diameter': diameter, 'breaking_load': load, 'fiber_mass': fiber,
+            'person_days': labor,
+            'person_days_transport': pm.rope_sets(distance_km, rope_lifetime_km) * labor}
+
+
+# ============================================================================
+# CLOSED FORMS
+# ============================================================================
+
+def _capacity(diameter, p, tensile_strength=None):
+    """Breaking load (kN) of a rope of `diameter` under inputs `p`"""
+    return rm.breaking_load(diameter,
+                            p['tensile_strength'] if tensile_strength is None
+                            else tensile_strength,
+                            p['packing_efficiency'], p['construction_efficiency'])
+
+
+CLOSED_FORMS = {
+    ('diameter', 'mass'): lambda d, p: rm.mass_from_diameter(
+        d, p['safety_factor'], p['load_per_ton'], p['tensile_strength'],
+        p['packing_efficiency'], p['construction_efficiency']),
+    ('diameter', 'safety_factor'): lambda d, p: (
+        _capacity(d, p) / (p['mass'] * p['load_per_ton'])),
+    ('diameter', 'load_per_ton'): lambda d, p: (
+        _capacity(d, p) / (p['mass'] * p['safety_factor'])),
+    # Breaking load is linear in tensile strength
+    ('diameter', 'tensile_strength'): lambda d, p: (
+        rm.required_breaking_load(p['mass'], p['safety_factor'], p['load_per_ton'])
+        / _capacity(d, p, tensile_strength=1.0)),
+    ('breaking_load', 'mass'): lambda load, p: (
+        load / (p['safety_factor'] * p['load_per_ton'])),
+}
+
+
+# ============================================================================
+# BATCHED ROOT FINDING
+# ============================================================================
+
+def solve(func, targets, low, high, tol=1e-10, max_iter=200, ftol=1e-6):
+    """x with func(x) = target for every target, searching [low, high].
+
+    `func` must accept an array of x (same shape as `targets`). All targets
+    are refined together with the Illinois variant of false position; targets
+    that the interval does not bracket return NaN. So do targets that func
+    never reaches within `ftol` (relative to the target): a step output
+    (e.g. through rope_sets) converges onto the jump, where func changes sign
+    without a root.
+    """
+    targets = np.asarray(targets, dtype=float)
+    lo = np.broadcast_to(np.asarray(low, dtype=float), targets.shape).copy()
+    hi = np.broadcast_to(np.asarray(high, dtype=float), targets.shape).copy()
+    f_lo = func(lo) - targets
+    f_hi = func(hi) - targets
+    bracketed = np.sign(f_lo) * np.sign(f_hi) <= 0
+    # +1: the low end was kept last step, -1: the high end was kept
+    kept = np.zeros(targets.shape, dtype=int)
+
+    x = np.where(f_lo == 0, lo, hi)
+    for _ in range(max_iter):
+        step = f_hi - f_lo
+        x = np.where(step != 0, hi - f_hi * (hi - lo) / np.where(step != 0, step, 1),
+                     (lo + hi) / 2)
+        # Unbracketed targets stay at a valid input instead of wandering off
+        x = np.where(bracketed, np.clip(x, np.minimum(lo, hi), np.maximum(lo, hi)), lo)
+        fx = func(x) - targets
+        replace_hi = np.sign(fx) == np.sign(f_hi)
+        # Illinois: halve the function value at an end kept twice in a row
+        f_lo = np.where(replace_hi & (kept == 1), f_lo / 2, f_lo)
+        f_hi = np.where(~replace_hi & (kept == -1), f_hi / 2, f_hi)
+        hi = np.where(replace_hi, x, hi)
+        f_hi = np.where(replace_hi, fx, f_hi)
+        lo = np.where(replace_hi, lo, x)
+        f_lo = np.where(replace_hi, f_lo, fx)
+        kept = np.where(replace_hi, 1, -1)
+        done = (fx == 0) | (np.abs(hi - lo) <= tol * np.maximum(1, np.abs(x)))
+        if np.all(done | ~bracketed):
+            break
+    reached = np.abs(func(x) - targets) <= ftol * np.maximum(1, np.abs(targets))
+    return np.where(bracketed & reached, x, np.nan)
+
+
+def invert(output, targets, solve_for, bracket=None, **inputs):
+    """Value of input `solve_for` at which `output` equals each target.
+
+    `output` is one of OUTPUTS, `solve_for` one of INPUTS; other inputs take
+    their INPUTS defaults unless given as keyword arguments. Uses a closed
+    form where one exists, otherwise solve() over `bracket` (default
+    BRACKETS[solve_for]). Returns an array shaped like `targets` (NaN where
+    no solution lies in the bracket, or where the output jumps over the
+    target, as person_days_transport does against distance_km and
+    rope_lifetime_km: the number of rope sets is whole).
+    """
+    if output not in OUTPUTS:
+        raise ValueError(f"Unknown output '{output}' (choose from {OUTPUTS})")
+    if solve_for not in INPUTS:
+        raise ValueError(f"Unknown input '{solve_for}' (choose from {tuple(INPUTS)})")
+    params = dict(INPUTS)
+    params.update(inputs)
+    targets = np.asarray(targets, dtype=float)
+
+    if bracket is None and (output, solve_for) in CLOSED_FORMS:
+        return np.asarray(CLOSED_FORMS[output, solve_for](targets, params), dtype=float)
+
+    def func(x):
+        return forward(**dict(params, **{solve_for: x}))[output]
+
+    low, high = bracket or BRACKETS[solve_for]
+    return solve(func, targets, low, high)
+
+
+if __name__ == '__main__':
+    import time
+
+    te_tokanga = mc.mass('Te Tokanga')
+    grip_limits = np.array([40, 45, 50, 55, 60])
+    budgets = np.array([600, 800, 1000, 1200])
+
+    print("=" * 70)
+    print("INVERSE QUERIES")
+    print("=" * 70)
+    print("\nLargest moai mass for a rope diameter limit (SF=10):")
+    for limit, mass in zip(grip_limits, invert('diameter', grip_limits, 'mass')):
+        print(f"  {limit} mm: {mass:6.1f} t")
+
+    print("\nLargest safety factor keeping Paro's 6 km rope labor under a budget:")
+    factors = invert('person_days_transport', budgets, 'safety_factor')
+    for budget, sf in zip(budgets, factors):
+        print(f"  {budget:>5} person-days: SF = {sf:4.1f}")
+
+    print(f"\nTensile strength for Te Tokanga ({te_tokanga:.0f} t) at a rope limit:")
+    for limit, strength in zip(grip_limits, invert('diameter', grip_limits,
+                                                   'tensile_strength',
+                                                   mass=te_tokanga)):
+        print(f"  {limit} mm: {strength:6.0f} MPa")
+
+    targets = np.linspace(100, 2000, 100_000)
+    start = time.perf_counter()
+    invert('person_days_transport', targets, 'mass')
+    elapsed = time.perf_counter() - start
+    print("-" * 70)
+    print(f"100,000 root-finding targets (mass for person-days) in {elapsed:.3f} s")
+    print("=" * 70)
@@ -0,0 +1,100 @@
+"""
+Rope Mechanics: Shared Breaking-Load and Diameter Kernels
+
+This module holds the single implementation of the rope strength model used by
+every figure and verification script:
+
+    Breaking Load = Tensile Strength × π × (d/2)² × Packing Efficiency × Construction Efficiency
+
+All kernels are written with plain arithmetic, so they accept Python scalars
+(pure-Python evaluation, no NumPy import) or NumPy arrays. Array arguments
+broadcast against each other, which lets a single call evaluate every
+combination of mass, safety factor, tensile strength and efficiencies, e.g.
+
+    diameter_from_mass(masses[:, None, None], safety_factor=sf[None, :, None],
+                       tensile_strength=ts[None, None, :])
+
+Lists and tuples are converted to NumPy arrays on the way in.
+
+Units: diameter in mm, load in kN, mass in metric tons, strength in MPa.
+"""
+
+import math
+
+# ============================================================================
+# PAPER PARAMETERS
+# ============================================================================
+
+TENSILE_STRENGTH = 916  # MPa for T. cordifolia
+PACKING_EFFICIENCY = 0.65  # fiber packing efficiency (65%)
+CONSTRUCTION_EFFICIENCY = 0.75  # rope construction efficiency (75%)
+SAFETY_FACTOR = 10
+LOAD_PER_TON = 1.0  # kN working load per ton of moai mass (simplified estimate)
+
+
+def _asarray(value):
+    """Convert lists and tuples to NumPy arrays; pass scalars and arrays through"""
+    if isinstance(value, (list, tuple)):
+        import numpy as np
+        return np.asarray(value, dtype=float)
+    return value
+
+
+def effective_strength(tensile_strength=TENSILE_STRENGTH,
+                       packing_efficiency=PACKING_EFFICIENCY,
+                       construction_efficiency=CONSTRUCTION_EFFICIENCY):
+    """Strength of the rope cross-section after packing and construction losses (MPa)"""
+    return (_asarray(tensile_strength) * _asarray(packing_efficiency)
+            * _asarray(construction_efficiency))
+
+
+def breaking_load(diameter,
+                  tensile_strength=TENSILE_STRENGTH,
+                  packing_efficiency=PACKING_EFFICIENCY,
+                  construction_efficiency=CONSTRUCTION_EFFICIENCY):
+    """Breaking load (kN) of a rope of the given diameter (mm)"""
+    diameter = _asarray(diameter)
+    area = math.pi * (diameter / 2) ** 2  # mm^2
+    strength = effective_strength(tensile_strength, packing_efficiency,
+                                  construction_efficiency)
+    return strength * area / 1000  # N -> kN
+
+
+def required_breaking_load(mass, safety_factor=SAFETY_FACTOR,
+                           load_per_ton=LOAD_PER_TON):
+    """Breaking load (kN) required to move a moai of the given mass (tons)"""
+    working_load = _asarray(mass) * _asarray(load_per_ton)  # kN
+    return working_load * _asarray(safety_factor)
+
+
+def diameter_from_breaking_load(load,
+                                tensile_strength=TENSILE_STRENGTH,
+                                packing_efficiency=PACKING_EFFICIENCY,
+                                construction_efficiency=CONSTRUCTION_EFFICIENCY):
+    """Rope diameter (mm) needed to reach the given breaking load (kN)"""
+    strength = effective_strength(tensile_strength, packing_efficiency,
+                                  construction_efficiency)
+    return 2 * (_asarray(load) * 1000 / (strength * math.pi)) ** 0.5
+
+
+def diameter_from_mass(mass, safety_factor=SAFETY_FACTOR,
+                       load_per_ton=LOAD_PER_TON,
+                       tensile_strength=TENSILE_STRENGTH,
+                       packing_efficiency=PACKING_EFFICIENCY,
+                       construction_efficiency=CONSTRUCTION_EFFICIENCY):
+    """Rope diameter (mm) required to move a moai of the given mass (tons)"""
+    load = required_breaking_load(mass, safety_factor, load_per_ton)
+    return diameter_from_breaking_load(load, tensile_strength,
+                                       packing_efficiency,
+                                       construction_efficiency)
+
+
+def mass_from_diameter(diameter, safety_factor=SAFETY_FACTOR,
+                       load_per_ton=LOAD_PER_TON,
+                       tensile_strength=TENSILE_STRENGTH,
+                       packing_efficiency=PACKING_EFFICIENCY,
+                       construction_efficiency=CONSTRUCTION_EFFICIENCY):
+    """Largest moai mass (tons) a rope of the given diameter (mm) can move"""
+    load = breaking_load(diameter, tensile_strength, packing_efficiency,
+                         construction_efficiency)
+    return load / (_asarray(safety_factor) * _asarray(load_per_ton))
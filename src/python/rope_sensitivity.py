@@ -0,0 +1,220 @@
+"""
+Rope Sensitivity: Sobol Indices for the Rope and Production Models
+
+Which assumption drives the conclusions? This module computes first-order
+(S1) and total (ST) Sobol indices of
+
+    diameter     required rope diameter (mm)
+    fiber_mass   fiber per rope set (kg)
+    person_days  labor per rope set
+
+with respect to tensile strength, packing efficiency, construction
+efficiency, safety factor, the 1 kN/ton load rule and the 300 g/m @ 25 mm
+fiber scaling of Figure 13.
+
+Sampling follows Saltelli (2010): two quasi-random (Sobol sequence) matrices A
+and B, plus one matrix per factor with that column taken from B, for
+N × (k + 2) model evaluations. The model is evaluated as whole arrays (no
+loop over samples); the rows are split across worker processes, which return
+only running sums, so 10^6-evaluation studies finish in seconds:
+
+    python3 rope_sensitivity.py                  # Paro, 2^17 base samples
+    python3 rope_sensitivity.py --mass 260 -j 8
+
+Factor ranges are in FACTORS (distribution tuples as in rope_uncertainty).
+"""
+
+import argparse
+import concurrent.futures
+import os
+import time
+
+import numpy as np
+
+import moai_catalog as mc
+import production_model as pm
+import rope_mechanics as rm
+import rope_uncertainty as ru
+
+# ============================================================================
+# FACTORS AND OUTPUTS
+# ============================================================================
+
+FACTORS = {
+    'tensile_strength': ('triangular', 700, rm.TENSILE_STRENGTH, 1100),  # MPa
+    'packing_efficiency': ('uniform', 0.55, 0.75),
+    'construction_efficiency': ('uniform', 0.65, 0.85),
+    'safety_factor': ('uniform', 5, 15),
+    'load_per_ton': ('uniform', 0.8, 1.2),  # kN per ton
+    'fiber_per_meter': ('uniform', 200, 400),  # g/m of the reference rope
+    'reference_diameter': ('uniform', 20, 30),  # mm of the reference rope
+}
+
+OUTPUTS = ('diameter', 'fiber_mass', 'person_days')
+
+
+def evaluate(mass, tensile_strength, packing_efficiency, construction_efficiency,
+             safety_factor, load_per_ton, fiber_per_meter, reference_diameter):
+    """Model outputs for arrays of factor values (all arguments broadcast)"""
+    diameter = rm.diameter_from_mass(mass, safety_factor, load_per_ton,
+                                     tensile_strength, packing_efficiency,
+                                     construction_efficiency)
+    fiber = pm.fiber_mass(diameter, fiber_per_meter, reference_diameter)
+    labor = sum(pm.labor_by_stage(fiber, diameter).values())
+    return {'diameter': diameter, 'fiber_mass': fiber, 'person_days': labor}
+
+
+# ============================================================================
+# SOBOL SEQUENCE
+# ============================================================================
+
+BITS = 32
+
+# Joe & Kuo (2008) primitive polynomials (degree s, coefficients a) and
+# initial direction numbers m for dimensions 2, 3, ...
+JOE_KUO = [
+    (1, 0, (1,)), (2, 1, (1, 3)), (3, 1, (1, 3, 1)), (3, 2, (1, 1, 1)),
+    (4, 1, (1, 1, 3, 3)), (4, 4, (1, 3, 5, 13)), (5, 2, (1, 1, 5, 5, 17)),
+    (5, 4, (1, 1, 5, 5, 5)), (5, 7, (1, 1, 7, 11, 19)),
+    (5, 11, (1, 1, 5, 1, 1)), (5, 13, (1, 1, 1, 3, 11)),
+    (5, 14, (1, 3, 5, 5, 31)), (6, 1, (1, 3, 3, 9, 7, 49)),
+    (6, 13, (1, 1, 1, 15, 21, 21)), (6, 16, (1, 3, 1, 13, 27, 49)),
+]
+
+
+def _direction_numbers(dims):
+    """(dims, BITS) direction numbers as 32-bit integers"""
+    if dims > len(JOE_KUO) + 1:
+        raise ValueError(f"At most {len(JOE_KUO) + 1} Sobol dimensions supported")
+    directions = np.zeros((dims, BITS), dtype=np.uint64)
+    directions[0] = [1 << (BITS - 1 - j) for j in range(BITS)]
+    for d in range(1, dims):
+        s, a, m = JOE_KUO[d - 1]
+        m = list(m)
+        for i in range(s, BITS):
+            value = m[i - s] ^ (m[i - s] << s)
+            for k in range(1, s):
+                if (a >> (s - 1 - k)) & 1:
+                    value ^= m[i - k] << k
+            m.append(value)
+        directions[d] = [m[j] << (BITS - 1 - j) for j in range(BITS)]
+    return directions
+
+
+def sobol_points(n, dims, start=0, seed=0):
+    """Points start..start+n-1 of a digitally shifted Sobol sequence in [0, 1)^dims"""
+    directions = _direction_numbers(dims)
+    index = np.arange(start, start + n, dtype=np.uint64)
+    gray = index ^ (index >> np.uint64(1))
+    points = np.zeros((n, dims), dtype=np.uint64)
+    for j in range(BITS):
+        bit = ((gray >> np.uint64(j)) & np.uint64(1)).astype(bool)
+        points[bit] ^= directions[:, j]
+    # Random digital shift (same for every point) keeps the net structure
+    shift = np.random.default_rng(seed).integers(0, 1 << BITS, dims, dtype=np.uint64)
+    return ((points ^ shift).astype(float) + 0.5) / 2.0**BITS
+
+
+# ============================================================================
+# SALTELLI ESTIMATORS
+# ============================================================================
+
+def _partial_sums(mass, factors, start, n, seed):
+    """Additive sums for the Sobol estimators over base rows start..start+n-1"""
+    names = list(factors)
+    k = len(names)
+    unit = sobol_points(n, 2 * k, start, seed)
+    a = {name: ru.quantile(factors[name], unit[:, i]) for i, name in enumerate(names)}
+    b = {name: ru.quantile(factors[name], unit[:, k + i]) for i, name in enumerate(names)}
+
+    # Stack A, B and every A_B(i) so the model runs once on (k + 2) × n rows
+    stacked = {name: np.concatenate([a[name], b[name]]
+                                    + [b[name] if name == other else a[name]
+                                       for other in names])
+               for name in names}
+    results = evaluate(mass, **stacked)
+
+    sums = {}
+    for output in OUTPUTS:
+        values = results[output].reshape(k + 2, n)
+        f_a, f_b, f_ab = values[0], values[1], values[2:]
+        both = values[:2]
+        sums[output] = {
+            'count': 2 * n,
+            'sum': both.sum(),
+            'sum_sq': (both ** 2).sum(),
+            # Saltelli (2010) first order, Jansen (1999) total effect
+            'first': (f_b * (f_ab - f_a)).sum(axis=1),
+            'total': ((f_a - f_ab) ** 2).sum(axis=1),
+        }
+    return sums
+
+
+def sobol_indices(mass, n_base=2**17, factors=None, jobs=None, seed=0,
+                  chunk_rows=2**14):
+    """First-order and total Sobol indices of every output at `mass` (tons).
+
+    Uses n_base × (k + 2) model evaluations for k factors, split into chunks
+    of `chunk_rows` base rows evaluated on `jobs` processes (default: all
+    cores). Returns {output: {'first': {factor: S1}, 'total': {factor: ST}}}.
+    """
+    factors = dict(FACTORS if factors is None else factors)
+    names = list(factors)
+    jobs = jobs or os.cpu_count() or 1
+    starts = range(0, n_base, chunk_rows)
+    args = [(mass, factors, start, min(chunk_rows, n_base - start), seed)
+            for start in starts]
+
+    if jobs == 1:
+        parts = [_partial_sums(*arg) for arg in args]
+    else:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as pool:
+            parts = list(pool.map(_partial_sums, *zip(*args)))
+
+    indices = {}
+    for output in OUTPUTS:
+        total = {key: sum(part[output][key] for part in parts)
+                 for key in parts[0][output]}
+        mean = total['sum'] / total['count']
+        variance = total['sum_sq'] / total['count'] - mean ** 2
+        first = total['first'] / n_base / variance
+        effect = total['total'] / (2 * n_base) / variance
+        indices[output] = {'first': dict(zip(names, first)),
+                           'total': dict(zip(names, effect))}
+    return indices
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--mass', type=float, default=mc.mass('Paro'),
+                        help='moai mass in tons (default: Paro)')
+    parser.add_argument('-n', '--samples', type=int, default=2**17,
+                        help='base samples N; evaluations = N × (factors + 2)')
+    parser.add_argument('-j', '--jobs', type=int, default=None,
+                        help='worker processes (default: all cores)')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    indices = sobol_indices(args.mass, args.samples, jobs=args.jobs, seed=args.seed)
+    elapsed = time.perf_counter() - start
+    evaluations = args.samples * (len(FACTORS) + 2)
+
+    print("=" * 78)
+    print(f"SOBOL SENSITIVITY INDICES ({args.mass:g} t moai)")
+    print("=" * 78)
+    header = f"{'Factor':<26}" + "".join(f"{output:>17}" for output in OUTPUTS)
+    print(header)
+    print(f"{'':<26}" + f"{'S1':>9}{'ST':>8}" * len(OUTPUTS))
+    print("-" * 78)
+    for name in FACTORS:
+        print(f"{name:<26}" + "".join(
+            f"{indices[output]['first'][name]:>9.3f}"
+            f"{indices[output]['total'][name]:>8.3f}" for output in OUTPUTS))
+    print("-" * 78)
+    print(f"{evaluations:,} model evaluations in {elapsed:.2f} s")
+    print("=" * 78)
+
+
+if __name__ == '__main__':
+    main()
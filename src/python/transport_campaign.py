@@ -0,0 +1,191 @@
+"""
+Transport Campaign: Rope Production for the Whole Moai Corpus
+
+rope_production_section.md weighs a single Paro transport against the
+community's ~700 person-days of daily labor. This module evaluates the whole
+corpus instead: for every statue (mass, transport distance) it computes rope
+sets, fiber, person-days and production calendar time, then rolls the rope
+labor up over the statue-moving era against the labor budget of the
+population.
+
+Everything is vectorized over scenarios × statues, so sweeping population,
+rope lifetime or safety factor over thousands of scenarios takes well under a
+second per thousand scenarios (scenarios are processed in fixed-size chunks to
+bound memory):
+
+    result = simulate_campaigns(masses, distances,
+                                population=np.linspace(2000, 6000, 5000),
+                                rope_lifetime_km=1.5)
+    result['peak_share']   # busiest year's rope labor / annual capacity
+
+Statues are transported in catalog order, evenly spaced over `era_years`,
+unless explicit `transport_days` are given. Rope labor is charged to the year
+the statue is moved.
+"""
+
+import numpy as np
+
+import moai_catalog as mc
+import production_model as pm
+import rope_mechanics as rm
+# Community labor and per-statue requirements (closed form, NumPy-free)
+from production_kernels import (POPULATION, WORKING_FRACTION, daily_capacity,
+                                statue_requirements)
+
+# ============================================================================
+# CAMPAIGN PARAMETERS
+# ============================================================================
+
+ERA_YEARS = 500  # statue-moving period (~1200-1700 CE)
+DAYS_PER_YEAR = 365
+
+CORPUS_SIZE = 1000  # ~1,000 moai known
+CORPUS_MEDIAN_MASS = 12.5  # tons
+CORPUS_DISTANCE_RANGE = (1, 18)  # km from Rano Raraku
+
+# Per-statue requirements returned with per_statue=True
+STATUE_OUTPUTS = ('rope_sets', 'fiber_mass', 'person_days', 'production_days')
+
+
+def synthetic_corpus(n_statues=CORPUS_SIZE, seed=0):
+    """Placeholder corpus: lognormal masses around 12.5 t (4.3-82 t) and
+    lognormal transport distances around 6 km (1-18 km)"""
+    rng = np.random.default_rng(seed)
+    masses = np.clip(rng.lognormal(np.log(CORPUS_MEDIAN_MASS), 0.6, n_statues),
+                     4.3, 82)
+    distances = np.clip(rng.lognormal(np.log(6), 0.6, n_statues),
+                        *CORPUS_DISTANCE_RANGE)
+    return masses, distances
+
+
+# ============================================================================
+# CAMPAIGN ROLL-UP
+# ============================================================================
+
+def simulate_campaigns(masses, distances, population=POPULATION,
+                       rope_lifetime_km=pm.ROPE_LIFETIME_KM,
+                       safety_factor=rm.SAFETY_FACTOR,
+                       working_fraction=WORKING_FRACTION,
+                       era_years=ERA_YEARS, transport_days=None,
+                       yearly=False, per_statue=False, chunk_elements=4_000_000):
+    """Roll up rope production for every statue over the transport era.
+
+    `masses` and `distances` describe the corpus (one entry per statue).
+    `population`, `rope_lifetime_km`, `safety_factor`, `working_fraction` and
+    `era_years` are scalars or arrays with one value per scenario.
+    `transport_days` optionally gives the day each statue is moved (same for
+    all scenarios); by default statues are spread evenly over the era.
+
+    Returns a dict of per-scenario arrays
+        rope_sets, fiber_mass, person_days   corpus totals
+        labor_limited_days   days of rope work if the whole workforce did it
+        mean_share           rope labor / labor capacity over the era
+        peak_share           busiest year's rope labor / annual capacity
+        yearly_share         (n_scenarios, n_years), only with yearly=True
+    and, with per_statue=True, (n_scenarios, n_statues) arrays of each
+    statue's requirements
+        statue_rope_sets, statue_fiber_mass, statue_person_days,
+        statue_production_days
+    """
+    masses = np.asarray(masses, dtype=float)
+    distances = np.asarray(distances, dtype=float)
+    n_statues = len(masses)
+    scenario = np.broadcast_arrays(*[np.atleast_1d(np.asarray(value, dtype=float))
+                                     for value in (population, rope_lifetime_km,
+                                                   safety_factor, working_fraction,
+                                                   era_years)])
+    population, lifetime, sf, fraction, era = scenario
+    n_scenarios = len(population)
+
+    n_years = int(np.ceil(era.max()))
+    if transport_days is None:
+        # Fraction of the era elapsed when each statue is moved
+        order = (np.arange(n_statues) + 0.5) / n_statues
+    else:
+        transport_days = np.asarray(transport_days, dtype=float)
+        n_years = max(n_years, int(transport_days.max() // DAYS_PER_YEAR) + 1)
+
+    totals = {name: np.empty(n_scenarios) for name in
+              ('rope_sets', 'fiber_mass', 'person_days', 'peak_share')}
+    yearly_share = np.empty((n_scenarios, n_years)) if yearly else None
+    statues = {name: np.empty((n_scenarios, n_statues)) for name in STATUE_OUTPUTS} \
+        if per_statue else {}
+    annual_capacity = daily_capacity(population, fraction) * DAYS_PER_YEAR
+
+    chunk = max(1, chunk_elements // max(n_statues, 1))
+    for begin in range(0, n_scenarios, chunk):
+        rows = slice(begin, min(begin + chunk, n_scenarios))
+        n_rows = rows.stop - rows.start
+        needs = statue_requirements(masses[None, :], distances[None, :],
+                                    lifetime[rows, None], sf[rows, None])
+        for name in ('rope_sets', 'fiber_mass', 'person_days'):
+            totals[name][rows] = needs[name].sum(axis=1)
+        for name, array in statues.items():
+            array[rows] = needs[name]
+
+        if transport_days is None:
+            year = (order[None, :] * era[rows, None]).astype(np.intp)
+        else:
+            year = np.broadcast_to(
+                (transport_days // DAYS_PER_YEAR).astype(np.intp), (n_rows, n_statues))
+        # One bincount for the whole chunk: offset each scenario's years
+        flat = (year + np.arange(n_rows)[:, None] * n_years).ravel()
+        labor = np.bincount(flat, weights=needs['person_days'].ravel(),
+                            minlength=n_rows * n_years).reshape(n_rows, n_years)
+        share = labor / annual_capacity[rows, None]
+        totals['peak_share'][rows] = share.max(axis=1)
+        if yearly:
+            yearly_share[rows] = share
+
+    result = dict(totals)
+    result['labor_limited_days'] = (totals['person_days']
+                                    / daily_capacity(population, fraction))
+    result['mean_share'] = totals['person_days'] / (annual_capacity * era)
+    if yearly:
+        result['yearly_share'] = yearly_share
+    for name, array in statues.items():
+        result[f'statue_{name}'] = array
+    return result
+
+
+if __name__ == '__main__':
+    import time
+
+    import rope_uncertainty as ru
+
+    masses, distances = synthetic_corpus()
+    paro = mc.lookup('Paro')
+    paro_needs = statue_requirements(paro['mass'], paro['distance'])
+
+    n_scenarios = 10_000
+    rng = np.random.default_rng(1)
+    population = ru.sample(('uniform', 2000, 5000), n_scenarios, rng)
+    lifetime = ru.sample(('uniform', 0.5, 3.0), n_scenarios, rng)
+
+    start = time.perf_counter()
+    result = simulate_campaigns(masses, distances, population, lifetime)
+    elapsed = time.perf_counter() - start
+
+    print("=" * 70)
+    print(f"ISLAND-WIDE ROPE PRODUCTION ({len(masses)} moai, "
+          f"{ERA_YEARS}-year era)")
+    print("=" * 70)
+    print(f"Paro ({paro['mass']:.0f}t, {paro['distance']:.0f} km): "
+          f"{paro_needs['rope_sets']:.0f} sets, "
+          f"{paro_needs['person_days']:,.0f} person-days, "
+          f"{paro_needs['production_days']:.0f} production days")
+    print(f"\n{'Scenario output':<34} {'P5':>10} {'P50':>10} {'P95':>10}")
+    print("-" * 70)
+    for name, label, scale in [
+            ('rope_sets', 'Rope sets (corpus)', 1),
+            ('fiber_mass', 'Fiber (t)', 1e-3),
+            ('person_days', 'Rope labor (1000 person-days)', 1e-3),
+            ('labor_limited_days', 'Whole-workforce days', 1),
+            ('mean_share', 'Mean share of labor (%)', 100),
+            ('peak_share', 'Peak-year share of labor (%)', 100)]:
+        p5, p50, p95 = np.percentile(result[name] * scale, [5, 50, 95])
+        print(f"{label:<34} {p5:>10.2f} {p50:>10.2f} {p95:>10.2f}")
+    print("-" * 70)
+    print(f"{n_scenarios:,} scenarios in {elapsed:.2f} s "
+          f"({n_scenarios / elapsed:,.0f} scenarios/s)")
+    print("=" * 70)
@@ -3,12 +3,12 @@ Verification Script: Rope Diameter Calculations
 Confirms all moai rope diameter requirements are calculated correctly
 """
 
-import numpy as np
+import rope_mechanics as rm
 
-# Parameters
-tensile_strength = 916  # MPa for T. cordifolia
-efficiency = 0.75  # rope construction efficiency
-safety_factor = 10
+# Parameters (packing efficiency not applied in this check)
+tensile_strength = rm.TENSILE_STRENGTH  # MPa for T. cordifolia
+efficiency = rm.CONSTRUCTION_EFFICIENCY  # rope construction efficiency
+safety_factor = rm.SAFETY_FACTOR
 
 # Moai data
 moai_data = [
@@ -39,10 +39,8 @@ limit_impossible = 70   # mm
 
 for name, mass in moai_data:
     # Calculate rope diameter
-    working_load = mass * 1.0  # kN
-    required_breaking_load = working_load * safety_factor  # kN
-    diameter = 2 * np.sqrt(required_breaking_load * 1000 /
-                          (tensile_strength * efficiency * np.pi))
+    diameter = rm.diameter_from_mass(mass, safety_factor=safety_factor,
+                                     packing_efficiency=1.0)
 
     # Determine status
     if diameter < limit_comfortable:
@@ -92,16 +90,13 @@ print("-" * 80)
 
 # Check 45 mm rope breaking load
 diameter_45 = 45
-area_45 = np.pi * (diameter_45/2)**2
-breaking_load_45 = tensile_strength * area_45 * efficiency / 1000
+breaking_load_45 = rm.breaking_load(diameter_45, packing_efficiency=1.0)
 print(f"45 mm rope breaking load: {breaking_load_45:.0f} kN (caption should say 1,093 kN, NOT 650 kN)")
 
 # Check Paro requirement
 paro_mass = 86
-working_load_paro = paro_mass * 1.0
-required_breaking_load_paro = working_load_paro * safety_factor
-diameter_paro = 2 * np.sqrt(required_breaking_load_paro * 1000 /
-                            (tensile_strength * efficiency * np.pi))
+diameter_paro = rm.diameter_from_mass(paro_mass, safety_factor=safety_factor,
+                                      packing_efficiency=1.0)
 print(f"Paro rope requirement: {diameter_paro:.1f} mm (caption should say 40 mm, NOT 57 mm)")
 
 print("=" * 80)
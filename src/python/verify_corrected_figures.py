@@ -2,25 +2,18 @@
 Verify that the corrected figures 10 and 11 now calculate rope diameters correctly
 """
 
-import numpy as np
+import rope_mechanics as rm
 
 print("=" * 70)
 print("VERIFICATION OF CORRECTED FIGURES 10 AND 11")
 print("=" * 70)
 
 # Paper specifications
-tensile_strength = 916  # MPa
-packing_efficiency = 0.65  # 65% fiber packing efficiency
-construction_efficiency = 0.75  # 75% construction efficiency
-safety_factor = 10
+safety_factor = rm.SAFETY_FACTOR
 
 def calc_rope_diameter(mass_tons):
     """Calculate required rope diameter for given moai mass"""
-    working_load = mass_tons * 1.0  # kN
-    required_breaking_load = working_load * safety_factor
-    diameter = 2 * np.sqrt(required_breaking_load * 1000 /
-                           (tensile_strength * packing_efficiency * construction_efficiency * np.pi))
-    return diameter
+    return rm.diameter_from_mass(mass_tons, safety_factor=safety_factor)
 
 # ============================================================================
 # FIGURE 10 VERIFICATION